@@ -0,0 +1,81 @@
+"""Reproducible benchmark documents, built from the texts of the test suite.
+
+Every document is a deterministic function of its language and size, so that
+timings taken on different commits measure the same work.
+"""
+
+from __future__ import annotations
+
+import re
+
+from tests.backend import resources
+
+LANGS = ("en", "es", "de", "ar", "hu")
+SIZES = ("short", "long")
+# Characters in a long document
+LONG_CHARS = 20_000
+
+SOURCES = {
+    "en": ("LONG_TEXT", "EASY_TEXT"),
+    "es": ("LONG_SPANISH_TEXT", "EASY_SPANISH_TEXT"),
+    "de": ("GERMAN_SAMPLE_B", "GERMAN_SAMPLE_A"),
+    "ar": ("HARD_ARABIC_TEXT", "EASY_ARABIC_TEXT"),
+    "hu": (
+        "HARD_HUNGARIAN_TEXT",
+        "HARD_ACADEMIC_HUNGARIAN_TEXT",
+        "EASY_HUNGARIAN_TEXT",
+        "EASY_HUNGARIAN_TEXT2",
+    ),
+}
+
+RE_SENTENCE_END = re.compile(r"(?<=[.!?])\s+")
+
+
+def sources(lang: str) -> list[str]:
+    """The test texts of a language, whitespace normalised."""
+    return [" ".join(getattr(resources, name).split()) for name in SOURCES[lang]]
+
+
+def sentences(lang: str) -> list[str]:
+    """The sentences of the test texts of a language."""
+    return [
+        sentence
+        for text in sources(lang)
+        for sentence in RE_SENTENCE_END.split(text)
+        if sentence
+    ]
+
+
+def document(lang: str, size: str) -> str:
+    """Get the benchmark document of a language and size.
+
+    A short document is the first test text of the language (a paragraph); a
+    long document is made of paragraphs of the test sentences, every paragraph
+    a different rotation of them, up to `LONG_CHARS` characters.
+    """
+    if size == "short":
+        return sources(lang)[0]
+    if size != "long":
+        raise ValueError(f"Unknown size {size}, use one of {SIZES}")
+
+    units = sentences(lang)
+    paragraphs: list[str] = []
+    length = 0
+    shift = 0
+    while length < LONG_CHARS:
+        rotated = units[shift % len(units):] + units[:shift % len(units)]
+        paragraph = " ".join(rotated)
+        paragraphs.append(paragraph)
+        length += len(paragraph) + 2
+        shift += 1
+    return "\n\n".join(paragraphs)
+
+
+def batch(n_docs: int, lang: str = "en") -> list[str]:
+    """Get `n_docs` distinct documents of three sentences each."""
+    units = sentences(lang)
+    n = len(units)
+    return [
+        " ".join((units[i % n], units[i // n % n], units[i // n // n % n]))
+        for i in range(n_docs)
+    ]
@@ -0,0 +1,51 @@
+"""Compare the "fast" sentence engine with NLTK Punkt on the test corpus.
+
+Run from the repository root with ``python -m benchmarks.sentence_engines``.
+Agreement is the share of texts for which both engines find the same
+sentences; throughput is measured on the whole corpus, uncached.
+"""
+
+from __future__ import annotations
+
+import timeit
+
+from nltk.tokenize import sent_tokenize
+
+from textstat.backend import selections
+from tests.backend import resources
+
+
+def corpus() -> list[str]:
+    return [
+        value
+        for name, value in vars(resources).items()
+        if name.isupper() and isinstance(value, str) and value.strip()
+    ]
+
+
+def punkt(text: str) -> list[str]:
+    return [s.strip() for s in sent_tokenize(text) if s.strip()]
+
+
+def main(repeat: int = 20) -> None:
+    texts = corpus()
+    agree = sum(punkt(text) == selections.split_sentences(text) for text in texts)
+    n_chars = sum(len(text) for text in texts)
+    print(f"{len(texts)} texts, {n_chars} characters")
+    print(f"agreement with punkt: {agree}/{len(texts)}")
+
+    times = {}
+    for name, split in [("punkt", punkt), ("fast", selections.split_sentences)]:
+        seconds = min(
+            timeit.repeat(
+                lambda: [split(text) for text in texts], number=1, repeat=repeat
+            )
+        )
+        times[name] = seconds
+        mb_per_s = n_chars / seconds / 1e6
+        print(f"{name:>6}: {seconds * 1000:8.2f} ms, {mb_per_s:6.2f} MB/s")
+    print(f"speedup: {times['punkt'] / times['fast']:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,369 @@
+"""Time the metrics, counts and batch APIs of textstat and track regressions.
+
+Run from the repository root::
+
+    python -m benchmarks.suite run                      # print the timings
+    python -m benchmarks.suite run -o results.json      # and save them
+    python -m benchmarks.suite compare results.json     # against the baseline
+    python -m benchmarks.suite run --compare            # both at once
+
+Every metric of `textstat.backend.metrics` is timed on a short and a long
+English document, with a cold cache (`cache_clear()` and the syllable tables
+of `get_syllable_table` emptied before every call, the loaded word lists and
+dictionaries kept) and a warm cache (the result already cached). The counts
+and a few metrics are timed on short and long documents of every language in
+`benchmarks.corpora.LANGS`, and `analyze`, `score_many`, `parallel.score` and
+`stream.score` on batches and long documents.
+
+`benchmarks/baseline.json` holds the timings of the commit recorded in its
+"machine" entry, the commit before the suite was added, taken with this
+directory copied into its checkout and ``python -m benchmarks.suite run -o
+benchmarks/baseline.json``. Timings only compare on the same machine: run the
+baseline again on yours the same way before comparing.
+"""
+
+from __future__ import annotations
+
+import argparse
+import inspect
+import json
+import os
+import platform
+import re
+import statistics
+import subprocess
+import sys
+import time
+from typing import Any, Callable, NamedTuple, Sequence
+
+import textstat
+from textstat import parallel, stream
+from textstat.backend import analysis, counts, metrics, selections, utils
+
+from . import corpora
+
+BASELINE = os.path.join(os.path.dirname(__file__), "baseline.json")
+LANG_CODES = {"en": "en_US", "es": "es_ES", "de": "de_DE", "ar": "ar", "hu": "hu_HU"}
+# The arguments of the metrics that have no default
+ARGUMENTS = {
+    "ignore_spaces": True,
+    "ms_per_char": 14.69,
+    "strict_lower": False,
+    "strict_upper": True,
+    "variant": 1,
+}
+COUNTS = ("count_sentences", "count_words", "count_syllables")
+# Functions timed in every language; Arabic has no hyphenation dictionary
+LANG_FUNCTIONS = (
+    "count_sentences",
+    "count_words",
+    "count_syllables",
+    "flesch_reading_ease",
+    "text_standard",
+)
+ARABIC_FUNCTIONS = ("count_sentences", "count_words", "count_arabic_syllables", "osman")
+BATCH_METRICS = ["flesch_reading_ease", "smog_index", "text_standard"]
+BATCH_DOCS = 500
+THRESHOLD = 1.2
+
+
+class Benchmark(NamedTuple):
+    """A timed function, called without arguments."""
+
+    name: str
+    func: Callable[[], Any]
+    cold: bool
+
+
+def benchmarks() -> list[Benchmark]:
+    """Get all benchmarks, in the order they are run."""
+    suite: list[Benchmark] = []
+    names = [
+        name for name in metrics.__all__ if not name.startswith("consensus_")
+    ] + list(COUNTS)
+    for name in names:
+        for size in corpora.SIZES:
+            for cold in (True, False):
+                suite.append(_function_benchmark(name, "en", size, cold))
+
+    for lang in corpora.LANGS:
+        if lang == "en":
+            continue
+        functions = ARABIC_FUNCTIONS if lang == "ar" else LANG_FUNCTIONS
+        for name in functions:
+            for size in corpora.SIZES:
+                suite.append(_function_benchmark(name, lang, size, True))
+
+    for lang in corpora.LANGS:
+        if lang == "ar":
+            continue
+        text = corpora.document(lang, "long")
+        code = LANG_CODES[lang]
+        suite.append(
+            Benchmark(
+                f"analyze[{lang},long,cold]",
+                lambda text=text, code=code: analysis.analyze(text, code),
+                True,
+            )
+        )
+
+    texts = corpora.batch(BATCH_DOCS)
+    long_text = corpora.document("en", "long")
+    suite.append(
+        Benchmark(
+            f"score_many[en,{BATCH_DOCS} docs,cold]",
+            lambda: analysis.score_many(texts, BATCH_METRICS, "en_US"),
+            True,
+        )
+    )
+    suite.append(
+        Benchmark(
+            f"parallel.score[en,{BATCH_DOCS} docs,2 workers]",
+            lambda: parallel.score(texts, BATCH_METRICS, "en_US", workers=2),
+            True,
+        )
+    )
+    suite.append(
+        Benchmark(
+            "stream.score[en,long,cold]",
+            lambda: stream.score(iter([long_text]), BATCH_METRICS, "en_US"),
+            True,
+        )
+    )
+    return suite
+
+
+def _function_benchmark(name: str, lang: str, size: str, cold: bool) -> Benchmark:
+    func = getattr(metrics, name, None) or getattr(counts, name)
+    kwargs = {
+        parameter: LANG_CODES[lang] if parameter == "lang" else ARGUMENTS[parameter]
+        for parameter in inspect.signature(func).parameters
+        if parameter == "lang" or parameter in ARGUMENTS
+    }
+    text = corpora.document(lang, size)
+    cache = "cold" if cold else "warm"
+    return Benchmark(
+        f"{name}[{lang},{size},{cache}]", lambda: func(text, **kwargs), cold
+    )
+
+
+def measure(
+    benchmark: Benchmark, repeat: int = 5, min_time: float = 0.05
+) -> dict[str, float]:
+    """Time a benchmark.
+
+    The function is called `number` times per round, enough for a round to
+    last at least `min_time` seconds, in `repeat` rounds. A cold benchmark
+    clears the caches and the syllable tables before every call, outside of
+    the timing.
+
+    Parameters
+    ----------
+    benchmark : Benchmark
+        The benchmark.
+    repeat : int, optional
+        The number of rounds. The default is 5.
+    min_time : float, optional
+        The minimum duration of a round in seconds. The default is 0.05.
+
+    Returns
+    -------
+    dict[str, float]
+        The best and median time of a call in seconds ("min" and "median"),
+        and the number of calls per round ("number").
+    """
+    _clear_caches()
+    # Load the resources and, for a warm benchmark, cache the result
+    benchmark.func()
+
+    def run(number: int) -> float:
+        elapsed = 0.0
+        for _ in range(number):
+            if benchmark.cold:
+                _clear_caches()
+            start = time.perf_counter()
+            benchmark.func()
+            elapsed += time.perf_counter() - start
+        return elapsed
+
+    number = 1
+    while True:
+        elapsed = run(number)
+        if elapsed >= min_time:
+            break
+        number = max(number * 2, int(number * min_time / max(elapsed, 1e-9)) + 1)
+    times = [elapsed / number] + [run(number) / number for _ in range(repeat - 1)]
+    return {
+        "min": min(times),
+        "median": statistics.median(times),
+        "number": number,
+    }
+
+
+def _clear_caches() -> None:
+    utils.cache_clear()
+    # The syllable tables are resources, kept by `cache_clear`, but are filled
+    # with the words counted
+    for code in LANG_CODES.values():
+        utils.get_syllable_table(code).clear()
+
+
+def run(
+    pattern: str | None = None, repeat: int = 5, min_time: float = 0.05
+) -> dict[str, Any]:
+    """Run the benchmarks whose name matches `pattern` and print the timings.
+
+    Returns
+    -------
+    dict[str, Any]
+        The machine ("machine") and the timings of every benchmark
+        ("results"), as saved by `python -m benchmarks.suite run -o`.
+    """
+    results: dict[str, dict[str, float]] = {}
+    for benchmark in benchmarks():
+        if pattern is not None and not re.search(pattern, benchmark.name):
+            continue
+        results[benchmark.name] = timing = measure(benchmark, repeat, min_time)
+        print(
+            f"{benchmark.name:<55} {_format(timing['min']):>10} "
+            f"(median {_format(timing['median'])})",
+            flush=True,
+        )
+    return {"machine": machine(), "results": results}
+
+
+def machine() -> dict[str, str]:
+    """Describe the machine and the code being timed."""
+    try:
+        commit = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            capture_output=True,
+            text=True,
+            cwd=os.path.dirname(__file__),
+        ).stdout.strip()
+    except OSError:
+        commit = ""
+    return {
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "processor": platform.machine(),
+        "textstat": ".".join(map(str, textstat.__version__)),
+        "commit": commit,
+        "sentence_engine": selections.get_sentence_engine(),
+    }
+
+
+def compare(
+    baseline: dict[str, Any], current: dict[str, Any], threshold: float = THRESHOLD
+) -> list[str]:
+    """Compare two runs and print the ratio of their best times.
+
+    Parameters
+    ----------
+    baseline : dict[str, Any]
+        The reference run, as returned by `run`.
+    current : dict[str, Any]
+        The run to check.
+    threshold : float, optional
+        The ratio of times above which a benchmark is a regression. The
+        default is 1.2.
+
+    Returns
+    -------
+    list[str]
+        The names of the regressed benchmarks.
+    """
+    regressions = []
+    for name, timing in current["results"].items():
+        base = baseline["results"].get(name)
+        if base is None:
+            print(f"{name:<55} {'':>10} {_format(timing['min']):>10}  (new)")
+            continue
+        ratio = timing["min"] / base["min"]
+        if ratio > threshold:
+            mark = "slower"
+            regressions.append(name)
+        elif ratio < 1 / threshold:
+            mark = "faster"
+        else:
+            mark = ""
+        print(
+            f"{name:<55} {_format(base['min']):>10} {_format(timing['min']):>10}"
+            f" {ratio:6.2f}x {mark}"
+        )
+    if baseline.get("machine", {}).get("platform") != current.get(
+        "machine", {}
+    ).get("platform"):
+        print("warning: the runs were taken on different platforms")
+    print(
+        f"{len(regressions)} of {len(current['results'])} benchmarks are more "
+        f"than {threshold}x slower"
+    )
+    return regressions
+
+
+def _format(seconds: float) -> str:
+    for unit, scale in (("s", 1.0), ("ms", 1e-3), ("us", 1e-6)):
+        if seconds >= scale:
+            return f"{seconds / scale:.2f} {unit}"
+    return f"{seconds * 1e9:.0f} ns"
+
+
+def _load(path: str) -> dict[str, Any]:
+    with open(path, encoding="utf-8") as f:
+        return json.load(f)
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(
+        prog="python -m benchmarks.suite", description=__doc__.splitlines()[0]
+    )
+    commands = parser.add_subparsers(dest="command", required=True)
+    run_parser = commands.add_parser("run", help="run the benchmarks")
+    run_parser.add_argument(
+        "-k", "--pattern", help="only run the benchmarks matching this regex"
+    )
+    run_parser.add_argument(
+        "--repeat", type=int, default=5, help="rounds per benchmark (5)"
+    )
+    run_parser.add_argument(
+        "--min-time", type=float, default=0.05, help="seconds per round (0.05)"
+    )
+    run_parser.add_argument("-o", "--output", help="save the timings as JSON")
+    run_parser.add_argument(
+        "--compare",
+        nargs="?",
+        const=BASELINE,
+        help="compare with a saved run (default: the baseline)",
+    )
+    compare_parser = commands.add_parser("compare", help="compare two saved runs")
+    compare_parser.add_argument("current", help="the run to check")
+    compare_parser.add_argument(
+        "--baseline", default=BASELINE, help="the reference run (the baseline)"
+    )
+    for command_parser in (run_parser, compare_parser):
+        command_parser.add_argument(
+            "--threshold",
+            type=float,
+            default=THRESHOLD,
+            help=f"slowdown reported as a regression ({THRESHOLD})",
+        )
+    args = parser.parse_args(argv)
+
+    if args.command == "run":
+        current = run(args.pattern, args.repeat, args.min_time)
+        if args.output:
+            with open(args.output, "w", encoding="utf-8") as f:
+                json.dump(current, f, indent=2, sort_keys=True)
+                f.write("\n")
+        if not args.compare:
+            return 0
+        baseline_path = args.compare
+    else:
+        current = _load(args.current)
+        baseline_path = args.baseline
+    return 1 if compare(_load(baseline_path), current, args.threshold) else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -14,6 +14,7 @@ setup(
     package_data={"": ["easy_word_list"]},
     include_package_data=True,
     install_requires=["pyphen", "nltk", "setuptools"],
+    entry_points={"console_scripts": ["textstat = textstat.cli:main"]},
     license="MIT",
     python_requires=">=3.6",
     classifiers=(
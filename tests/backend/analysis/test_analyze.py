@@ -0,0 +1,146 @@
+from __future__ import annotations
+
+import pytest
+
+from textstat.backend import analysis, counts, metrics
+from .. import resources
+
+
+TEXTS = [
+    pytest.param(resources.EMPTY_STR, "en_US", id="empty"),
+    pytest.param(resources.SHORT_TEXT, "en_US", id="short"),
+    pytest.param(resources.PUNCT_TEXT, "en_US", id="punct"),
+    pytest.param(resources.LONG_TEXT, "en_US", id="long"),
+    pytest.param(resources.EASY_TEXT, "en_US", id="easy"),
+    pytest.param(resources.LONG_SPANISH_TEXT, "es_ES", id="spanish"),
+    pytest.param(resources.ITALIAN_TEXT, "it_IT", id="italian"),
+    pytest.param(resources.GERMAN_SAMPLE_A, "de_DE", id="german"),
+    pytest.param(resources.HARD_HUNGARIAN_TEXT, "hu_HU", id="hungarian"),
+    pytest.param(
+        "'Hello,' she said—it's 'done'. A well-known e-mail — sent.",
+        "en_US",
+        id="dashes",
+    ),
+    pytest.param(resources.HARD_ARABIC_TEXT, "ar", id="arabic"),
+]
+
+
+@pytest.mark.parametrize(
+    "name, args",
+    [
+        ("count_words", ()),
+        ("count_sentences", ()),
+        ("count_letters", ()),
+        ("count_chars", (True,)),
+        ("count_chars", (False,)),
+        ("count_long_words", ()),
+        ("count_miniwords", ()),
+    ],
+)
+@pytest.mark.parametrize("text, lang", TEXTS)
+def test_analyze_counts(text: str, lang: str, name: str, args: tuple) -> None:
+    assert getattr(analysis.analyze(text, lang), name)(*args) == getattr(
+        counts, name
+    )(text, *args)
+
+
+@pytest.mark.parametrize(
+    "name",
+    ["count_syllables", "count_polysyllable_words", "count_monosyllable_words"],
+)
+@pytest.mark.parametrize("text, lang", TEXTS[:-1])
+def test_analyze_syllable_counts(text: str, lang: str, name: str) -> None:
+    assert getattr(analysis.analyze(text, lang), name)() == getattr(counts, name)(
+        text, lang
+    )
+
+
+@pytest.mark.parametrize("unique", [True, False])
+@pytest.mark.parametrize("syllable_threshold", [1, 2, 3])
+@pytest.mark.parametrize("text, lang", TEXTS[:6])
+def test_analyze_difficult_words(
+    text: str, lang: str, syllable_threshold: int, unique: bool
+) -> None:
+    assert analysis.analyze(text, lang).count_difficult_words(
+        syllable_threshold, unique
+    ) == counts.count_difficult_words(text, lang, syllable_threshold, unique)
+
+
+@pytest.mark.parametrize(
+    "name",
+    [
+        "automated_readability_index",
+        "chars_per_word",
+        "coleman_liau_index",
+        "gulpease_index",
+        "gutierrez_polini",
+        "letters_per_word",
+        "lix",
+        "mcalpine_eflaw",
+        "osman",
+        "rix",
+        "sentences_per_word",
+        "words_per_sentence",
+    ],
+)
+@pytest.mark.parametrize("text, lang", TEXTS)
+def test_analyze_metrics(text: str, lang: str, name: str) -> None:
+    assert getattr(analysis.analyze(text, lang), name)() == getattr(metrics, name)(
+        text
+    )
+
+
+@pytest.mark.parametrize(
+    "name",
+    [
+        "crawford",
+        "dale_chall_readability_score",
+        "dale_chall_readability_score_v2",
+        "fernandez_huerta",
+        "flesch_kincaid_grade",
+        "flesch_reading_ease",
+        "gunning_fog",
+        "new_dale_chall_readability_score",
+        "powers_sumner_kearl",
+        "smog_index",
+        "spache_readability",
+        "syllables_per_word",
+        "szigriszt_pazos",
+        "text_standard",
+    ],
+)
+@pytest.mark.parametrize("text, lang", TEXTS[:6])
+def test_analyze_lang_metrics(text: str, lang: str, name: str) -> None:
+    assert getattr(analysis.analyze(text, lang), name)() == getattr(metrics, name)(
+        text, lang
+    )
+
+
+@pytest.mark.parametrize("strict_lower", [True, False])
+@pytest.mark.parametrize("strict_upper", [True, False])
+@pytest.mark.parametrize("text, lang", TEXTS[:-1])
+def test_analyze_linsear_write_formula(
+    text: str, lang: str, strict_lower: bool, strict_upper: bool
+) -> None:
+    assert analysis.analyze(text, lang).linsear_write_formula(
+        strict_lower, strict_upper
+    ) == metrics.linsear_write_formula(text, lang, strict_lower, strict_upper)
+
+
+@pytest.mark.parametrize("variant", [1, 2, 3, 4])
+@pytest.mark.parametrize("text, lang", TEXTS[:8])
+def test_analyze_wiener_sachtextformel(text: str, lang: str, variant: int) -> None:
+    assert analysis.analyze(text, lang).wiener_sachtextformel(
+        variant
+    ) == metrics.wiener_sachtextformel(text, variant, lang)
+
+
+def test_analyze_is_immutable() -> None:
+    result = analysis.analyze(resources.SHORT_TEXT, "en_US")
+    with pytest.raises(AttributeError):
+        result.text = resources.LONG_TEXT  # type: ignore
+
+
+def test_base_analysis_is_abstract() -> None:
+    with pytest.raises(TypeError):
+        analysis.BaseAnalysis()  # type: ignore[abstract]
@@ -0,0 +1,118 @@
+from __future__ import annotations
+
+import pytest
+
+from textstat.backend import analysis, counts, metrics
+from .. import resources
+
+TEXT = "\n\n".join(
+    [resources.LONG_TEXT, resources.PUNCT_TEXT, resources.EASY_TEXT] * 2
+)
+METRICS = [
+    name
+    for name in dir(analysis.BaseAnalysis)
+    if not name.startswith("_")
+    and name not in ("lang", "wiener_sachtextformel")
+]
+
+
+def feed(
+    text: str, size: int, segment_chars: int, max_segment_chars: int
+) -> analysis.StreamAnalysis:
+    analyzer = analysis.StreamAnalyzer(
+        "en_US", segment_chars=segment_chars, max_segment_chars=max_segment_chars
+    )
+    for i in range(0, len(text), size):
+        analyzer.feed(text[i:i + size])
+    return analyzer.close()
+
+
+@pytest.mark.parametrize(
+    "size, segment_chars, max_segment_chars",
+    [
+        (1, 1, 1000),  # words and sentences span chunks
+        (7, 40, 80),  # sentences are cut
+        (100, 50, 100_000),
+        (100_000, 1000, 2000),
+    ],
+)
+def test_stream_analyzer(
+    size: int, segment_chars: int, max_segment_chars: int
+) -> None:
+    doc = analysis.analyze(TEXT, "en_US")
+    streamed = feed(TEXT, size, segment_chars, max_segment_chars)
+
+    for metric in METRICS:
+        assert getattr(streamed, metric)() == pytest.approx(
+            getattr(doc, metric)()
+        ), metric
+    assert streamed.wiener_sachtextformel(1) == pytest.approx(
+        doc.wiener_sachtextformel(1)
+    )
+
+
+@pytest.mark.parametrize(
+    "text",
+    [
+        resources.EMPTY_STR,
+        "   \n ",
+        " \n" * 20,  # longer than max_segment_chars
+        resources.SHORT_TEXT,
+        "no sentence ends here",
+        "One two. " * 30,
+    ],
+)
+def test_stream_analyzer_short(text: str) -> None:
+    doc = analysis.analyze(text, "en_US")
+    streamed = feed(text, 3, 4, 16)
+
+    for metric in METRICS:
+        assert getattr(streamed, metric)() == pytest.approx(
+            getattr(doc, metric)()
+        ), metric
+
+
+@pytest.mark.parametrize(
+    "text", [resources.EASY_ARABIC_TEXT, resources.HARD_ARABIC_TEXT * 3]
+)
+def test_stream_analyzer_arabic(text: str) -> None:
+    analyzer = analysis.StreamAnalyzer("ar", segment_chars=40, max_segment_chars=200)
+    for i in range(0, len(text), 5):
+        analyzer.feed(text[i:i + 5])
+    streamed = analyzer.close()
+
+    assert streamed.osman() == pytest.approx(metrics.osman(text))
+    assert streamed.count_words() == counts.count_words(text)
+    # Pyphen has no Arabic dictionary
+    with pytest.raises(LookupError):
+        streamed.count_syllables()
+
+
+def test_stream_analyzer_bounded() -> None:
+    analyzer = analysis.StreamAnalyzer(
+        "en_US", segment_chars=100, max_segment_chars=1000
+    )
+    for _ in range(500):
+        analyzer.feed("word " * 10)
+        assert sum(len(chunk) for chunk in analyzer._chunks) < 1100
+
+    assert analyzer.close().count_words() == 5000
+
+
+def test_stream_analyzer_closed() -> None:
+    analyzer = analysis.StreamAnalyzer("en_US")
+    analyzer.feed(resources.SHORT_TEXT)
+
+    assert analyzer.close() == analyzer.close()
+    with pytest.raises(ValueError):
+        analyzer.feed(resources.SHORT_TEXT)
+    with pytest.raises(TypeError):
+        analysis.StreamAnalyzer("en_US").feed(b"bytes")  # type: ignore[arg-type]
+
+
+def test_analyze_stream() -> None:
+    streamed = analysis.analyze_stream(TEXT.splitlines(keepends=True), "en_US")
+
+    assert streamed.flesch_reading_ease() == pytest.approx(
+        analysis.analyze(TEXT, "en_US").flesch_reading_ease()
+    )
@@ -0,0 +1,99 @@
+from __future__ import annotations
+
+import random
+
+import pytest
+
+from textstat.backend import analysis, metrics
+from .. import resources
+
+METRICS = [
+    name
+    for name in dir(analysis.BaseAnalysis)
+    if not name.startswith("_")
+    and name not in ("lang", "wiener_sachtextformel")
+]
+PIECES = [
+    " The cat sat.",
+    "Hello",
+    " world. ",
+    ". ",
+    "\n\n",
+    "Dr. Smith went home. ",
+    "!",
+    " yes",
+]
+
+
+def assert_matches(doc: analysis.IncrementalDocument, text: str) -> None:
+    assert doc.text == text
+    assert len(doc) == len(text)
+    full = analysis.analyze(text, "en_US")
+    for metric in METRICS:
+        assert getattr(doc.analysis, metric)() == pytest.approx(
+            getattr(full, metric)()
+        ), metric
+
+
+@pytest.mark.parametrize("seed", [0, 1])
+def test_incremental_document(seed: int) -> None:
+    rng = random.Random(seed)
+    text = resources.LONG_TEXT
+    doc = analysis.IncrementalDocument(text)
+
+    for _ in range(60):
+        if rng.random() < 0.5:
+            start = rng.randrange(len(text))
+            end = min(len(text), start + rng.randrange(30))
+            doc.delete(start, end)
+            text = text[:start] + text[end:]
+        else:
+            index = rng.randrange(len(text) + 1)
+            piece = rng.choice(PIECES)
+            doc.insert(index, piece)
+            text = text[:index] + piece + text[index:]
+        assert_matches(doc, text)
+
+
+def test_incremental_document_replace() -> None:
+    doc = analysis.IncrementalDocument(resources.SHORT_TEXT)
+
+    doc.replace(0, len(doc), resources.EASY_TEXT)
+    assert_matches(doc, resources.EASY_TEXT)
+
+    doc.delete(0, len(doc))
+    assert_matches(doc, "")
+
+    doc.insert(0, resources.PUNCT_TEXT)
+    assert_matches(doc, resources.PUNCT_TEXT)
+
+
+def test_incremental_document_score() -> None:
+    doc = analysis.IncrementalDocument(resources.LONG_TEXT)
+
+    assert doc.score(["text_standard", "count_words"]) == {
+        "text_standard": analysis.analyze(
+            resources.LONG_TEXT, "en_US"
+        ).text_standard(),
+        "count_words": analysis.analyze(resources.LONG_TEXT, "en_US").count_words(),
+    }
+    with pytest.raises(ValueError):
+        doc.score(["not_a_metric"])
+
+
+def test_incremental_document_arabic() -> None:
+    doc = analysis.IncrementalDocument(resources.EASY_ARABIC_TEXT, "ar")
+    doc.insert(len(doc), " " + resources.HARD_ARABIC_TEXT)
+
+    assert doc.analysis.osman() == pytest.approx(metrics.osman(doc.text))
+    # Pyphen has no Arabic dictionary
+    with pytest.raises(LookupError):
+        doc.score(["flesch_reading_ease"])
+
+
+@pytest.mark.parametrize("start, end", [(-1, 0), (5, 4), (0, 10_000)])
+def test_incremental_document_invalid_range(start: int, end: int) -> None:
+    doc = analysis.IncrementalDocument(resources.SHORT_TEXT)
+
+    with pytest.raises(IndexError):
+        doc.delete(start, end)
@@ -0,0 +1,98 @@
+from __future__ import annotations
+
+from array import array
+
+import pytest
+
+from textstat.backend import analysis, metrics, selections
+from .. import resources
+
+TEXT = "\n\n".join([resources.LONG_TEXT, resources.PUNCT_TEXT, resources.EASY_TEXT])
+METRICS = [
+    name
+    for name in dir(analysis.BaseAnalysis)
+    if not name.startswith("_")
+    and name not in ("lang", "wiener_sachtextformel")
+]
+
+
+def window_starts(n_units: int, window: int, step: int) -> list[int]:
+    starts = []
+    for start in range(0, n_units, step):
+        starts.append(start)
+        if start + window >= n_units:
+            break
+    return starts
+
+
+@pytest.mark.parametrize(
+    "window, step", [(1, 1), (4, 1), (5, None), (3, 7), (1000, 1)]
+)
+def test_profile(window: int, step: int | None) -> None:
+    sentences = selections.list_sentences(TEXT)
+    starts = window_starts(len(sentences), window, step or window)
+
+    columns = analysis.profile(
+        TEXT, "en_US", METRICS, window=window, step=step, output="list"
+    )
+
+    for i, start in enumerate(starts):
+        doc = analysis.analyze(" ".join(sentences[start:start + window]), "en_US")
+        for metric in METRICS:
+            assert columns[metric][i] == pytest.approx(getattr(doc, metric)()), metric
+    assert all(len(column) == len(starts) for column in columns.values())
+
+
+def test_profile_paragraphs() -> None:
+    paragraphs = [resources.LONG_TEXT, resources.EASY_TEXT, resources.SHORT_TEXT]
+
+    columns = analysis.profile(
+        "\n\n".join(paragraphs),
+        "en_US",
+        ["count_words", "text_standard"],
+        window=1,
+        unit="paragraph",
+    )
+
+    assert columns == {
+        "count_words": array(
+            "d", [analysis.analyze(p, "en_US").count_words() for p in paragraphs]
+        ),
+        "text_standard": array(
+            "d", [analysis.analyze(p, "en_US").text_standard() for p in paragraphs]
+        ),
+    }
+
+
+def test_profile_arabic() -> None:
+    text = resources.EASY_ARABIC_TEXT + " " + resources.HARD_ARABIC_TEXT
+    sentences = selections.list_sentences(text)
+
+    columns = analysis.profile(text, "ar", ["osman"], window=2, output="list")
+
+    assert columns["osman"] == pytest.approx(
+        [
+            metrics.osman(" ".join(sentences[start:start + 2]))
+            for start in window_starts(len(sentences), 2, 2)
+        ]
+    )
+
+
+def test_profile_empty() -> None:
+    assert analysis.profile("", "en_US", ["lix"], output="list") == {"lix": []}
+
+
+@pytest.mark.parametrize(
+    "kwargs",
+    [
+        {"window": 0},
+        {"step": 0},
+        {"unit": "chapter"},
+        {"output": "parquet"},
+        {"metrics": ["not_a_metric"]},
+    ],
+)
+def test_profile_invalid(kwargs: dict) -> None:
+    kwargs = {"metrics": ["lix"], **kwargs}
+    with pytest.raises(ValueError):
+        analysis.profile(TEXT, "en_US", **kwargs)
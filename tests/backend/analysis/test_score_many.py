@@ -0,0 +1,78 @@
+from __future__ import annotations
+
+from array import array
+
+import pytest
+
+from textstat.backend import analysis, counts, metrics
+from .. import resources
+
+
+TEXTS = [
+    resources.EMPTY_STR,
+    resources.SHORT_TEXT,
+    resources.PUNCT_TEXT,
+    resources.LONG_TEXT,
+    resources.EASY_TEXT,
+]
+
+
+def test_score_many() -> None:
+    columns = analysis.score_many(
+        iter(TEXTS), ["flesch_reading_ease", "smog_index", "count_words"], "en_US"
+    )
+
+    assert columns == {
+        "flesch_reading_ease": [
+            metrics.flesch_reading_ease(text, "en_US") for text in TEXTS
+        ],
+        "smog_index": [metrics.smog_index(text, "en_US") for text in TEXTS],
+        "count_words": [counts.count_words(text) for text in TEXTS],
+    }
+
+
+def test_score_many_text_standard() -> None:
+    columns = analysis.score_many(TEXTS, ["text_standard", "lix"], "en_US")
+
+    assert columns == {
+        "text_standard": [metrics.text_standard(text, "en_US") for text in TEXTS],
+        "lix": [metrics.lix(text) for text in TEXTS],
+    }
+    assert analysis.score_many([], ["text_standard"], "en_US") == {
+        "text_standard": []
+    }
+
+
+def test_score_many_array() -> None:
+    columns = analysis.score_many(TEXTS, ["lix"], "en_US", output="array")
+
+    assert columns["lix"] == array("d", [metrics.lix(text) for text in TEXTS])
+
+
+def test_score_many_round_points() -> None:
+    columns = analysis.score_many(TEXTS, ["lix"], "en_US", round_points=1)
+
+    assert columns["lix"] == [round(metrics.lix(text), 1) for text in TEXTS]
+
+
+def test_score_many_numpy() -> None:
+    np = pytest.importorskip("numpy")
+
+    columns = analysis.score_many(TEXTS, ["rix"], "en_US", output="numpy")
+
+    assert isinstance(columns["rix"], np.ndarray)
+    assert columns["rix"].tolist() == [metrics.rix(text) for text in TEXTS]
+
+
+@pytest.mark.parametrize(
+    "metrics_, output",
+    [
+        (["not_a_metric"], "list"),
+        (["list_difficult_words"], "list"),
+        (["wiener_sachtextformel"], "list"),
+        (["lix"], "parquet"),
+    ],
+)
+def test_score_many_invalid(metrics_: list[str], output: str) -> None:
+    with pytest.raises(ValueError):
+        analysis.score_many(TEXTS, metrics_, "en_US", output=output)
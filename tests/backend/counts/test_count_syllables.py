@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 import pytest
-from textstat.backend import counts
+from textstat.backend import counts, selections, utils
 from .. import resources
 
 
@@ -53,3 +53,49 @@ def test_count_syllables_with_unknown_word():
     an unknown word.
     """
     assert counts.count_syllables("text_a", "en_US") == 2
+
+
+@pytest.mark.parametrize(
+    "lang, word",
+    [
+        ("en_US", "Hello"),
+        ("en_US", "day's"),
+        ("en_US", "don't"),
+        ("en_US", "faeries"),
+        ("es", "día"),
+        ("de_DE", "Straße"),
+    ],
+)
+def test_count_word_syllables(lang: str, word: str) -> None:
+    assert counts.count_word_syllables(word, lang) == counts.count_syllables(
+        word, lang
+    )
+
+
+def test_count_syllables_keys_lowercase_words() -> None:
+    # "İ".lower() is "i" and U+0307, which must not split or strip the word
+    text = "İstanbul İİİ. DŽ ǅ ǆ."
+    utils.get_syllable_table("de").clear()
+    assert counts.count_syllables(text, "de") == 7
+    words = selections.list_words(text)
+    assert set(utils.get_syllable_table("de")) == {w.lower() for w in words}
+    assert sum(counts.count_word_syllables(w, "de") for w in words) == 7
+
+
+@pytest.mark.parametrize(
+    "lang, text",
+    [
+        ("en_US", resources.LONG_TEXT),
+        ("es", resources.LONG_SPANISH_TEXT),
+        ("de_DE", resources.GERMAN_SAMPLE_A),
+    ],
+)
+def test_syllabify_many(lang: str, text: str) -> None:
+    words = text.split() + ["Hello", "hello", "", "don't!", "Straße"]
+    # Count the words missing from the table in the batch
+    utils.get_syllable_table(lang).clear()
+
+    assert counts.syllabify_many(words, lang) == [
+        counts.count_word_syllables(word, lang) for word in words
+    ]
+    assert counts.syllabify_many([], lang) == []
@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+import sys
+
 import pytest
 
 from textstat.backend import metrics
@@ -18,3 +20,33 @@ from .. import resources
 )
 def test_text_standard(text: str, lang: str, expected: float) -> None:
     assert round(metrics.text_standard(text, lang), 3) == expected
+
+
+GRADE_SCORES = [
+    # flesch_kincaid_grade, flesch_reading_ease, smog_index, coleman_liau_index,
+    # automated_readability_index, dale_chall_readability_score,
+    # linsear_write_formula, gunning_fog
+    (0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0),
+    (3.7, 92.4, 6.1, 4.0, 2.5, 5.9, 3.0, 6.2),
+    (8.5, 65.0, 9.5, 10.5, 8.5, 7.2, 9.0, 11.1),
+    (11.2, 100.0, 12.8, 11.9, 12.5, 9.4, 10.5, 14.0),
+    (-2.3, 121.2, 3.1, -4.4, -3.5, 0.4, -1.0, 1.6),
+    (15.5, 12.0, 16.5, 14.5, 17.5, 10.0, 15.0, 18.5),
+    (9.0, 60.0, 9.0, 8.0, 8.0, 9.0, 8.0, 9.0),
+    # Rounds to zero from below
+    (-0.4, 200.0, -0.4, -0.4, -0.4, -0.4, -0.4, -0.4),
+]
+
+
+@pytest.mark.parametrize("numpy", [True, False])
+def test_consensus_grades(numpy: bool, monkeypatch: pytest.MonkeyPatch) -> None:
+    if numpy:
+        pytest.importorskip("numpy")
+    else:
+        monkeypatch.setitem(sys.modules, "numpy", None)
+
+    grades = metrics.consensus_grades(*zip(*GRADE_SCORES))
+    expected = [metrics.consensus_grade(*scores) for scores in GRADE_SCORES]
+    # repr tells -0.0 from 0.0
+    assert repr(grades) == repr(expected)
+    assert metrics.consensus_grades(*[[]] * 8) == []
@@ -0,0 +1,69 @@
+from __future__ import annotations
+
+import pytest
+
+from textstat.backend import counts, selections
+from .. import resources
+
+
+@pytest.mark.parametrize(
+    "text",
+    [
+        resources.EMPTY_STR,
+        resources.EASY_TEXT,
+        resources.SHORT_TEXT,
+        resources.PUNCT_TEXT,
+        resources.LONG_TEXT,
+    ],
+)
+def test_list_sentences(text: str) -> None:
+    sentences = selections.list_sentences(text)
+
+    assert all(sentence.strip() for sentence in sentences)
+    assert max(1, len(sentences)) == max(1, counts.count_sentences(text))
+
+
+def test_list_sentences_whitespace() -> None:
+    assert selections.list_sentences(" \n\t ") == []
+
+
+def test_set_sentence_engine() -> None:
+    text = "It works. The rules are simple"
+    assert selections.get_sentence_engine() == "punkt"
+    punkt_count = counts.count_sentences(text)
+    try:
+        selections.set_sentence_engine("fast")
+        assert selections.get_sentence_engine() == "fast"
+        assert selections.list_sentences(text) == selections.split_sentences(text)
+        assert counts.count_sentences(text) == punkt_count
+    finally:
+        selections.set_sentence_engine("punkt")
+
+
+@pytest.mark.parametrize(
+    "text",
+    [
+        resources.EASY_TEXT,
+        resources.SHORT_TEXT,
+        resources.PUNCT_TEXT,
+        resources.LONG_TEXT,
+        resources.LONG_SPANISH_TEXT,
+        resources.LONG_RUSSIAN_TEXT_GUILLEMETS,
+        resources.HARD_HUNGARIAN_TEXT,
+        resources.HARD_ACADEMIC_HUNGARIAN_TEXT,
+    ],
+)
+def test_sentence_engines_agree(text: str) -> None:
+    punkt = selections.list_sentences(text)
+    try:
+        selections.set_sentence_engine("fast")
+        fast = selections.list_sentences(text)
+    finally:
+        selections.set_sentence_engine("punkt")
+
+    assert len(fast) == len(punkt)
+
+
+def test_set_sentence_engine_invalid() -> None:
+    with pytest.raises(ValueError):
+        selections.set_sentence_engine("spacy")
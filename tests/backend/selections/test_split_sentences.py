@@ -0,0 +1,44 @@
+from __future__ import annotations
+
+import pytest
+from nltk.tokenize import sent_tokenize
+
+from textstat.backend import selections
+from .. import resources
+
+
+@pytest.mark.parametrize(
+    "text, expected",
+    [
+        ("", []),
+        ("   ", []),
+        ("One sentence", ["One sentence"]),
+        ("One. Two! Three? Four", ["One.", "Two!", "Three?", "Four"]),
+        ("Mr. Smith met Dr. Jones.", ["Mr. Smith met Dr. Jones."]),
+        ("J. R. R. Tolkien wrote it.", ["J. R. R. Tolkien wrote it."]),
+        ("Use e.g. hammers. Then rest.", ["Use e.g. hammers.", "Then rest."]),
+        ("It cost 3.50 dollars. Cheap.", ["It cost 3.50 dollars.", "Cheap."]),
+        ('"Stop!" he said. She did.', ['"Stop!"', "he said.", "She did."]),
+        ("Wait... and see. Yes.", ["Wait... and see.", "Yes."]),
+        ("Das ist z.B. gut. Ja.", ["Das ist z.B. gut.", "Ja."]),
+    ],
+)
+def test_split_sentences(text: str, expected: list[str]) -> None:
+    assert selections.split_sentences(text) == expected
+
+
+@pytest.mark.parametrize(
+    "text",
+    [
+        resources.SHORT_TEXT,
+        resources.LONG_TEXT,
+        resources.PUNCT_TEXT,
+        resources.EASY_TEXT,
+        resources.LONG_SPANISH_TEXT,
+        resources.ITALIAN_TEXT,
+    ],
+)
+def test_split_sentences_agrees_with_punkt(text: str) -> None:
+    punkt = [s.strip() for s in sent_tokenize(text) if s.strip()]
+
+    assert selections.split_sentences(text) == punkt
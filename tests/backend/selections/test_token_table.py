@@ -0,0 +1,54 @@
+from __future__ import annotations
+
+import sys
+
+import pytest
+from .. import resources
+from textstat.backend import counts, selections
+
+
+@pytest.mark.parametrize(
+    "text",
+    [
+        resources.EMPTY_STR,
+        resources.EASY_TEXT,
+        resources.SHORT_TEXT,
+        resources.PUNCT_TEXT,
+        resources.LONG_TEXT,
+    ],
+)
+def test_token_table(text: str) -> None:
+    table = selections.get_token_table(text)
+    words = selections.list_words(text)
+    assert len(table) == len(words)
+    assert table.words() == words
+    assert [table.word(i) for i in range(len(table))] == words
+    assert list(table.letter_lengths) == [len(w.replace("'", "")) for w in words]
+    assert list(table.syllables("en_US")) == [
+        counts.count_word_syllables(w, "en_US") for w in words
+    ]
+
+
+@pytest.mark.parametrize("text", [resources.PUNCT_TEXT, resources.LONG_TEXT])
+@pytest.mark.parametrize("threshold", [0, 3, 6, 40])
+def test_token_table_counts(text: str, threshold: int) -> None:
+    words = selections.list_words(text, rm_apostrophe=True)
+    long_words = [w for w in words if len(w) > threshold]
+    mini_words = [w for w in words if len(w) <= threshold]
+    assert counts.count_long_words(text, threshold) == len(long_words)
+    assert counts.count_miniwords(text, threshold) == len(mini_words)
+    assert counts.count_difficult_words(text, "en_US", threshold) == len(
+        selections.list_difficult_words(text, threshold, "en_US")
+    )
+    assert counts.count_difficult_words(text, "en_US", threshold, True) == len(
+        selections.set_difficult_words(text, threshold, "en_US")
+    )
+
+
+def test_token_table_sizeof() -> None:
+    table = selections.TokenTable(resources.LONG_TEXT)
+    size = sys.getsizeof(table)
+    table.word(0)
+    table.syllables("en_US")
+    table.easy_flags("en_US")
+    assert size == sys.getsizeof(table)
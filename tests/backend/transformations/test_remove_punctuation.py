@@ -19,6 +19,8 @@ from .. import resources
             nonsensemy guy a whoswho veritably""",
             True,
         ),
+        ("'Hello,' she said—it's 'done'.", "Hello she saidit's 'done", False),
+        ("'Hello,' she said—it's 'done'.", "Hello she saidits done", True),
         (resources.PUNCT_TEXT, resources.PUNCT_TEXT_RESULT_W_APOSTR, False),
         (resources.PUNCT_TEXT, resources.PUNCT_TEXT_RESULT_WO_APOSTR, True),
     ],
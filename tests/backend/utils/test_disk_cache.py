@@ -0,0 +1,60 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+from textstat.backend import metrics, utils
+from .. import resources
+
+
+def test_configure_disk_cache(tmp_path: Path) -> None:
+    path = tmp_path / "cache.sqlite"
+    try:
+        utils.configure_disk_cache(path)
+        utils.cache_clear()
+        score = metrics.flesch_reading_ease(resources.LONG_TEXT, "en_US")
+        info = utils.disk_cache_info()
+        assert info is not None
+        # Only the metric called directly is stored
+        assert (info.hits, info.misses, info.entries) == (0, 1, 1)
+
+        utils.cache_clear()
+        assert metrics.flesch_reading_ease(resources.LONG_TEXT, "en_US") == score
+        assert utils.disk_cache_info().hits == 1
+
+        # Other arguments are other entries
+        metrics.flesch_reading_ease(resources.LONG_TEXT, "de_DE")
+        assert utils.disk_cache_info().entries == 2
+
+        utils.disk_cache_clear()
+        assert utils.disk_cache_info().entries == 0
+    finally:
+        utils.configure_disk_cache(None)
+        utils.cache_clear()
+    assert utils.disk_cache_info() is None
+
+
+def test_disk_cache_shared(tmp_path: Path) -> None:
+    path = tmp_path / "cache.sqlite"
+    writer = utils.DiskCache(path)
+    reader = utils.DiskCache(path)
+    try:
+        writer.put(b"key", 1.5)
+        writer.put(b"list", [1.5])
+        assert reader.get(b"key") == (True, 1.5)
+        assert reader.get(b"list") == (False, None)
+    finally:
+        writer.close()
+        reader.close()
+
+
+def test_disk_cache_evict(tmp_path: Path) -> None:
+    disk_cache = utils.DiskCache(tmp_path / "cache.sqlite", max_entries=100)
+    try:
+        for i in range(256):
+            disk_cache.put(i.to_bytes(2, "big"), float(i))
+        assert disk_cache.info().entries == 90
+        # The oldest results are evicted first
+        assert disk_cache.get((255).to_bytes(2, "big")) == (True, 255.0)
+        assert disk_cache.get((0).to_bytes(2, "big")) == (False, None)
+    finally:
+        disk_cache.close()
@@ -0,0 +1,60 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+from textstat.backend import utils
+
+
+@pytest.mark.parametrize(
+    "lang, expected",
+    [
+        ("en_US", utils.CmuSyllables),
+        ("en", utils.CmuSyllables),
+        ("es", None),
+        ("de_DE", None),
+    ],
+)
+def test_get_cmu_syllables(lang: str, expected: type | None) -> None:
+    if expected is None:
+        assert utils.get_cmu_syllables(lang) is None
+    else:
+        assert isinstance(utils.get_cmu_syllables(lang), expected)
+
+
+@pytest.mark.parametrize(
+    "word, expected",
+    [
+        ("'bout", 1),
+        ("monopoly", 4),
+        ("interpersonal", 5),
+        ("the", 1),
+        ("zywicki", 3),
+        ("hello", 2),
+        ("notawordxyz", None),
+        ("Hello", None),
+        ("", None),
+    ],
+)
+def test_cmu_syllables_get(word: str, expected: int | None) -> None:
+    cmu_syllables = utils.get_cmu_syllables("en_US")
+
+    assert cmu_syllables.get(word) == expected
+
+
+def test_cmu_syllables_matches_cmudict() -> None:
+    cmu_syllables = utils.get_cmu_syllables("en_US")
+    cmu_dict = utils.get_cmudict("en_US")
+
+    for word in list(cmu_dict)[::97]:
+        expected = sum(1 for p in cmu_dict[word][0] if p[-1].isdigit())
+        assert cmu_syllables.get(word) == expected
+
+
+def test_build_cmu_syllables(tmp_path: Path) -> None:
+    path = tmp_path / "cmu_syllables.txt"
+    utils.build_cmu_syllables(path)
+
+    installed = utils.get_cmu_syllables("en_US")
+    with open(path, "rb") as f:
+        assert f.read() == installed._data[:]
@@ -0,0 +1,46 @@
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+import pytest
+
+from textstat.backend import counts, utils
+from textstat.backend.utils import _get_syllable_table
+
+
+def test_get_syllable_table() -> None:
+    counts.count_word_syllables("Monopoly", "en_US")
+
+    assert utils.get_syllable_table("en_US")["monopoly"] == 4
+    assert utils.get_syllable_table("en_US") is utils.get_syllable_table("en_US")
+
+
+def test_save_load_syllable_table(tmp_path: Path) -> None:
+    counts.count_word_syllables("interpersonal", "en_US")
+    path = tmp_path / "syllables.json"
+    utils.save_syllable_table("en_US", path)
+
+    utils.load_syllable_table("xx_test", path)
+
+    assert utils.get_syllable_table("xx_test")["interpersonal"] == 5
+    assert counts.count_word_syllables("Interpersonal", "xx_test") == 5
+
+
+def test_load_syllable_table_bounded(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setattr(_get_syllable_table, "SYLLABLE_TABLE_SIZE", 4)
+    path = tmp_path / "syllables.json"
+    path.write_text(json.dumps({f"word{i}": i for i in range(6)}))
+
+    utils.load_syllable_table("xx_bounded", path)
+    utils.load_syllable_table("xx_bounded", path)
+
+    # The last entries of the file are kept
+    assert utils.get_syllable_table("xx_bounded") == {
+        "word2": 2,
+        "word3": 3,
+        "word4": 4,
+        "word5": 5,
+    }
@@ -1,8 +1,11 @@
 from __future__ import annotations
 
+import functools
+import sys
+import timeit
 from typing import Callable
 import pytest
-from textstat.backend import utils, counts, metrics
+from textstat.backend import utils, counts, metrics, validations
 from .. import resources
 
 
@@ -39,3 +42,135 @@ def test_typed_chache(
 
     assert inner_func.cache_info().misses == 1  # type: ignore
     assert inner_func.cache_info().hits == len(outer_funcs)  # type: ignore
+
+
+@pytest.fixture
+def restore_cache_config():
+    yield
+    utils.configure_cache()
+
+
+def test_cache_max_bytes(restore_cache_config: None) -> None:
+    utils.configure_cache(max_bytes=2000)
+    for i in range(50):
+        counts.count_words(f"{resources.SHORT_TEXT} {i}")
+
+    info = counts.count_words.cache_info()
+    assert 0 < info.nbytes <= 2000
+    assert info.currsize < 50
+
+    utils.configure_cache(max_bytes=0)
+    assert counts.count_words.cache_info().currsize == 0
+
+
+def test_cache_maxsize(restore_cache_config: None) -> None:
+    utils.configure_cache(maxsize=3)
+    for i in range(10):
+        counts.count_letters(f"{resources.SHORT_TEXT} {i}")
+
+    assert counts.count_letters.cache_info().currsize == 3
+
+
+def test_cache_digest_key(restore_cache_config: None) -> None:
+    utils.configure_cache(key="digest")
+    counts.count_words.cache_clear()
+
+    assert counts.count_words(resources.LONG_TEXT) == counts.count_words(
+        resources.LONG_TEXT
+    )
+    info = counts.count_words.cache_info()
+    assert (info.hits, info.misses) == (1, 1)
+    # The digest rather than the text is held by the cache
+    assert info.nbytes < len(resources.LONG_TEXT)
+
+
+def test_cache_disable_family(restore_cache_config: None) -> None:
+    counts.count_words(resources.SHORT_TEXT)
+    utils.configure_cache(disable=["counts"])
+    assert counts.count_words.cache_info().currsize == 0
+
+    counts.count_words(resources.SHORT_TEXT)
+    assert counts.count_words.cache_info().currsize == 0
+    metrics.words_per_sentence(resources.SHORT_TEXT)
+    assert metrics.words_per_sentence.cache_info().currsize == 1
+
+
+@pytest.mark.parametrize(
+    "kwargs",
+    [
+        {"key": "sha"},
+        {"max_bytes": -1},
+        {"disable": ["not_a_family"]},
+        {"disable": ["validations"]},
+    ],
+)
+def test_configure_cache_invalid(kwargs: dict) -> None:
+    with pytest.raises(ValueError):
+        utils.configure_cache(**kwargs)
+
+
+def test_cache_info() -> None:
+    utils.cache_clear()
+    counts.count_words(resources.SHORT_TEXT)
+    counts.count_words(resources.SHORT_TEXT)
+
+    infos = utils.cache_info("counts")
+    assert all(name.startswith("counts.") for name in infos)
+    assert infos["counts.count_words"] == counts.count_words.cache_info()
+    assert infos["counts.count_words"].hits == 1
+    assert infos["counts.count_words"].nbytes > 0
+    assert "resources.get_pyphen" in utils.cache_info()
+    assert utils.cache_info()["resources.get_pyphen"].maxsize is None
+
+    with pytest.raises(ValueError):
+        utils.cache_info("words")
+
+
+def test_cached_functions() -> None:
+    functions = utils.cached_functions()
+    assert functions["counts.count_words"] is counts.count_words
+    assert functions["metrics.flesch_reading_ease"] is metrics.flesch_reading_ease
+    assert set(utils.cached_functions("metrics")) == {
+        name for name in functions if name.startswith("metrics.")
+    }
+    assert {name.split(".")[0] for name in functions} == set(utils.cache_families())
+
+
+def test_cache_clear_family() -> None:
+    counts.count_words(resources.SHORT_TEXT)
+    metrics.lix(resources.SHORT_TEXT)
+    utils.cache_clear("metrics")
+    assert metrics.lix.cache_info().currsize == 0
+    assert counts.count_words.cache_info().currsize == 1
+
+    with pytest.raises(ValueError):
+        utils.cache_clear("words")
+
+
+def test_cache_hit_overhead() -> None:
+    # Guards the hit path of the caches against regressions, relative to the
+    # lru_cache they replaced, on whatever machine runs the tests
+    @functools.lru_cache(maxsize=utils.constants.CACHE_SIZE)
+    def lru_count_words(text: str) -> int:
+        return counts.count_words(text)
+
+    def best_of(func: Callable[[str], int]) -> float:
+        func(resources.LONG_TEXT)
+        return min(
+            timeit.repeat(lambda: func(resources.LONG_TEXT), number=20000, repeat=5)
+        )
+
+    assert best_of(counts.count_words) < 10 * best_of(lru_count_words)
+    assert isinstance(
+        validations.is_difficult_word.cache_info(), utils.CacheInfo  # type: ignore
+    )
+    assert utils.cache_info()["validations.is_difficult_word"].maxsize == (
+        utils.constants.WORD_CACHE_SIZE
+    )
+
+
+def test_cache_sizeof_estimate() -> None:
+    words = ["word"] * 100_000
+    assert utils._typed_cache._sizeof(words) == sys.getsizeof(words) + len(
+        words
+    ) * sys.getsizeof("word")
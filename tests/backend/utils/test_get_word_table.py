@@ -0,0 +1,123 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+from textstat.backend import utils
+
+
+@pytest.mark.parametrize(
+    "lang, n_words",
+    [
+        ("en", 2941),
+        ("en_US", 2941),
+        ("es", 20000),
+        ("de", 2941),
+    ],
+)
+def test_get_easy_word_table(lang: str, n_words: int) -> None:
+    if lang == "de":
+        with pytest.warns(Warning):
+            table = utils.get_easy_word_table(lang)
+    else:
+        table = utils.get_easy_word_table(lang)
+    assert isinstance(table, utils.WordTable)
+    assert len(table) == n_words
+
+
+@pytest.mark.parametrize("lang", ["en", "es"])
+def test_word_tables_match_word_lists(lang: str) -> None:
+    # The precompiled tables must be rebuilt (make word-tables) with the lists
+    easy_words = {word for word in utils.get_lang_easy_words(lang) if word}
+    assert set(utils.get_easy_word_table(lang)) == easy_words
+
+
+def test_spache_word_table_matches_word_list() -> None:
+    spache_words = {word for word in utils.get_spache_easy_words("en") if word}
+    assert set(utils.get_spache_word_table("en")) == spache_words
+
+
+@pytest.mark.parametrize(
+    "word, expected",
+    [
+        ("dog", True),
+        ("regardless", False),
+        ("Dog", False),
+        ("", False),
+        ("dog\n", False),
+        (None, False),
+    ],
+)
+def test_word_table_contains(word: str | None, expected: bool) -> None:
+    assert (word in utils.get_easy_word_table("en")) is expected
+
+
+def test_word_table_copies_words_to_set() -> None:
+    table = utils.WordTable.from_words(["dog", "über", "a\u2028b"])
+    lookups = ["dog", "cat", "über", "a\u2028b", "a", "Dog", "", "dog\n", None, []]
+    probed = [word in table for word in lookups]
+    for _ in range(2000):
+        "dog" in table
+    assert table._words == {"dog", "über", "a\u2028b"}
+    assert [word in table for word in lookups] == probed
+    assert probed == [True, False, True, True] + [False] * 6
+
+
+def test_build_word_table(tmp_path: Path) -> None:
+    source = tmp_path / "words.txt"
+    source.write_text("über\nb\n\n a \nb\n", encoding="utf-8")
+    utils.build_word_table(source, tmp_path / "words.bin")
+
+    table = utils.WordTable((tmp_path / "words.bin").read_bytes())
+
+    assert sorted(table) == ["a", "b", "über"]
+    assert len(table) == 3
+    assert all(word in table for word in ["a", "b", "über"])
+    assert "c" not in table
+    assert len(utils.WordTable.from_words([])) == 0
+    assert "a" not in utils.WordTable.from_words([])
+    with pytest.raises(ValueError):
+        utils.WordTable(b"not a word table")
+
+
+@pytest.mark.parametrize(
+    "word, forms",
+    [
+        ("dog", ["dogs"]),
+        ("box", ["boxes"]),
+        ("carry", ["carries", "carried", "carrying", "carrier"]),
+        ("play", ["plays", "played", "playing", "player"]),
+        ("make", ["makes", "making", "maker"]),
+        ("stop", ["stopped", "stopping"]),
+        ("big", ["bigger", "biggest"]),
+        ("happy", ["happier", "happiest", "happily"]),
+        ("tie", ["tied", "tying"]),
+        ("simple", ["simply"]),
+        ("full", ["fully"]),
+    ],
+)
+def test_inflect_words(word: str, forms: list[str]) -> None:
+    inflected = utils.inflect_words([word])
+    assert word in inflected
+    assert set(forms) <= inflected
+
+
+def test_inflected_word_table_matches_word_list() -> None:
+    # The precompiled table must be rebuilt (make word-tables) with the list
+    easy_words = {word for word in utils.get_lang_easy_words("en") if word}
+    assert set(utils.get_inflected_word_table("en")) == utils.inflect_words(
+        easy_words
+    )
+    assert utils.get_inflected_word_table("es") is utils.get_easy_word_table("es")
+
+
+def test_set_easy_word_matching() -> None:
+    assert utils.get_easy_word_matching() == "exact"
+    assert "played" not in utils.get_easy_word_index("en_US")
+    try:
+        utils.set_easy_word_matching("inflections")
+        assert "played" in utils.get_easy_word_index("en_US")
+    finally:
+        utils.set_easy_word_matching("exact")
+    with pytest.raises(ValueError):
+        utils.set_easy_word_matching("stems")
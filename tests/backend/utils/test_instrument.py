@@ -0,0 +1,69 @@
+from __future__ import annotations
+
+import threading
+
+import textstat
+from textstat.backend import counts, metrics, utils
+from .. import resources
+
+
+def test_instrument() -> None:
+    utils.cache_clear()
+    with utils.instrument() as stats:
+        metrics.flesch_reading_ease(resources.LONG_TEXT, "en_US")
+        metrics.flesch_reading_ease(resources.LONG_TEXT, "en_US")
+    # Not recorded once the context is closed
+    counts.count_words(resources.LONG_TEXT)
+
+    recorded = stats.as_dict()
+    assert recorded["metrics.flesch_reading_ease"]["calls"] == 2
+    assert recorded["metrics.flesch_reading_ease"]["hits"] == 1
+    assert recorded["metrics.flesch_reading_ease"]["hit_ratio"] == 0.5
+    assert recorded["counts.count_syllables"]["misses"] == 1
+    assert recorded["counts.count_words"]["calls"] == 2
+
+    outer = recorded["metrics.flesch_reading_ease"]
+    inner = recorded["metrics.syllables_per_word"]
+    assert 0 <= outer["self_seconds"] <= outer["seconds"]
+    assert inner["seconds"] <= outer["seconds"]
+    assert outer["self_seconds"] <= outer["seconds"] - inner["seconds"] + 1e-9
+
+
+def test_instrument_stages() -> None:
+    utils.get_syllable_table("en_US").clear()
+    with utils.instrument() as stats:
+        counts.count_syllables("the quixotic zzyzxwq", "en_US")
+    recorded = stats.as_dict()
+    assert recorded["syllables.cmu"]["calls"] == 3
+    assert recorded["syllables.cmu"]["hits"] is None
+    assert recorded["syllables.pyphen"]["calls"] >= 1
+
+
+def test_instrument_nested_and_threads() -> None:
+    utils.cache_clear()
+    with utils.instrument() as outer:
+        counts.count_words(resources.SHORT_TEXT)
+        with utils.instrument() as inner:
+            thread = threading.Thread(
+                target=counts.count_letters, args=(resources.SHORT_TEXT,)
+            )
+            thread.start()
+            thread.join()
+    assert set(outer.as_dict()) >= {"counts.count_words", "counts.count_letters"}
+    assert "counts.count_words" not in inner.as_dict()
+    assert inner.as_dict()["counts.count_letters"]["calls"] == 1
+
+    inner.reset()
+    assert inner.as_dict() == {}
+
+
+def test_instrument_prometheus() -> None:
+    utils.cache_clear()
+    with textstat.instrument() as stats:
+        textstat.lexicon_count(resources.SHORT_TEXT)
+        textstat.lexicon_count(resources.SHORT_TEXT)
+    text = stats.to_prometheus()
+    assert "# TYPE textstat_calls_total counter" in text
+    assert 'textstat_calls_total{function="counts.count_words"} 2' in text
+    assert 'textstat_cache_hits_total{function="counts.count_words"} 1' in text
+    assert text.endswith("\n")
@@ -0,0 +1,125 @@
+from __future__ import annotations
+
+import asyncio
+from array import array
+
+import pytest
+
+from textstat import aio
+from textstat.backend import analysis, utils
+from ..backend import resources
+
+TEXTS = [
+    resources.SHORT_TEXT,
+    resources.LONG_TEXT,
+    resources.EMPTY_STR,
+    resources.PUNCT_TEXT,
+    resources.EASY_TEXT,
+] * 3
+METRICS = ["flesch_reading_ease", "dale_chall_readability_score", "count_words"]
+
+
+@pytest.mark.parametrize("batch_size", [1, 4, 64])
+def test_score(batch_size: int) -> None:
+    async def main() -> list[dict[str, float]]:
+        async with aio.Pool(workers=2, batch_size=batch_size) as pool:
+            return await asyncio.gather(*(pool.score(t, METRICS) for t in TEXTS))
+
+    rows = asyncio.run(main())
+
+    columns = analysis.score_many(TEXTS, METRICS, "en_US")
+    assert rows == [
+        {metric: columns[metric][i] for metric in METRICS} for i in range(len(TEXTS))
+    ]
+
+
+def test_analyze() -> None:
+    async def main() -> list[analysis.DocumentAnalysis]:
+        async with aio.Pool(workers=2) as pool:
+            return await asyncio.gather(*(pool.analyze(t) for t in TEXTS))
+
+    docs = asyncio.run(main())
+
+    assert docs == [analysis.analyze(t, "en_US") for t in TEXTS]
+    # The words were looked up in the pool, not when a metric is read
+    for doc in docs:
+        assert {"syllables", "easy_flags", "spache_easy_flags"} <= set(vars(doc))
+
+
+def test_score_many() -> None:
+    async def main() -> dict[str, array]:
+        async with aio.Pool(workers=2, batch_size=2, max_pending=1) as pool:
+            return await pool.score_many(TEXTS, METRICS, output="array")
+
+    columns = asyncio.run(main())
+
+    assert columns == analysis.score_many(TEXTS, METRICS, "en_US", output="array")
+
+
+def test_module_functions() -> None:
+    pool = aio.configure(workers=1)
+    try:
+        rows = asyncio.run(aio.score(resources.EASY_TEXT, ["count_words"]))
+        assert rows == {"count_words": 99}
+        assert aio.get_pool() is pool
+    finally:
+        pool.close()
+
+
+def test_cancel() -> None:
+    async def main() -> dict[str, float]:
+        async with aio.Pool(workers=1, batch_delay=0.05) as pool:
+            cancelled = asyncio.ensure_future(pool.score(resources.LONG_TEXT, METRICS))
+            kept = asyncio.ensure_future(pool.score(resources.SHORT_TEXT, METRICS))
+            await asyncio.sleep(0)
+            cancelled.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await cancelled
+            return await kept
+
+    assert asyncio.run(main())["count_words"] == 5
+
+
+def test_invalid() -> None:
+    with pytest.raises(ValueError):
+        aio.Pool(kind="fiber")
+    with pytest.raises(ValueError):
+        aio.Pool(batch_size=0)
+    with pytest.raises(ValueError):
+        asyncio.run(aio.Pool(workers=1).score(resources.SHORT_TEXT, ["not_a_metric"]))
+
+
+def test_error_of_one_text() -> None:
+    async def main() -> list[dict[str, float] | BaseException]:
+        async with aio.Pool(workers=1, batch_delay=0.05) as pool:
+            return await asyncio.gather(
+                pool.score(resources.SHORT_TEXT, METRICS),
+                pool.score(None, METRICS),  # type: ignore[arg-type]
+                pool.score(resources.EASY_TEXT, METRICS),
+                return_exceptions=True,
+            )
+
+    short, failed, easy = asyncio.run(main())
+
+    assert isinstance(failed, TypeError)
+    columns = analysis.score_many([resources.SHORT_TEXT], METRICS, "en_US")
+    assert short == {metric: columns[metric][0] for metric in METRICS}
+    assert easy["count_words"] == 99
+
+
+def test_thread_pool_keeps_settings() -> None:
+    async def main(pool: aio.Pool) -> None:
+        await pool.score(resources.SHORT_TEXT, ["count_words"])
+        # The threads started after this must not reset the setting
+        utils.set_easy_word_matching("inflections")
+        await asyncio.gather(
+            *(pool.score(text, ["count_words"]) for text in TEXTS)
+        )
+
+    pool = aio.Pool(workers=4, batch_size=1)
+    try:
+        asyncio.run(main(pool))
+        assert utils.get_easy_word_matching() == "inflections"
+    finally:
+        utils.set_easy_word_matching("exact")
+        pool.close()
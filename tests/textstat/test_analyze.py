@@ -0,0 +1,24 @@
+from __future__ import annotations
+
+import pytest
+from textstat import textstat
+from ..backend import resources
+
+
+@pytest.mark.parametrize(
+    "lang, text",
+    [
+        ("en_US", resources.LONG_TEXT),
+        ("es_ES", resources.LONG_SPANISH_TEXT),
+    ],
+)
+def test_analyze(lang: str, text: str) -> None:
+    ts = type(textstat)()
+    ts.set_lang(lang)
+
+    analysis = ts.analyze(text)
+
+    assert analysis.lang == lang
+    assert analysis.flesch_reading_ease() == ts.flesch_reading_ease(text)
+    assert analysis.count_syllables() == ts.syllable_count(text)
+    assert ts.analyze(text, lang="de_DE").lang == "de_DE"
@@ -0,0 +1,184 @@
+from __future__ import annotations
+
+import csv
+import io
+import json
+from pathlib import Path
+
+import pytest
+
+from textstat import cli
+from textstat.backend import analysis
+from ..backend import resources
+
+TEXTS = [resources.SHORT_TEXT, resources.LONG_TEXT, resources.EASY_TEXT]
+METRICS = ["flesch_reading_ease", "count_words"]
+
+
+def expected_rows(**keys: list) -> list[dict]:
+    columns = analysis.score_many(TEXTS, METRICS, "en_US")
+    return [
+        {
+            **{key: values[i] for key, values in keys.items()},
+            **{metric: columns[metric][i] for metric in METRICS},
+        }
+        for i in range(len(TEXTS))
+    ]
+
+
+@pytest.fixture
+def jsonl_file(tmp_path: Path) -> Path:
+    path = tmp_path / "texts.jsonl"
+    path.write_text(
+        "".join(
+            json.dumps({"id": i, "text": text}) + "\n" for i, text in enumerate(TEXTS)
+        ),
+        encoding="utf-8",
+    )
+    return path
+
+
+@pytest.mark.parametrize("workers", ["0", "2"])
+def test_jsonl(
+    jsonl_file: Path, workers: str, capsys: pytest.CaptureFixture[str]
+) -> None:
+    status = cli.main(
+        [str(jsonl_file), "-m", ",".join(METRICS), "--id-field", "id"]
+        + ["--workers", workers, "--batch-size", "1"]
+    )
+
+    assert status == 0
+    rows = [json.loads(line) for line in capsys.readouterr().out.splitlines()]
+    assert rows == expected_rows(id=[0, 1, 2])
+
+
+def test_csv(tmp_path: Path) -> None:
+    source = tmp_path / "texts.csv"
+    with open(source, "w", newline="", encoding="utf-8") as f:
+        writer = csv.writer(f)
+        writer.writerow(["name", "text"])
+        writer.writerows([[f"doc{i}", text] for i, text in enumerate(TEXTS)])
+    output = tmp_path / "scores.csv"
+
+    status = cli.main(
+        [str(source), "-m", ",".join(METRICS), "--id-field", "name"]
+        + ["-o", str(output)]
+    )
+
+    assert status == 0
+    with open(output, newline="", encoding="utf-8") as f:
+        rows = list(csv.DictReader(f))
+    assert rows == [
+        {key: str(value) for key, value in row.items()}
+        for row in expected_rows(name=["doc0", "doc1", "doc2"])
+    ]
+
+
+def test_text_lines_json_columns(
+    monkeypatch: pytest.MonkeyPatch, capsys: pytest.CaptureFixture[str]
+) -> None:
+    lines = [text.replace("\n", " ") for text in TEXTS]
+    monkeypatch.setattr("sys.stdin", io.StringIO("\n".join(lines) + "\n"))
+
+    assert cli.main(["-m", ",".join(METRICS), "-t", "json"]) == 0
+
+    columns = json.loads(capsys.readouterr().out)
+    assert columns == analysis.score_many(lines, METRICS, "en_US")
+
+
+def test_document_file(tmp_path: Path, capsys: pytest.CaptureFixture[str]) -> None:
+    source = tmp_path / "book.txt"
+    source.write_text("\n\n".join(TEXTS), encoding="utf-8")
+
+    assert cli.main([str(source), "--document", "file", "-m", "count_words"]) == 0
+
+    row = json.loads(capsys.readouterr().out)
+    assert row == {
+        "file": str(source),
+        "count_words": analysis.analyze("\n\n".join(TEXTS), "en_US").count_words(),
+    }
+
+
+def test_parquet(jsonl_file: Path, tmp_path: Path) -> None:
+    parquet = pytest.importorskip("pyarrow.parquet")
+    output = tmp_path / "scores.parquet"
+
+    status = cli.main([str(jsonl_file), "-m", ",".join(METRICS), "-o", str(output)])
+
+    assert status == 0
+    assert parquet.read_table(output).to_pylist() == expected_rows()
+
+
+def test_parquet_missing_ids(tmp_path: Path) -> None:
+    parquet = pytest.importorskip("pyarrow.parquet")
+    source = tmp_path / "texts.jsonl"
+    ids = [None, "b", 3]
+    source.write_text(
+        "".join(
+            json.dumps({"id": id_, "text": text}) + "\n"
+            for id_, text in zip(ids, TEXTS)
+        ),
+        encoding="utf-8",
+    )
+    output = tmp_path / "scores.parquet"
+
+    status = cli.main(
+        [str(source), "-m", ",".join(METRICS), "--id-field", "id"]
+        + ["--batch-size", "1", "-o", str(output)]
+    )
+
+    assert status == 0
+    table = parquet.read_table(output)
+    assert [str(field.type) for field in table.schema] == [
+        "string",
+        "double",
+        "double",
+    ]
+    assert table.to_pylist() == expected_rows(id=[None, "b", "3"])
+
+
+def test_parquet_no_documents(tmp_path: Path) -> None:
+    parquet = pytest.importorskip("pyarrow.parquet")
+    source = tmp_path / "texts.jsonl"
+    source.write_text("", encoding="utf-8")
+    output = tmp_path / "scores.parquet"
+
+    status = cli.main(
+        [str(source), "-m", ",".join(METRICS), "--id-field", "id"]
+        + ["-o", str(output)]
+    )
+
+    assert status == 0
+    table = parquet.read_table(output)
+    assert table.num_rows == 0
+    assert table.column_names == ["id"] + METRICS
+
+
+@pytest.mark.parametrize(
+    "args",
+    [
+        ["-m", "not_a_metric"],
+        ["--batch-size", "0"],
+        ["-t", "parquet"],
+        ["--document", "file", "-i", "csv"],
+    ],
+)
+def test_invalid_arguments(args: list[str]) -> None:
+    with pytest.raises(SystemExit) as e:
+        cli.main(args)
+    assert e.value.code == 2
+
+
+def test_invalid_input(tmp_path: Path, capsys: pytest.CaptureFixture[str]) -> None:
+    source = tmp_path / "texts.jsonl"
+    source.write_text('{"body": "no text field"}\n', encoding="utf-8")
+
+    assert cli.main([str(source)]) == 1
+    assert "no text in 'text'" in capsys.readouterr().err
+
+
+def test_invalid_output(jsonl_file: Path, capsys: pytest.CaptureFixture[str]) -> None:
+    output = jsonl_file.parent / "missing" / "scores.jsonl"
+
+    assert cli.main([str(jsonl_file), "-o", str(output)]) == 1
+    assert "No such file or directory" in capsys.readouterr().err
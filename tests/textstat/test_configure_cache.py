@@ -0,0 +1,22 @@
+from __future__ import annotations
+
+from textstat import textstat
+from textstat.backend import counts
+from ..backend import resources
+
+
+def test_configure_cache() -> None:
+    try:
+        textstat.configure_cache(key="digest", disable=["metrics"])
+        assert textstat.lexicon_count(resources.LONG_TEXT) == counts.count_words(
+            resources.LONG_TEXT
+        )
+    finally:
+        textstat.configure_cache()
+
+
+def test_cache_info_and_clear() -> None:
+    textstat.lexicon_count(resources.LONG_TEXT)
+    assert textstat.cache_info("counts")["counts.count_words"].currsize > 0
+    textstat.cache_clear("counts")
+    assert textstat.cache_info("counts")["counts.count_words"].currsize == 0
@@ -0,0 +1,58 @@
+from __future__ import annotations
+
+import subprocess
+import sys
+
+import pytest
+
+# Cumulative `python -X importtime` budget of `import textstat`, in microseconds.
+# Importing NLTK alone takes longer than this.
+IMPORT_TIME_BUDGET_US = 150_000
+
+
+def run_python(code: str, *args: str) -> subprocess.CompletedProcess[str]:
+    return subprocess.run(
+        [sys.executable, *args, "-c", code],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+
+
+def test_import_time() -> None:
+    times = []
+    for _ in range(3):
+        stderr = run_python("import textstat", "-X", "importtime").stderr
+        line = next(
+            line for line in stderr.splitlines() if line.endswith("| textstat")
+        )
+        times.append(int(line.split("|")[1]))
+
+    assert min(times) < IMPORT_TIME_BUDGET_US
+
+
+def test_import_does_not_import_nltk_or_pyphen() -> None:
+    code = "import sys, textstat; print(sorted({'nltk', 'pyphen'} & set(sys.modules)))"
+
+    assert run_python(code).stdout.strip() == "[]"
+
+
+@pytest.mark.parametrize(
+    "metric",
+    [
+        "coleman_liau_index",
+        "automated_readability_index",
+        "lix",
+        "flesch_reading_ease",
+        "dale_chall_readability_score",
+    ],
+)
+def test_metric_does_not_import_nltk(metric: str) -> None:
+    # Sentences are split by NLTK Punkt unless the "fast" engine is used
+    code = (
+        "import sys, textstat; textstat.set_sentence_engine('fast'); "
+        f"textstat.{metric}('The quick brown fox. It jumps over the lazy dog.'); "
+        "print('nltk' in sys.modules)"
+    )
+
+    assert run_python(code).stdout.strip() == "False"
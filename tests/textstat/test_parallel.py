@@ -0,0 +1,42 @@
+from __future__ import annotations
+
+from array import array
+
+import pytest
+
+from textstat import parallel
+from textstat.backend import analysis
+from ..backend import resources
+
+TEXTS = [
+    resources.SHORT_TEXT,
+    resources.LONG_TEXT,
+    resources.EMPTY_STR,
+    resources.PUNCT_TEXT,
+    resources.EASY_TEXT,
+] * 3
+METRICS = ["flesch_reading_ease", "dale_chall_readability_score", "count_words"]
+
+
+@pytest.mark.parametrize("chunksize", [1, 2, 64])
+def test_score(chunksize: int) -> None:
+    columns = parallel.score(TEXTS, METRICS, workers=2, chunksize=chunksize)
+
+    assert columns == analysis.score_many(TEXTS, METRICS, "en_US")
+
+
+def test_score_generator() -> None:
+    columns = parallel.score(
+        (text for text in TEXTS), METRICS, workers=2, chunksize=1, output="array"
+    )
+
+    assert columns["count_words"] == array(
+        "d", analysis.score_many(TEXTS, ["count_words"], "en_US")["count_words"]
+    )
+
+
+def test_score_invalid() -> None:
+    with pytest.raises(ValueError):
+        parallel.score(TEXTS, ["not_a_metric"], workers=2)
+    with pytest.raises(ValueError):
+        parallel.score(TEXTS, METRICS, workers=2, chunksize=0)
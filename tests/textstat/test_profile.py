@@ -0,0 +1,19 @@
+from __future__ import annotations
+
+from textstat import textstat
+from ..backend import resources
+
+
+def test_profile() -> None:
+    ts = type(textstat)()
+    ts.set_lang("en_US")
+    ts.set_rounding_points(2)
+    sections = [resources.LONG_TEXT, resources.EASY_TEXT]
+
+    columns = ts.profile(
+        "\n\n".join(sections), ["flesch_kincaid_grade"], window=1, unit="paragraph"
+    )
+
+    assert list(columns["flesch_kincaid_grade"]) == [
+        ts.flesch_kincaid_grade(section) for section in sections
+    ]
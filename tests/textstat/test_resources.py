@@ -0,0 +1,42 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+import nltk
+import pytest
+
+from textstat import resources
+
+
+def test_required() -> None:
+    assert resources.required() == ["punkt_tab"]
+
+
+def test_ensure() -> None:
+    resources.ensure()
+    resources.ensure(["cmudict", "punkt_tab"])
+
+
+def test_ensure_missing(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> None:
+    monkeypatch.setattr(nltk.data, "path", [str(tmp_path)])
+
+    with pytest.raises(LookupError, match="punkt_tab"):
+        resources.ensure(["punkt_tab"])
+
+
+def test_ensure_unknown() -> None:
+    with pytest.raises(ValueError):
+        resources.ensure(["not_a_resource"])
+
+
+def test_add_data_path(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> None:
+    monkeypatch.setattr(nltk.data, "path", ["a", str(tmp_path)])
+
+    resources.add_data_path(tmp_path)
+
+    assert nltk.data.path == [str(tmp_path), "a"]
+
+
+@pytest.mark.parametrize("lang", ["en_US", "es", "ar"])
+def test_preload(lang: str) -> None:
+    resources.preload(lang)
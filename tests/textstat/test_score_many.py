@@ -0,0 +1,18 @@
+from __future__ import annotations
+
+from textstat import textstat
+from ..backend import resources
+
+
+def test_score_many() -> None:
+    ts = type(textstat)()
+    ts.set_lang("en_US")
+    ts.set_rounding_points(2)
+    texts = [resources.SHORT_TEXT, resources.LONG_TEXT]
+
+    columns = ts.score_many(texts, ["gunning_fog", "coleman_liau_index"])
+
+    assert columns["gunning_fog"] == [ts.gunning_fog(text) for text in texts]
+    assert columns["coleman_liau_index"] == [
+        ts.coleman_liau_index(text) for text in texts
+    ]
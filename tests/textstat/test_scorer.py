@@ -0,0 +1,64 @@
+from __future__ import annotations
+
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+import textstat
+from ..backend import resources
+
+METRICS = ["flesch_reading_ease", "syllable_count", "gunning_fog", "text_standard"]
+
+
+@pytest.mark.parametrize(
+    "lang, text",
+    [
+        ("en_US", resources.LONG_TEXT),
+        ("es_ES", resources.LONG_SPANISH_TEXT),
+        ("it_IT", resources.ITALIAN_TEXT),
+    ],
+)
+def test_scorer(lang: str, text: str) -> None:
+    ts = type(textstat.textstat)()
+    ts.set_lang(lang)
+    ts.set_rounding_points(2)
+    scorer = textstat.Scorer(lang=lang, round_points=2)
+
+    for metric in METRICS:
+        assert getattr(scorer, metric)(text) == getattr(ts, metric)(text)
+
+
+def test_scorer_is_immutable() -> None:
+    scorer = textstat.Scorer(lang="es_ES", round_points=2)
+
+    for setter, value in [
+        (scorer.set_lang, "en_US"),
+        (scorer.set_rounding_points, 1),
+        (scorer.set_rm_apostrophe, False),
+    ]:
+        with pytest.raises(AttributeError):
+            setter(value)
+    with pytest.raises(AttributeError):
+        scorer.lang = "en_US"  # type: ignore[misc]
+    assert (scorer.lang, scorer.round_points, scorer.rm_apostrophe) == (
+        "es_ES",
+        2,
+        True,
+    )
+    assert repr(scorer) == "Scorer(lang='es_ES', round_points=2, rm_apostrophe=True)"
+
+
+def test_scorer_threads() -> None:
+    jobs = [
+        (textstat.Scorer(lang="en_US"), resources.LONG_TEXT),
+        (textstat.Scorer(lang="es_ES"), resources.LONG_SPANISH_TEXT),
+        (textstat.Scorer(lang="de_DE"), resources.GERMAN_SAMPLE_A),
+    ] * 20
+
+    def score(job: tuple[textstat.Scorer, str]) -> list[float]:
+        scorer, text = job
+        return [scorer.flesch_reading_ease(text), scorer.syllable_count(text)]
+
+    expected = [score(job) for job in jobs]
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        assert list(executor.map(score, jobs)) == expected
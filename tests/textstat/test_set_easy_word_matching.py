@@ -0,0 +1,39 @@
+from __future__ import annotations
+
+import pytest
+from textstat import textstat
+from ..backend import resources
+
+
+@pytest.mark.parametrize(
+    "text", [resources.LONG_TEXT, resources.EASY_TEXT, resources.PUNCT_TEXT]
+)
+def test_set_easy_word_matching(text: str) -> None:
+    ts = type(textstat)()
+    exact_count = ts.difficult_words(text)
+    try:
+        ts.set_easy_word_matching("inflections")
+        inflected_count = ts.difficult_words(text)
+        assert inflected_count < exact_count
+        assert ts.dale_chall_readability_score(text) == pytest.approx(
+            ts.analyze(text).dale_chall_readability_score()
+        )
+        assert ts.analyze(text).count_difficult_words(unique=True) == inflected_count
+    finally:
+        ts.set_easy_word_matching("exact")
+    assert ts.difficult_words(text) == exact_count
+
+
+def test_set_easy_word_matching_inflections() -> None:
+    ts = type(textstat)()
+    text = "The teachers were happily laughing at the funniest stories."
+    try:
+        ts.set_easy_word_matching("inflections")
+        assert ts.difficult_words(text) == 0
+    finally:
+        ts.set_easy_word_matching("exact")
+    assert sorted(ts.difficult_words_list(text)) == [
+        "funniest",
+        "laughing",
+        "teachers",
+    ]
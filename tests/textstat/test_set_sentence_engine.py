@@ -0,0 +1,18 @@
+from __future__ import annotations
+
+import pytest
+from textstat import textstat
+from ..backend import resources
+
+
+@pytest.mark.parametrize(
+    "text", [resources.LONG_TEXT, resources.EASY_TEXT, resources.PUNCT_TEXT]
+)
+def test_set_sentence_engine(text: str) -> None:
+    ts = type(textstat)()
+    punkt_scores = ts.sentence_count(text), ts.smog_index(text)
+    try:
+        ts.set_sentence_engine("fast")
+        assert (ts.sentence_count(text), ts.smog_index(text)) == punkt_scores
+    finally:
+        ts.set_sentence_engine("punkt")
@@ -0,0 +1,42 @@
+from __future__ import annotations
+
+import io
+
+import pytest
+
+import textstat
+from textstat.backend import analysis
+from ..backend import resources
+
+TEXT = "\n\n".join([resources.LONG_TEXT, resources.EASY_TEXT] * 20)
+METRICS = ["flesch_reading_ease", "gunning_fog", "count_sentences"]
+
+
+def test_analyze_file() -> None:
+    streamed = textstat.stream.analyze(io.StringIO(TEXT))
+
+    assert isinstance(streamed, analysis.StreamAnalysis)
+    assert streamed.count_words() == analysis.analyze(TEXT, "en_US").count_words()
+
+
+def test_score() -> None:
+    scores = textstat.stream.score(iter(TEXT.splitlines(True)), METRICS)
+
+    doc = analysis.analyze(TEXT, "en_US")
+    assert scores == pytest.approx(
+        {metric: getattr(doc, metric)() for metric in METRICS}
+    )
+
+
+def test_score_round_points() -> None:
+    scores = textstat.stream.score([TEXT], ["lix"], round_points=1)
+
+    assert scores == {"lix": round(analysis.analyze(TEXT, "en_US").lix(), 1)}
+
+
+def test_score_invalid() -> None:
+    source = io.StringIO(TEXT)
+
+    with pytest.raises(ValueError):
+        textstat.stream.score(source, ["not_a_metric"])
+    assert source.tell() == 0
@@ -1,14 +1,38 @@
-from .textstat import textstat
+from typing import Any
+
+from .textstat import textstat, Scorer
+from .backend.analysis import IncrementalDocument
 from . import backend
+from . import parallel
+from . import resources
+from . import stream
 
 
 __version__ = (0, 7, 12)
 
 
+def __getattr__(name: str) -> Any:
+    # asyncio and concurrent.futures are only imported when `aio` is first used
+    if name == "aio":
+        import importlib
+
+        return importlib.import_module(f"{__name__}.aio")
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
 for attribute in dir(textstat):
     if callable(getattr(textstat, attribute)):
         if not attribute.startswith("_"):
             globals()[attribute] = getattr(textstat, attribute)
 
 
-__all__ = ["textstat", "backend"]
+__all__ = [
+    "textstat",
+    "Scorer",
+    "IncrementalDocument",
+    "aio",
+    "backend",
+    "parallel",
+    "resources",
+    "stream",
+]
@@ -0,0 +1,451 @@
+from __future__ import annotations
+
+import asyncio
+import os
+import threading
+import weakref
+from typing import Any, Callable, Iterable, TYPE_CHECKING
+
+from . import parallel, resources
+from .backend import analysis, selections, utils
+
+if TYPE_CHECKING:
+    from concurrent.futures import Executor
+
+KINDS = ("thread", "process")
+
+
+class Pool:
+    """A bounded executor scoring texts for asyncio code.
+
+    The scoring runs in a pool of threads or processes whose workers load the
+    resources needed for `lang` when they start, so that awaiting a score does
+    not block the event loop. Concurrent `analyze` and `score` calls made
+    within `batch_delay` seconds of each other are sent to the pool together,
+    at most `batch_size` texts at a time. At most `max_pending` batches are in
+    the pool at once; the other calls wait, which applies backpressure to
+    their callers. Cancelling a call that is still waiting drops its text.
+
+    Parameters
+    ----------
+    workers : int or None, optional
+        The number of workers. The default is None (one per CPU).
+    kind : str, optional
+        "thread" (default) or "process". Process pools score texts in parallel,
+        but the texts and results are pickled to and from the workers.
+    lang : str, optional
+        The language whose resources the workers load when they start. The
+        default is "en_US".
+    batch_size : int, optional
+        The maximum number of texts sent to a worker at once. The default
+        is 32.
+    batch_delay : float, optional
+        How long to wait for other calls before sending a batch, in seconds.
+        The default is 0.002.
+    max_pending : int or None, optional
+        The maximum number of batches in the pool at once. The default is None
+        (twice the number of workers).
+
+    """
+
+    def __init__(
+        self,
+        workers: int | None = None,
+        kind: str = "thread",
+        lang: str = "en_US",
+        batch_size: int = 32,
+        batch_delay: float = 0.002,
+        max_pending: int | None = None,
+    ) -> None:
+        if kind not in KINDS:
+            raise ValueError(f"kind must be one of {KINDS}, got {kind!r}")
+        if batch_size < 1:
+            raise ValueError("batch_size must be at least 1")
+        self.workers = workers or os.cpu_count() or 1
+        self.kind = kind
+        self.lang = lang
+        self.batch_size = batch_size
+        self.batch_delay = batch_delay
+        self.max_pending = max_pending or 2 * self.workers
+        if self.max_pending < 1:
+            raise ValueError("max_pending must be at least 1")
+        self._executor: Executor | None = None
+        self._lock = threading.Lock()
+        self._closed = False
+        # The semaphores and open batches belong to the event loop using them
+        self._loops: weakref.WeakKeyDictionary[
+            asyncio.AbstractEventLoop, _LoopState
+        ] = weakref.WeakKeyDictionary()
+
+    async def __aenter__(self) -> Pool:
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        await self.aclose()
+
+    @property
+    def executor(self) -> Executor:
+        """The executor of the pool, started on first use."""
+        with self._lock:
+            if self._closed:
+                raise RuntimeError("the pool is closed")
+            if self._executor is None:
+                self._executor = self._start()
+            return self._executor
+
+    def _start(self) -> Executor:
+        from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+        if self.kind == "thread":
+            # The threads share the settings of the process, which must not be
+            # reset to the values they had when the pool was created
+            return ThreadPoolExecutor(
+                max_workers=self.workers,
+                initializer=_init_thread,
+                initargs=(self.lang,),
+            )
+        return ProcessPoolExecutor(
+            max_workers=self.workers,
+            initializer=parallel._init_worker,
+            initargs=(
+                self.lang,
+                selections.get_sentence_engine(),
+                utils.get_easy_word_matching(),
+            ),
+        )
+
+    def close(self, wait: bool = True) -> None:
+        """Shut the executor down. The pool cannot be used afterwards."""
+        with self._lock:
+            self._closed = True
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=wait)
+
+    async def aclose(self) -> None:
+        """Shut the executor down without blocking the event loop."""
+        await asyncio.get_running_loop().run_in_executor(None, self.close)
+
+    async def analyze(
+        self, text: str, lang: str | None = None
+    ) -> analysis.DocumentAnalysis:
+        """Analyse `text` in the pool, see `textstat.analyze`.
+
+        Parameters
+        ----------
+        text : str
+            A text string.
+        lang : str or None, optional
+            The language of the text. The default is None (the language of the
+            pool).
+
+        Returns
+        -------
+        DocumentAnalysis
+            The analysis of `text`, its syllables and easy words already
+            looked up in the pool.
+
+        """
+        lang = lang if lang is not None else self.lang
+        return await self._batched(_analyze_chunk, (lang,), text)
+
+    async def score(
+        self,
+        text: str,
+        metrics: Iterable[str],
+        lang: str | None = None,
+        round_points: int | None = None,
+    ) -> dict[str, float]:
+        """Score `text` with some metrics in the pool.
+
+        Parameters
+        ----------
+        text : str
+            A text string.
+        metrics : Iterable[str]
+            The names of the metrics to compute, see `textstat.score_many`.
+        lang : str or None, optional
+            The language of the text. The default is None (the language of the
+            pool).
+        round_points : int or None, optional
+            The number of decimals to round the scores to. The default is None
+            (no rounding).
+
+        Returns
+        -------
+        dict[str, float]
+            The score of every metric.
+
+        """
+        metrics = tuple(metrics)
+        # Fail in the caller rather than for the whole batch
+        for metric in metrics:
+            analysis.get_scorer(metric)
+        lang = lang if lang is not None else self.lang
+        return await self._batched(
+            _score_rows, (metrics, lang, round_points), text
+        )
+
+    async def score_many(
+        self,
+        texts: Iterable[str],
+        metrics: Iterable[str],
+        lang: str | None = None,
+        output: str = "list",
+        round_points: int | None = None,
+    ) -> dict[str, Any]:
+        """Score many texts with the same metrics in the pool.
+
+        The texts are sent to the workers in batches of `batch_size`.
+
+        Parameters
+        ----------
+        texts : Iterable[str]
+            The text strings.
+        metrics : Iterable[str]
+            The names of the metrics to compute, see `textstat.score_many`.
+        lang : str or None, optional
+            The language of the texts. The default is None (the language of the
+            pool).
+        output : str, optional
+            The type of the columns: "list" (default), "array" or "numpy".
+        round_points : int or None, optional
+            The number of decimals to round the scores to. The default is None
+            (no rounding).
+
+        Returns
+        -------
+        dict[str, Any]
+            One column per metric, holding the scores of the texts in input
+            order.
+
+        """
+        metrics = list(metrics)
+        if output not in analysis.OUTPUTS:
+            raise ValueError(
+                f"output must be one of {analysis.OUTPUTS}, got {output!r}"
+            )
+        for metric in metrics:
+            analysis.get_scorer(metric)
+        lang = lang if lang is not None else self.lang
+
+        chunks = await asyncio.gather(
+            *(
+                self._submit(
+                    parallel._score_chunk, chunk, metrics, lang, round_points
+                )
+                for chunk in parallel._chunks(texts, self.batch_size)
+            )
+        )
+        columns: dict[str, list[float]] = {metric: [] for metric in metrics}
+        for chunk_columns in chunks:
+            parallel._extend(columns, chunk_columns)
+        return analysis.to_columns(columns, output)
+
+    def _state(self) -> _LoopState:
+        loop = asyncio.get_running_loop()
+        state = self._loops.get(loop)
+        if state is None:
+            state = self._loops[loop] = _LoopState(self.max_pending)
+        return state
+
+    async def _submit(self, func: Callable[..., Any], *args: Any) -> Any:
+        """Run `func(*args)` in the executor once fewer than `max_pending`
+        batches are in it."""
+        loop = asyncio.get_running_loop()
+        async with self._state().semaphore:
+            return await loop.run_in_executor(self.executor, func, *args)
+
+    async def _batched(
+        self, func: Callable[..., list[Any]], args: tuple[Any, ...], text: str
+    ) -> Any:
+        """Add `text` to the open batch of `func(texts, *args)` and wait for its
+        result."""
+        loop = asyncio.get_running_loop()
+        state = self._state()
+        key = (func, args)
+        batch = state.batches.get(key)
+        if batch is None:
+            batch = state.batches[key] = []
+            loop.call_later(self.batch_delay, self._flush, state, key, batch)
+        future = loop.create_future()
+        batch.append((text, future))
+        if len(batch) >= self.batch_size:
+            self._flush(state, key, batch)
+        return await future
+
+    def _flush(
+        self,
+        state: _LoopState,
+        key: tuple[Callable[..., list[Any]], tuple[Any, ...]],
+        batch: list[tuple[str, asyncio.Future[Any]]],
+    ) -> None:
+        """Close `batch` and send it to the executor."""
+        if state.batches.get(key) is not batch:
+            # Already sent when it filled up
+            return
+        del state.batches[key]
+        task = asyncio.ensure_future(self._run_batch(key, batch))
+        state.tasks.add(task)
+        task.add_done_callback(state.tasks.discard)
+
+    async def _run_batch(
+        self,
+        key: tuple[Callable[..., list[Any]], tuple[Any, ...]],
+        batch: list[tuple[str, asyncio.Future[Any]]],
+    ) -> None:
+        func, args = key
+        async with self._state().semaphore:
+            # Drop the texts whose callers stopped waiting
+            batch = [(text, future) for text, future in batch if not future.done()]
+            if not batch:
+                return
+            try:
+                results = await asyncio.get_running_loop().run_in_executor(
+                    self.executor, func, [text for text, _ in batch], *args
+                )
+            except Exception as e:
+                # The pool itself failed, e.g. it was closed or a worker died
+                for _, future in batch:
+                    if not future.done():
+                        future.set_exception(e)
+                return
+        for (_, future), result in zip(batch, results):
+            if future.done():
+                continue
+            if isinstance(result, Exception):
+                future.set_exception(result)
+            else:
+                future.set_result(result)
+
+
+class _LoopState:
+    """The state of a pool within one event loop."""
+
+    def __init__(self, max_pending: int) -> None:
+        self.semaphore = asyncio.Semaphore(max_pending)
+        self.batches: dict[
+            tuple[Callable[..., list[Any]], tuple[Any, ...]],
+            list[tuple[str, asyncio.Future[Any]]],
+        ] = {}
+        # Keep the batch tasks alive until they are done
+        self.tasks: set[asyncio.Future[None]] = set()
+
+
+def _init_thread(lang: str) -> None:
+    """Load the resources used to score texts in `lang` in a thread, leaving the
+    settings of the process as they are."""
+    try:
+        resources.preload(lang)
+    except LookupError:
+        # Missing NLTK data, the metrics needing it will raise when used
+        pass
+
+
+def _analyze_chunk(
+    texts: list[str], lang: str
+) -> list[analysis.DocumentAnalysis | Exception]:
+    """Analyse a batch of texts in a worker, returning the analysis of every
+    text or the error it raised."""
+    results: list[analysis.DocumentAnalysis | Exception] = []
+    # The lazy statistics are computed here, not on the event loop when the
+    # caller reads a metric
+    syllables = utils.has_pyphen(lang)
+    for text in texts:
+        try:
+            doc = analysis.analyze(text, lang)
+            if syllables:
+                doc.syllables
+            doc.easy_flags
+            doc.spache_easy_flags
+            results.append(doc)
+        except Exception as e:
+            results.append(e)
+    return results
+
+
+def _score_rows(
+    texts: list[str],
+    metrics: tuple[str, ...],
+    lang: str,
+    round_points: int | None,
+) -> list[dict[str, float] | Exception]:
+    """Score a batch of texts in a worker, returning the scores of every text
+    or the error it raised."""
+    rows: list[dict[str, float] | Exception] = []
+    for text in texts:
+        try:
+            columns = analysis.score_many(
+                [text], metrics, lang, round_points=round_points
+            )
+        except Exception as e:
+            rows.append(e)
+        else:
+            rows.append({metric: columns[metric][0] for metric in metrics})
+    return rows
+
+
+_pool: Pool | None = None
+_pool_lock = threading.Lock()
+
+
+def get_pool() -> Pool:
+    """Get the pool used by the functions of this module, created on first use
+    with the default settings of `Pool`."""
+    global _pool
+    with _pool_lock:
+        if _pool is None:
+            _pool = Pool()
+        return _pool
+
+
+def configure(**kwargs: Any) -> Pool:
+    """Replace the pool used by the functions of this module.
+
+    The previous pool is closed once its pending work is done.
+
+    Parameters
+    ----------
+    **kwargs
+        The arguments of `Pool`.
+
+    Returns
+    -------
+    Pool
+        The new pool.
+
+    """
+    global _pool
+    pool = Pool(**kwargs)
+    with _pool_lock:
+        previous, _pool = _pool, pool
+    if previous is not None:
+        previous.close(wait=False)
+    return pool
+
+
+async def analyze(text: str, lang: str | None = None) -> analysis.DocumentAnalysis:
+    """Analyse `text` without blocking the event loop, see `Pool.analyze`."""
+    return await get_pool().analyze(text, lang)
+
+
+async def score(
+    text: str,
+    metrics: Iterable[str],
+    lang: str | None = None,
+    round_points: int | None = None,
+) -> dict[str, float]:
+    """Score `text` without blocking the event loop, see `Pool.score`."""
+    return await get_pool().score(text, metrics, lang, round_points)
+
+
+async def score_many(
+    texts: Iterable[str],
+    metrics: Iterable[str],
+    lang: str | None = None,
+    output: str = "list",
+    round_points: int | None = None,
+) -> dict[str, Any]:
+    """Score many texts without blocking the event loop, see
+    `Pool.score_many`."""
+    return await get_pool().score_many(texts, metrics, lang, output, round_points)
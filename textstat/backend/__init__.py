@@ -3,6 +3,7 @@ from . import metrics
 from . import selections
 from . import transformations
 from . import validations
+from . import analysis
 
 
 __all__ = [
@@ -11,4 +12,5 @@ __all__ = [
     "selections",
     "transformations",
     "validations",
+    "analysis",
 ]
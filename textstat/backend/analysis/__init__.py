@@ -0,0 +1,24 @@
+from ._analyze import analyze
+from ._analyze_stream import StreamAnalyzer, analyze_stream
+from ._base_analysis import BaseAnalysis
+from ._document_analysis import DocumentAnalysis
+from ._incremental_document import IncrementalDocument
+from ._profile import UNITS, profile
+from ._score_many import OUTPUTS, get_scorer, score_many, to_columns
+from ._stream_analysis import StreamAnalysis
+
+__all__ = [
+    "analyze",
+    "analyze_stream",
+    "BaseAnalysis",
+    "DocumentAnalysis",
+    "IncrementalDocument",
+    "OUTPUTS",
+    "get_scorer",
+    "profile",
+    "score_many",
+    "StreamAnalysis",
+    "StreamAnalyzer",
+    "to_columns",
+    "UNITS",
+]
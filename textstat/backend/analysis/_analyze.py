@@ -0,0 +1,52 @@
+from __future__ import annotations
+
+from typing import Sequence
+
+from ..selections._list_sentences import list_sentences
+from ..selections._list_words import list_words
+from ._document_analysis import DocumentAnalysis
+
+
+def analyze(text: str, lang: str) -> DocumentAnalysis:
+    """Tokenize `text` once and gather the statistics every metric is built from.
+
+    Parameters
+    ----------
+    text : str
+        A text string.
+    lang : str
+        The language of the text.
+
+    Returns
+    -------
+    DocumentAnalysis
+        The analysis of `text`, exposing every count and metric as a method.
+
+    """
+    return analyze_sentences(text, lang, list_sentences(text))
+
+
+def analyze_sentences(
+    text: str, lang: str, sentences: Sequence[str]
+) -> DocumentAnalysis:
+    """Like `analyze`, for a text that has already been split into sentences."""
+    words = list_words(text)
+    raw_words = list_words(text, rm_punctuation=False)
+    # The words without apostrophes are the words without the contraction
+    # apostrophes they kept, and their letters are all the letters of the text
+    letter_lengths = tuple(
+        length
+        for length in (len(word) - word.count("'") for word in words)
+        if length
+    )
+    return DocumentAnalysis(
+        text=text,
+        lang=lang,
+        words=tuple(words),
+        raw_words=tuple(raw_words),
+        letter_lengths=letter_lengths,
+        sentences=tuple(sentences),
+        # Em dashes split the raw words but are not whitespace
+        char_count=sum(map(len, raw_words)) + text.count("—"),
+        letter_count=sum(letter_lengths),
+    )
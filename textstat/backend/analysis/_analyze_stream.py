@@ -0,0 +1,225 @@
+from __future__ import annotations
+
+import re
+from collections import Counter
+from typing import Iterable
+
+from ..selections._list_sentences import list_sentences
+from ..transformations._remove_punctuation import remove_punctuation
+from ..utils._get_pyphen import has_pyphen
+from ..utils.constants import STREAM_MAX_SEGMENT_CHARS, STREAM_SEGMENT_CHARS
+from ._analyze import analyze_sentences
+from ._stream_analysis import StreamAnalysis
+
+# The whitespace before the last word of a text, where an overlong sentence is
+# cut (the last word may end the sentence)
+RE_LAST_SPACE = re.compile(r"\s+(?=\S+\s*$)")
+
+
+class StreamAnalyzer:
+    """Analyse a document fed chunk by chunk, without holding it in memory.
+
+    Chunks are buffered until the buffer holds at least `segment_chars`
+    characters. The buffer is then split into sentences: all but the last
+    sentence (which may continue in the next chunk) are analysed and added to
+    the running totals, and only the last sentence is kept. Words and sentences
+    may therefore span chunk boundaries.
+
+    The buffer holds at most about `max_segment_chars` characters, but the
+    distinct difficult words (for the unique counts) are kept, so the memory
+    used is O(vocabulary) rather than O(length) of the document.
+
+    Parameters
+    ----------
+    lang : str
+        The language of the text.
+    segment_chars : int, optional
+        The number of characters to buffer before analysing whole sentences.
+    max_segment_chars : int, optional
+        The length at which a sentence is cut at its last space, so that text
+        without sentence boundaries does not fill the memory.
+    """
+
+    def __init__(
+        self,
+        lang: str,
+        segment_chars: int = STREAM_SEGMENT_CHARS,
+        max_segment_chars: int = STREAM_MAX_SEGMENT_CHARS,
+    ) -> None:
+        if segment_chars < 1 or max_segment_chars < segment_chars:
+            raise ValueError(
+                "segment_chars must be at least 1 and at most max_segment_chars"
+            )
+        self.lang = lang
+        self.segment_chars = segment_chars
+        self.max_segment_chars = max_segment_chars
+        self._syllables = has_pyphen(lang)
+
+        self._chunks: list[str] = []
+        self._buffered = 0
+        self._flush_at = segment_chars
+        # Whether the start of the buffer continues a sentence cut at a space
+        self._open_sentence = False
+        self._closed = False
+
+        self._text_length = 0
+        self._char_count = 0
+        self._letter_count = 0
+        self._word_count = 0
+        self._raw_word_count = 0
+        self._sentence_count = 0
+        self._syllable_counts: Counter[int] = Counter()
+        self._letter_length_counts: Counter[int] = Counter()
+        self._difficult_syllable_counts: Counter[int] = Counter()
+        self._difficult_words: dict[str, int] = {}
+        self._spache_difficult_count = 0
+        self._spache_difficult_words: set[str] = set()
+        self._head_raw_words: list[str] = []
+        self._head_words = 0
+        self._head_syllables: list[int] = []
+        self._arabic_counts = [0] * 7
+
+    def feed(self, chunk: str) -> None:
+        """Add the next chunk of the document.
+
+        Parameters
+        ----------
+        chunk : str
+            The next characters of the document.
+
+        Returns
+        -------
+        None
+        """
+        if self._closed:
+            raise ValueError("The analyzer is closed")
+        if not isinstance(chunk, str):
+            raise TypeError(f"Chunks must be str, got {type(chunk).__name__}")
+        self._text_length += len(chunk)
+        self._chunks.append(chunk)
+        self._buffered += len(chunk)
+        if self._buffered >= self._flush_at:
+            self._flush()
+
+    def close(self) -> StreamAnalysis:
+        """Analyse the rest of the document and get the totals.
+
+        Returns
+        -------
+        StreamAnalysis
+            The analysis of the whole document.
+        """
+        if not self._closed:
+            self._closed = True
+            text = "".join(self._chunks)
+            self._chunks.clear()
+            sentences = list_sentences(text)
+            if not sentences and self._open_sentence:
+                self._sentence_count += 1
+            self._add(text, sentences)
+            if self._sentence_count == 0 and self._char_count > 0:
+                # As `counts.count_sentences`, any text has at least one sentence
+                self._sentence_count = 1
+
+        return StreamAnalysis(
+            lang=self.lang,
+            text_length=self._text_length,
+            char_count=self._char_count,
+            letter_count=self._letter_count,
+            word_count=self._word_count,
+            raw_word_count=self._raw_word_count,
+            sentence_count=self._sentence_count,
+            syllable_counts=dict(self._syllable_counts),
+            letter_length_counts=dict(self._letter_length_counts),
+            difficult_syllable_counts=dict(self._difficult_syllable_counts),
+            difficult_words=dict(self._difficult_words),
+            spache_difficult_count=self._spache_difficult_count,
+            spache_difficult_words=frozenset(self._spache_difficult_words),
+            head_raw_words=tuple(self._head_raw_words),
+            head_syllables=tuple(self._head_syllables),
+            arabic_counts=tuple(self._arabic_counts),
+            syllables_counted=self._syllables,
+        )
+
+    def _flush(self) -> None:
+        text = "".join(self._chunks)
+        sentences = list_sentences(text)
+        # The last sentence is kept, it may continue in the next chunk
+        start = text.rfind(sentences[-1]) if len(sentences) > 1 else -1
+        if start > 0:
+            self._add(text[:start], sentences[:-1])
+            self._open_sentence = False
+        elif len(text) >= self.max_segment_chars:
+            match = RE_LAST_SPACE.search(text)
+            start = match.end() if match else len(text)
+            self._add(text[:start], [])
+            # Whitespace alone does not start a sentence
+            if not text[:start].isspace():
+                self._open_sentence = True
+        else:
+            # Wait for twice as much text before splitting the sentence again
+            self._chunks = [text]
+            self._flush_at = min(2 * len(text), self.max_segment_chars)
+            return
+        rest = text[start:]
+        self._chunks = [rest]
+        self._buffered = len(rest)
+        self._flush_at = self.segment_chars
+
+    def _add(self, text: str, sentences: list[str]) -> None:
+        doc = analyze_sentences(text, self.lang, sentences)
+
+        self._char_count += doc.char_count
+        self._letter_count += doc.letter_count
+        self._word_count += len(doc.words)
+        self._raw_word_count += len(doc.raw_words)
+        self._sentence_count += len(sentences)
+        self._letter_length_counts.update(doc.letter_lengths)
+
+        if self._syllables:
+            self._syllable_counts.update(doc.syllables)
+            for word, n_syll, easy in zip(doc.words, doc.syllables, doc.easy_flags):
+                if not easy:
+                    self._difficult_syllable_counts[n_syll] += 1
+                    self._difficult_words[word] = n_syll
+            self._head_syllables.extend(
+                doc.syllables[:101 - len(self._head_syllables)]
+            )
+        for word, easy in zip(doc.words, doc.spache_easy_flags):
+            if not easy:
+                self._spache_difficult_count += 1
+                self._spache_difficult_words.add(word)
+
+        # Linsear-Write only looks at the first 100 words
+        for word in doc.raw_words:
+            if self._head_words >= 100 and len(self._head_raw_words) > 100:
+                break
+            self._head_raw_words.append(word)
+            if remove_punctuation(word, rm_apostrophe=False):
+                self._head_words += 1
+
+        for i, count in enumerate(doc._arabic_parts()):
+            self._arabic_counts[i] += count
+
+
+def analyze_stream(chunks: Iterable[str], lang: str) -> StreamAnalysis:
+    """Analyse a document given as an iterable of text chunks, e.g. the lines
+    of a file, without holding it in memory.
+
+    Parameters
+    ----------
+    chunks : Iterable[str]
+        The consecutive pieces of the document.
+    lang : str
+        The language of the text.
+
+    Returns
+    -------
+    StreamAnalysis
+        The analysis of the document, exposing every count and metric as a
+        method.
+    """
+    analyzer = StreamAnalyzer(lang)
+    for chunk in chunks:
+        analyzer.feed(chunk)
+    return analyzer.close()
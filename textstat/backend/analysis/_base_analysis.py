@@ -0,0 +1,289 @@
+from __future__ import annotations
+
+import abc
+
+from ..metrics import _formulas
+from ..metrics._text_standard import consensus_grade
+from ..utils._get_lang_cfg import get_lang_cfg
+
+
+class BaseAnalysis(abc.ABC):
+    """The averages and metrics shared by `DocumentAnalysis` and
+    `StreamAnalysis`, computed from the counts the subclasses provide.
+
+    Every count and metric method gives the same result as the function of the
+    same name in `backend.counts` / `backend.metrics` called on the analysed
+    text.
+    """
+
+    lang: str
+
+    # Counts
+
+    @abc.abstractmethod
+    def count_words(self, rm_punctuation: bool = True) -> int:
+        """Count the number of words, see `counts.count_words`."""
+
+    @abc.abstractmethod
+    def count_sentences(self) -> int:
+        """Count the number of sentences, see `counts.count_sentences`."""
+
+    @abc.abstractmethod
+    def count_syllables(self) -> int:
+        """Count the number of syllables, see `counts.count_syllables`."""
+
+    @abc.abstractmethod
+    def count_chars(self, ignore_spaces: bool = True) -> int:
+        """Count the number of characters, see `counts.count_chars`."""
+
+    @abc.abstractmethod
+    def count_letters(self) -> int:
+        """Count the number of letters, see `counts.count_letters`."""
+
+    @abc.abstractmethod
+    def count_long_words(self, threshold: int = 6) -> int:
+        """Count words with more than `threshold` letters, see
+        `counts.count_long_words`."""
+
+    @abc.abstractmethod
+    def count_miniwords(self, max_size: int = 3) -> int:
+        """Count words with `max_size` letters or less, see
+        `counts.count_miniwords`."""
+
+    @abc.abstractmethod
+    def count_polysyllable_words(self) -> int:
+        """Count words with three or more syllables, see
+        `counts.count_polysyllable_words`."""
+
+    @abc.abstractmethod
+    def count_monosyllable_words(self) -> int:
+        """Count words with exactly one syllable, see
+        `counts.count_monosyllable_words`."""
+
+    @abc.abstractmethod
+    def count_difficult_words(
+        self, syllable_threshold: int = 2, unique: bool = False
+    ) -> int:
+        """Count the difficult words, see `counts.count_difficult_words`."""
+
+    @abc.abstractmethod
+    def count_spache_difficult_words(self, unique: bool = False) -> int:
+        """Count the Spache difficult words, see
+        `counts.count_spache_difficult_words`."""
+
+    @abc.abstractmethod
+    def _linsear_write_counts(self, strict_upper: bool) -> tuple[int, int, int, int]:
+        """The number of words, easy words, difficult words and sentences the
+        Linsear-Write metric is computed from."""
+
+    @abc.abstractmethod
+    def _arabic_counts(self) -> tuple[int, int, int, int]:
+        """The number of complex Arabic words, long Arabic words, Arabic
+        syllables and faseeh the Osman metric is computed from."""
+
+    # Averages
+
+    def words_per_sentence(self) -> float:
+        """See `metrics.words_per_sentence`."""
+        try:
+            return self.count_words() / self.count_sentences()
+        except ZeroDivisionError:
+            return 0.0
+
+    def sentences_per_word(self) -> float:
+        """See `metrics.sentences_per_word`."""
+        try:
+            return self.count_sentences() / self.count_words()
+        except ZeroDivisionError:
+            return 0.0
+
+    def syllables_per_word(self) -> float:
+        """See `metrics.syllables_per_word`."""
+        try:
+            return self.count_syllables() / self.count_words()
+        except ZeroDivisionError:
+            return 0.0
+
+    def chars_per_word(self, ignore_spaces: bool = True) -> float:
+        """See `metrics.chars_per_word`."""
+        try:
+            return self.count_chars(ignore_spaces) / self.count_words(
+                rm_punctuation=False
+            )
+        except ZeroDivisionError:
+            return 0.0
+
+    def letters_per_word(self) -> float:
+        """See `metrics.letters_per_word`."""
+        try:
+            return self.count_letters() / self.count_words()
+        except ZeroDivisionError:
+            return 0.0
+
+    # Metrics
+
+    def automated_readability_index(self) -> float:
+        """See `metrics.automated_readability_index`."""
+        return _formulas.automated_readability_index(
+            self.chars_per_word(), self.words_per_sentence()
+        )
+
+    def coleman_liau_index(self) -> float:
+        """See `metrics.coleman_liau_index`."""
+        return _formulas.coleman_liau_index(
+            self.letters_per_word(), self.sentences_per_word()
+        )
+
+    def crawford(self) -> float:
+        """See `metrics.crawford`."""
+        return _formulas.crawford(self.sentences_per_word(), self.syllables_per_word())
+
+    def dale_chall_readability_score(self) -> float:
+        """See `metrics.dale_chall_readability_score`."""
+        return _formulas.dale_chall_readability_score(
+            self.count_words(),
+            self.count_difficult_words(syllable_threshold=2, unique=True),
+            self.words_per_sentence(),
+        )
+
+    def dale_chall_readability_score_v2(self) -> float:
+        """See `metrics.dale_chall_readability_score_v2`."""
+        return _formulas.dale_chall_readability_score_v2(
+            self.count_words(),
+            self.count_difficult_words(unique=True),
+            self.words_per_sentence(),
+        )
+
+    def new_dale_chall_readability_score(self) -> float:
+        """See `metrics.new_dale_chall_readability_score`."""
+        return _formulas.new_dale_chall_readability_score(
+            self.count_words(),
+            self.count_difficult_words(syllable_threshold=2, unique=True),
+            self.count_sentences(),
+        )
+
+    def fernandez_huerta(self) -> float:
+        """See `metrics.fernandez_huerta`."""
+        return _formulas.fernandez_huerta(
+            self.words_per_sentence(), self.syllables_per_word()
+        )
+
+    def flesch_kincaid_grade(self) -> float:
+        """See `metrics.flesch_kincaid_grade`."""
+        return _formulas.flesch_kincaid_grade(
+            self.words_per_sentence(), self.syllables_per_word()
+        )
+
+    def flesch_reading_ease(self) -> float:
+        """See `metrics.flesch_reading_ease`."""
+        return _formulas.flesch_reading_ease(
+            self.words_per_sentence(), self.syllables_per_word(), self.lang
+        )
+
+    def gulpease_index(self) -> float:
+        """See `metrics.gulpease_index`."""
+        return _formulas.gulpease_index(
+            self.sentences_per_word(), self.chars_per_word()
+        )
+
+    def gunning_fog(self) -> float:
+        """See `metrics.gunning_fog`."""
+        syllable_threshold = int(get_lang_cfg(self.lang, "syllable_threshold"))
+        return _formulas.gunning_fog(
+            self.count_words(),
+            self.count_difficult_words(syllable_threshold, unique=True),
+            self.words_per_sentence(),
+        )
+
+    def gutierrez_polini(self) -> float:
+        """See `metrics.gutierrez_polini`."""
+        return _formulas.gutierrez_polini(
+            self.letters_per_word(), self.words_per_sentence()
+        )
+
+    def linsear_write_formula(
+        self, strict_lower: bool = False, strict_upper: bool = True
+    ) -> float:
+        """See `metrics.linsear_write_formula`."""
+        return _formulas.linsear_write_formula(
+            *self._linsear_write_counts(strict_upper), strict_lower
+        )
+
+    def lix(self) -> float:
+        """See `metrics.lix`."""
+        return _formulas.lix(
+            self.count_words(), self.count_long_words(), self.words_per_sentence()
+        )
+
+    def mcalpine_eflaw(self) -> float:
+        """See `metrics.mcalpine_eflaw`."""
+        return _formulas.mcalpine_eflaw(
+            self.count_words(), self.count_miniwords(max_size=3), self.count_sentences()
+        )
+
+    def osman(self) -> float:
+        """See `metrics.osman`."""
+        return _formulas.osman(
+            self.count_words(), *self._arabic_counts(), self.words_per_sentence()
+        )
+
+    def powers_sumner_kearl(self) -> float:
+        """See `metrics.powers_sumner_kearl`."""
+        return _formulas.powers_sumner_kearl(
+            self.count_words(), self.count_syllables(), self.count_sentences()
+        )
+
+    def reading_time(self, ms_per_char: float = 14.69) -> float:
+        """See `metrics.reading_time`."""
+        return _formulas.reading_time(self.count_chars(ignore_spaces=True), ms_per_char)
+
+    def rix(self) -> float:
+        """See `metrics.rix`."""
+        return _formulas.rix(self.count_long_words(), self.count_sentences())
+
+    def smog_index(self) -> float:
+        """See `metrics.smog_index`."""
+        return _formulas.smog_index(
+            self.count_polysyllable_words(), self.count_sentences()
+        )
+
+    def spache_readability(self) -> float:
+        """See `metrics.spache_readability`."""
+        return _formulas.spache_readability(
+            self.count_words(),
+            self.count_spache_difficult_words(unique=True),
+            self.words_per_sentence(),
+        )
+
+    def szigriszt_pazos(self) -> float:
+        """See `metrics.szigriszt_pazos`."""
+        return _formulas.szigriszt_pazos(
+            self.count_words(),
+            self.count_syllables(),
+            self.count_sentences(),
+            self.lang,
+        )
+
+    def text_standard(self) -> float:
+        """See `metrics.text_standard`."""
+        return consensus_grade(
+            self.flesch_kincaid_grade(),
+            self.flesch_reading_ease(),
+            self.smog_index(),
+            self.coleman_liau_index(),
+            self.automated_readability_index(),
+            self.dale_chall_readability_score(),
+            self.linsear_write_formula(strict_lower=False, strict_upper=True),
+            self.gunning_fog(),
+        )
+
+    def wiener_sachtextformel(self, variant: int) -> float:
+        """See `metrics.wiener_sachtextformel`."""
+        return _formulas.wiener_sachtextformel(
+            self.count_words(),
+            self.count_polysyllable_words(),
+            self.count_long_words(),
+            self.count_monosyllable_words(),
+            self.words_per_sentence(),
+            variant,
+        )
@@ -0,0 +1,213 @@
+from __future__ import annotations
+
+import re
+from dataclasses import dataclass
+from functools import cached_property
+
+from ..counts._count_arabic_long_words import count_arabic_long_words
+from ..counts._count_arabic_syllables import (
+    arabic_syllable_parts,
+    count_arabic_syllables,
+)
+from ..counts._count_complex_arabic_words import count_complex_arabic_words
+from ..counts._count_faseeh import count_faseeh
+from ..counts._count_sentences import count_sentences
+from ..counts._count_word_syllables import syllabify_many
+from ..transformations._remove_punctuation import remove_punctuation
+from ..utils._get_word_table import get_easy_word_index, get_spache_word_table
+from ._base_analysis import BaseAnalysis
+
+RE_ARABIC = re.compile("[\u0600-\u06ff]")
+
+
+@dataclass(frozen=True)
+class DocumentAnalysis(BaseAnalysis):
+    """The statistics of one document, computed once by `analysis.analyze`.
+
+    Every count and metric method gives the same result as the function of the
+    same name in `backend.counts` / `backend.metrics` called on `text`, but is
+    plain arithmetic over the stored statistics.
+
+    Attributes
+    ----------
+    text : str
+        The analysed text.
+    lang : str
+        The language of the text.
+    words : tuple[str, ...]
+        The words of the text, punctuation removed (`selections.list_words`).
+    raw_words : tuple[str, ...]
+        The words of the text, punctuation kept.
+    letter_lengths : tuple[int, ...]
+        The length of every word once all punctuation, including apostrophes, is
+        removed.
+    sentences : tuple[str, ...]
+        The sentences of the text (`selections.list_sentences`).
+    char_count : int
+        Number of characters, whitespace excluded.
+    letter_count : int
+        Number of letters.
+    """
+
+    text: str
+    lang: str
+    words: tuple[str, ...]
+    raw_words: tuple[str, ...]
+    letter_lengths: tuple[int, ...]
+    sentences: tuple[str, ...]
+    char_count: int
+    letter_count: int
+
+    @cached_property
+    def lowercase_words(self) -> tuple[str, ...]:
+        """The words of the text, lowercased."""
+        return tuple(word.lower() for word in self.words)
+
+    @cached_property
+    def syllables(self) -> tuple[int, ...]:
+        """The number of syllables of every word, from the syllable table of
+        the language."""
+        return tuple(syllabify_many(self.lowercase_words, self.lang))
+
+    @cached_property
+    def easy_flags(self) -> tuple[bool, ...]:
+        """Whether every word is in the easy word list of the language."""
+        easy_word_set = get_easy_word_index(self.lang)
+        return tuple(word in easy_word_set for word in self.lowercase_words)
+
+    @cached_property
+    def spache_easy_flags(self) -> tuple[bool, ...]:
+        """Whether every word is in the Spache easy word list of the language."""
+        spache_easy_word_set = get_spache_word_table(self.lang)
+        return tuple(word in spache_easy_word_set for word in self.lowercase_words)
+
+    # Counts
+
+    def count_words(self, rm_punctuation: bool = True) -> int:
+        """Count the number of words, see `counts.count_words`."""
+        if rm_punctuation:
+            return len(self.words)
+        return len(self.raw_words)
+
+    def count_sentences(self) -> int:
+        """Count the number of sentences, see `counts.count_sentences`."""
+        if not self.text or not self.text.strip():
+            return 0
+        return max(1, len(self.sentences))
+
+    def count_syllables(self) -> int:
+        """Count the number of syllables, see `counts.count_syllables`."""
+        return sum(self.syllables)
+
+    def count_chars(self, ignore_spaces: bool = True) -> int:
+        """Count the number of characters, see `counts.count_chars`."""
+        if ignore_spaces:
+            return self.char_count
+        return len(self.text)
+
+    def count_letters(self) -> int:
+        """Count the number of letters, see `counts.count_letters`."""
+        return self.letter_count
+
+    def count_long_words(self, threshold: int = 6) -> int:
+        """Count words with more than `threshold` letters, see
+        `counts.count_long_words`."""
+        return sum(1 for length in self.letter_lengths if length > threshold)
+
+    def count_miniwords(self, max_size: int = 3) -> int:
+        """Count words with `max_size` letters or less, see
+        `counts.count_miniwords`."""
+        return sum(1 for length in self.letter_lengths if length <= max_size)
+
+    def count_polysyllable_words(self) -> int:
+        """Count words with three or more syllables, see
+        `counts.count_polysyllable_words`."""
+        return sum(1 for n_syll in self.syllables if n_syll >= 3)
+
+    def count_monosyllable_words(self) -> int:
+        """Count words with exactly one syllable, see
+        `counts.count_monosyllable_words`."""
+        return sum(1 for n_syll in self.syllables if n_syll == 1)
+
+    def list_difficult_words(self, syllable_threshold: int = 2) -> list[str]:
+        """Get the difficult words, see `selections.list_difficult_words`."""
+        return [
+            word
+            for word, n_syll, easy in zip(self.words, self.syllables, self.easy_flags)
+            if not easy and n_syll >= syllable_threshold
+        ]
+
+    def count_difficult_words(
+        self, syllable_threshold: int = 2, unique: bool = False
+    ) -> int:
+        """Count the difficult words, see `counts.count_difficult_words`."""
+        diff_words = self.list_difficult_words(syllable_threshold)
+        if unique:
+            return len(set(diff_words))
+        return len(diff_words)
+
+    def list_spache_difficult_words(self) -> list[str]:
+        """Get the Spache difficult words, see
+        `selections.list_spache_difficult_words`."""
+        return [
+            word
+            for word, easy in zip(self.words, self.spache_easy_flags)
+            if not easy
+        ]
+
+    def count_spache_difficult_words(self, unique: bool = False) -> int:
+        """Count the Spache difficult words, see
+        `counts.count_spache_difficult_words`."""
+        diff_words = self.list_spache_difficult_words()
+        if unique:
+            return len(set(diff_words))
+        return len(diff_words)
+
+    def _linsear_write_counts(self, strict_upper: bool) -> tuple[int, int, int, int]:
+        # When `strict_upper` cuts the text at 100 words, the sentences of the
+        # remaining prefix are counted anew
+        i_text = len(self.raw_words)
+        n_words = len(self.words)
+        if strict_upper and len(self.raw_words) > 100:
+            n_words = 0
+            i_text = 0
+            while (i_text < len(self.raw_words)) and (n_words < 100):
+                word = remove_punctuation(self.raw_words[i_text], rm_apostrophe=False)
+                i_text += 1
+                if len(word) > 0:
+                    n_words += 1
+
+        easy_word = 0
+        difficult_word = 0
+        for n_syll in self.syllables[:n_words]:
+            if n_syll >= 3:
+                difficult_word += 1
+            elif n_syll > 0:
+                easy_word += 1
+
+        text = " ".join(self.raw_words[:i_text])
+        return n_words, easy_word, difficult_word, count_sentences(text)
+
+    def _arabic_counts(self) -> tuple[int, int, int, int]:
+        # The Arabic counts are not part of the analysis and are computed from
+        # `text` on demand
+        return (
+            count_complex_arabic_words(self.text),
+            count_arabic_long_words(self.text),
+            count_arabic_syllables(self.text),
+            count_faseeh(self.text),
+        )
+
+    def _arabic_parts(self) -> tuple[int, ...]:
+        # The Arabic counts in a form that adds up over consecutive texts, as
+        # `StreamAnalysis.arabic_counts`
+        if not RE_ARABIC.search(self.text):
+            # Without Arabic letters, only the long words and the syllable
+            # fallback count
+            return (0, self.count_long_words(5), 0, *arabic_syllable_parts(self.text))
+        return (
+            count_complex_arabic_words(self.text),
+            count_arabic_long_words(self.text),
+            count_faseeh(self.text),
+            *arabic_syllable_parts(self.text),
+        )
@@ -0,0 +1,240 @@
+from __future__ import annotations
+
+from bisect import bisect_left, bisect_right
+from typing import Any, Iterable
+
+from ..selections._list_sentences import list_sentences
+from ..utils._get_pyphen import has_pyphen
+from ._analyze import analyze_sentences
+from ._document_analysis import DocumentAnalysis
+from ._score_many import get_scorer
+from ._stream_analysis import StreamAnalysis
+from ._word_counters import WordCounters, head_words
+
+
+class IncrementalDocument:
+    """A document that is scored again cheaply after every edit.
+
+    The text is kept as a list of sentences, each analysed on its own with the
+    functions of `backend.counts`, and the counts of the document are the
+    running totals of its sentences. An edit only splits and analyses the
+    sentences it touches (and their neighbours, whose boundaries may change),
+    then updates the totals, so the cost of an edit does not grow with the
+    length of the document. The syllables and difficult words of the new
+    sentences are only counted when the document is scored.
+
+    Parameters
+    ----------
+    text : str, optional
+        The initial text. The default is "".
+    lang : str, optional
+        The language of the text. The default is "en_US".
+    """
+
+    def __init__(self, text: str = "", lang: str = "en_US") -> None:
+        self.lang = lang
+        self._syllables = has_pyphen(lang)
+
+        # The text split before every sentence, the offsets of the segments and
+        # their analyses
+        self._segments: list[str] = []
+        self._starts: list[int] = []
+        self._units: list[DocumentAnalysis] = []
+
+        self._length = 0
+        self._char_count = 0
+        self._letter_count = 0
+        self._word_count = 0
+        self._raw_word_count = 0
+        self._sentence_count = 0
+        self._spache_difficult_count = 0
+        self._arabic_counts = [0] * 7
+        self._counters = WordCounters(self._syllables)
+        # The units to add to (1) or remove from (-1) the counters, by id
+        self._pending: dict[int, tuple[DocumentAnalysis, int]] = {}
+
+        self.replace(0, 0, text)
+
+    @property
+    def text(self) -> str:
+        """The current text."""
+        return "".join(self._segments)
+
+    def __len__(self) -> int:
+        return self._length
+
+    def insert(self, index: int, text: str) -> None:
+        """Insert `text` before the character at `index`.
+
+        Parameters
+        ----------
+        index : int
+            The offset to insert at, from 0 to `len(document)`.
+        text : str
+            The text to insert.
+
+        Returns
+        -------
+        None
+        """
+        self.replace(index, index, text)
+
+    def delete(self, start: int, end: int) -> None:
+        """Delete the characters from `start` to `end` (excluded).
+
+        Parameters
+        ----------
+        start : int
+            The offset of the first deleted character.
+        end : int
+            The offset after the last deleted character.
+
+        Returns
+        -------
+        None
+        """
+        self.replace(start, end, "")
+
+    def replace(self, start: int, end: int, text: str) -> None:
+        """Replace the characters from `start` to `end` (excluded) by `text`.
+
+        Parameters
+        ----------
+        start : int
+            The offset of the first replaced character.
+        end : int
+            The offset after the last replaced character.
+        text : str
+            The new text.
+
+        Returns
+        -------
+        None
+        """
+        if not 0 <= start <= end <= self._length:
+            raise IndexError(
+                f"Range {start}:{end} is outside the document of length "
+                f"{self._length}"
+            )
+
+        # The segments overlapping the range and one more on each side
+        lo = max(bisect_right(self._starts, start) - 2, 0)
+        hi = min(bisect_left(self._starts, end) + 1, len(self._segments))
+        offset = self._starts[lo] if self._segments else 0
+        old = "".join(self._segments[lo:hi])
+        new = old[:start - offset] + text + old[end - offset:]
+
+        for unit in self._units[lo:hi]:
+            self._add(unit, -1)
+        segments = _split_segments(new)
+        units = [
+            analyze_sentences(segment, self.lang, sentences)
+            for segment, sentences in segments
+        ]
+        for unit in units:
+            self._add(unit, 1)
+
+        self._segments[lo:hi] = [segment for segment, _ in segments]
+        self._units[lo:hi] = units
+        # Shift the offsets of the segments after the edit
+        starts = []
+        position = offset
+        for segment, _ in segments:
+            starts.append(position)
+            position += len(segment)
+        shift = len(new) - len(old)
+        self._starts[lo:] = starts + [
+            segment_start + shift for segment_start in self._starts[hi:]
+        ]
+        self._length += len(text) - (end - start)
+
+    @property
+    def analysis(self) -> StreamAnalysis:
+        """The analysis of the current text, with the count and metric methods
+        of `DocumentAnalysis`. It shares the counters of the document, so get
+        it again after editing."""
+        for unit, sign in self._pending.values():
+            self._counters.add(unit, sign)
+        self._pending.clear()
+        head_raw_words, head_syllables = head_words(self._units, self._syllables)
+        sentence_count = self._sentence_count
+        if sentence_count == 0 and self._char_count > 0:
+            sentence_count = 1
+        return StreamAnalysis(
+            lang=self.lang,
+            text_length=self._length,
+            char_count=self._char_count,
+            letter_count=self._letter_count,
+            word_count=self._word_count,
+            raw_word_count=self._raw_word_count,
+            sentence_count=sentence_count,
+            syllable_counts=self._counters.syllable_counts,
+            letter_length_counts=self._counters.letter_length_counts,
+            difficult_syllable_counts=self._counters.difficult_syllable_counts,
+            difficult_words=self._counters.difficult_words,
+            spache_difficult_count=self._spache_difficult_count,
+            spache_difficult_words=self._counters.spache_difficult_words.keys(),
+            head_raw_words=tuple(head_raw_words),
+            head_syllables=tuple(head_syllables),
+            arabic_counts=tuple(self._arabic_counts),
+            syllables_counted=self._syllables,
+        )
+
+    def score(self, metrics: Iterable[str]) -> dict[str, Any]:
+        """Score the current text.
+
+        Parameters
+        ----------
+        metrics : Iterable[str]
+            The names of the metrics (and counts) to compute, see `score_many`.
+
+        Returns
+        -------
+        dict[str, Any]
+            The score of every metric.
+        """
+        metrics = list(metrics)
+        for metric in metrics:
+            get_scorer(metric)
+        doc = self.analysis
+        return {metric: getattr(doc, metric)() for metric in metrics}
+
+    def _add(self, unit: DocumentAnalysis, sign: int) -> None:
+        self._char_count += sign * unit.char_count
+        self._letter_count += sign * unit.letter_count
+        self._word_count += sign * len(unit.words)
+        self._raw_word_count += sign * len(unit.raw_words)
+        self._sentence_count += sign * len(unit.sentences)
+        self._spache_difficult_count += sign * sum(
+            1 for easy in unit.spache_easy_flags if not easy
+        )
+        for i, count in enumerate(unit._arabic_parts()):
+            self._arabic_counts[i] += sign * count
+        # A unit added and removed between two scorings is never counted
+        _, pending = self._pending.pop(id(unit), (unit, 0))
+        if pending + sign:
+            self._pending[id(unit)] = (unit, pending + sign)
+
+
+def _split_segments(text: str) -> list[tuple[str, list[str]]]:
+    # Split `text` before every sentence that follows whitespace (so that no
+    # word is cut); leading whitespace stays with the first segment
+    if not text:
+        return []
+    segments: list[tuple[str, list[str]]] = []
+    segment_start = 0
+    segment_sentences: list[str] = []
+    position = 0
+    for sentence in list_sentences(text):
+        start = text.find(sentence, position)
+        if start < 0:
+            # The sentence engine changed the text, keep it in one segment
+            return [(text, list_sentences(text))]
+        if segment_sentences and text[start - 1].isspace():
+            segments.append((text[segment_start:start], segment_sentences))
+            segment_start = start
+            segment_sentences = []
+        segment_sentences.append(sentence)
+        position = start + len(sentence)
+    segments.append((text[segment_start:], segment_sentences))
+    return segments
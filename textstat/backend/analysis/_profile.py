@@ -0,0 +1,181 @@
+from __future__ import annotations
+
+import re
+from typing import Any, Iterable
+
+from ..metrics._text_standard import consensus_grades
+from ..selections._list_sentences import list_sentences
+from ..utils._get_pyphen import has_pyphen
+from ._analyze import analyze, analyze_sentences
+from ._document_analysis import DocumentAnalysis
+from ._score_many import OUTPUTS, _text_standard_scores, get_scorer, to_columns
+from ._stream_analysis import StreamAnalysis
+from ._word_counters import WordCounters, head_words
+
+UNITS = ("sentence", "paragraph")
+
+# Paragraphs are separated by blank lines
+RE_PARAGRAPH_BREAK = re.compile(r"\n\s*\n")
+
+
+def profile(
+    text: str,
+    lang: str,
+    metrics: Iterable[str],
+    window: int = 5,
+    step: int | None = None,
+    unit: str = "sentence",
+    output: str = "array",
+    round_points: int | None = None,
+) -> dict[str, Any]:
+    """Score the sections of a document, e.g. to find its hardest passages.
+
+    The text is tokenized once into sentences (or paragraphs), and every window
+    of `window` consecutive units, moved by `step` units at a time, is scored
+    as if it were a text of its own. The counts of a window are taken from
+    prefix sums over the units and from word counters updated as the window
+    slides, instead of tokenizing the window again.
+
+    Window `i` covers the units `i * step` to `i * step + window`. Windows
+    stop at the first one reaching the end of the text, which may be shorter
+    than `window` units.
+
+    Parameters
+    ----------
+    text : str
+        A text string.
+    lang : str
+        The language of the text.
+    metrics : Iterable[str]
+        The names of the metrics (and counts) to compute, see `score_many`.
+    window : int, optional
+        The number of units in a window. The default is 5.
+    step : int or None, optional
+        The number of units between the starts of consecutive windows. The
+        default is None (`window`, i.e. consecutive sections).
+    unit : str, optional
+        "sentence" (default) or "paragraph" (separated by blank lines).
+    output : str, optional
+        The type of the columns: "array" (default) for `array('d')`, "list" or
+        "numpy" (requires NumPy).
+    round_points : int or None, optional
+        The number of decimals to round the scores to. The default is None (no
+        rounding).
+
+    Returns
+    -------
+    dict[str, Any]
+        One column per metric, holding the scores of the windows in order.
+
+    """
+    if step is None:
+        step = window
+    if window < 1 or step < 1:
+        raise ValueError("window and step must be at least 1")
+    if unit not in UNITS:
+        raise ValueError(f"unit must be one of {UNITS}, got {unit!r}")
+    if output not in OUTPUTS:
+        raise ValueError(f"output must be one of {OUTPUTS}, got {output!r}")
+    scorers = {metric: get_scorer(metric) for metric in metrics}
+
+    if unit == "sentence":
+        units = [
+            analyze_sentences(sentence, lang, [sentence])
+            for sentence in list_sentences(text)
+        ]
+        separator = " "
+    else:
+        units = [
+            analyze(paragraph, lang)
+            for paragraph in RE_PARAGRAPH_BREAK.split(text)
+            if paragraph.strip()
+        ]
+        separator = "\n\n"
+
+    columns: dict[str, list[float]] = {metric: [] for metric in scorers}
+    grades: list[tuple[float, ...]] = []
+    for section in _windows(units, lang, window, step, len(separator)):
+        for metric in scorers:
+            if metric == "text_standard":
+                grades.append(_text_standard_scores(section))
+            else:
+                columns[metric].append(getattr(section, metric)())
+    if grades:
+        columns["text_standard"] = consensus_grades(*zip(*grades))
+
+    if round_points is not None:
+        for scores in columns.values():
+            scores[:] = [round(score, round_points) for score in scores]
+
+    return to_columns(columns, output)
+
+
+def _windows(
+    units: list[DocumentAnalysis],
+    lang: str,
+    window: int,
+    step: int,
+    separator_length: int,
+) -> Iterable[StreamAnalysis]:
+    # The analysis of every window, valid until the next one is yielded
+    def prefix_sums(counts: Iterable[int]) -> list[int]:
+        sums = [0]
+        for count in counts:
+            sums.append(sums[-1] + count)
+        return sums
+
+    char_sums = prefix_sums(unit.char_count for unit in units)
+    letter_sums = prefix_sums(unit.letter_count for unit in units)
+    word_sums = prefix_sums(len(unit.words) for unit in units)
+    raw_word_sums = prefix_sums(len(unit.raw_words) for unit in units)
+    sentence_sums = prefix_sums(unit.count_sentences() for unit in units)
+    length_sums = prefix_sums(len(unit.text) for unit in units)
+    spache_sums = prefix_sums(
+        sum(1 for easy in unit.spache_easy_flags if not easy) for unit in units
+    )
+    arabic_sums = [
+        prefix_sums(counts) for counts in zip(*(unit._arabic_parts() for unit in units))
+    ]
+
+    # The histograms and unique words of the current window
+    syllables = has_pyphen(lang)
+    counters = WordCounters(syllables)
+
+    lo = hi = 0
+    for start in range(0, len(units), step):
+        end = min(start + window, len(units))
+        while lo < min(start, hi):
+            counters.add(units[lo], -1)
+            lo += 1
+        lo = start
+        hi = max(hi, start)
+        while hi < end:
+            counters.add(units[hi], 1)
+            hi += 1
+
+        head_raw_words, head_syllables = head_words(units[start:end], syllables)
+        yield StreamAnalysis(
+            lang=lang,
+            text_length=(
+                length_sums[end]
+                - length_sums[start]
+                + separator_length * (end - start - 1)
+            ),
+            char_count=char_sums[end] - char_sums[start],
+            letter_count=letter_sums[end] - letter_sums[start],
+            word_count=word_sums[end] - word_sums[start],
+            raw_word_count=raw_word_sums[end] - raw_word_sums[start],
+            sentence_count=sentence_sums[end] - sentence_sums[start],
+            syllable_counts=counters.syllable_counts,
+            letter_length_counts=counters.letter_length_counts,
+            difficult_syllable_counts=counters.difficult_syllable_counts,
+            difficult_words=counters.difficult_words,
+            spache_difficult_count=spache_sums[end] - spache_sums[start],
+            spache_difficult_words=counters.spache_difficult_words.keys(),
+            head_raw_words=tuple(head_raw_words),
+            head_syllables=tuple(head_syllables),
+            arabic_counts=tuple(sums[end] - sums[start] for sums in arabic_sums),
+            syllables_counted=syllables,
+        )
+        if end == len(units):
+            break
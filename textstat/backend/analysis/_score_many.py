@@ -0,0 +1,144 @@
+from __future__ import annotations
+
+import inspect
+from array import array
+from typing import Any, Callable, Iterable
+
+from ..metrics._text_standard import consensus_grades
+from ._analyze import analyze
+from ._document_analysis import DocumentAnalysis
+
+OUTPUTS = ("list", "array", "numpy")
+
+
+def get_scorer(metric: str) -> Callable[[DocumentAnalysis], float]:
+    """Get the `DocumentAnalysis` method computing `metric`.
+
+    Parameters
+    ----------
+    metric : str
+        The name of a count or metric method of `DocumentAnalysis` that takes no
+        required arguments, e.g. "flesch_reading_ease" or "count_words".
+
+    Returns
+    -------
+    Callable[[DocumentAnalysis], float]
+        The unbound method.
+
+    """
+    scorer = getattr(DocumentAnalysis, metric, None)
+    if metric.startswith(("_", "list_")) or not callable(scorer):
+        raise ValueError(f"Unknown metric {metric}")
+
+    required = [
+        param.name
+        for param in list(inspect.signature(scorer).parameters.values())[1:]
+        if param.default is param.empty
+    ]
+    if required:
+        raise ValueError(f"Metric {metric} requires the arguments {required}")
+    return scorer
+
+
+def score_many(
+    texts: Iterable[str],
+    metrics: Iterable[str],
+    lang: str,
+    output: str = "list",
+    round_points: int | None = None,
+) -> dict[str, Any]:
+    """Score many texts with the same metrics, tokenizing each text once.
+
+    Parameters
+    ----------
+    texts : Iterable[str]
+        The text strings.
+    metrics : Iterable[str]
+        The names of the metrics (and counts) to compute, see `DocumentAnalysis`.
+    lang : str
+        The language of the texts.
+    output : str, optional
+        The type of the columns: "list" (default), "array" for `array('d')` or
+        "numpy" for NumPy float arrays (requires NumPy).
+    round_points : int or None, optional
+        The number of decimals to round the scores to. The default is None (no
+        rounding).
+
+    Returns
+    -------
+    dict[str, Any]
+        One column per metric, holding the scores of the texts in input order.
+
+    """
+    if output not in OUTPUTS:
+        raise ValueError(f"output must be one of {OUTPUTS}, got {output!r}")
+
+    scorers = {metric: get_scorer(metric) for metric in metrics}
+    columns: dict[str, list[float]] = {metric: [] for metric in scorers}
+    appenders = [
+        (columns[metric].append, scorer)
+        for metric, scorer in scorers.items()
+        if metric != "text_standard"
+    ]
+
+    # The Text Standard votes of all texts are counted together at the end
+    grades: list[tuple[float, ...]] = []
+    if "text_standard" in scorers:
+        appenders.append((grades.append, _text_standard_scores))
+
+    for text in texts:
+        doc = analyze(text, lang)
+        for append, scorer in appenders:
+            append(scorer(doc))
+
+    if grades:
+        columns["text_standard"] = consensus_grades(*zip(*grades))
+
+    if round_points is not None:
+        for scores in columns.values():
+            scores[:] = [round(score, round_points) for score in scores]
+
+    return to_columns(columns, output)
+
+
+def _text_standard_scores(doc: DocumentAnalysis) -> tuple[float, ...]:
+    return (
+        doc.flesch_kincaid_grade(),
+        doc.flesch_reading_ease(),
+        doc.smog_index(),
+        doc.coleman_liau_index(),
+        doc.automated_readability_index(),
+        doc.dale_chall_readability_score(),
+        doc.linsear_write_formula(strict_lower=False, strict_upper=True),
+        doc.gunning_fog(),
+    )
+
+
+def to_columns(columns: dict[str, list[float]], output: str) -> dict[str, Any]:
+    """Convert score lists to the column type requested by `output`.
+
+    Parameters
+    ----------
+    columns : dict[str, list[float]]
+        The score lists.
+    output : str
+        "list", "array" or "numpy".
+
+    Returns
+    -------
+    dict[str, Any]
+        The converted columns.
+
+    """
+    if output == "array":
+        return {metric: array("d", scores) for metric, scores in columns.items()}
+    if output == "numpy":
+        try:
+            import numpy as np
+        except ImportError as e:
+            raise ImportError("output='numpy' requires NumPy to be installed") from e
+        return {
+            metric: np.asarray(scores, dtype=float)
+            for metric, scores in columns.items()
+        }
+    return columns
@@ -0,0 +1,214 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import AbstractSet, Mapping
+
+from ..counts._count_arabic_syllables import sum_arabic_syllables
+from ..counts._count_sentences import count_sentences
+from ..transformations._remove_punctuation import remove_punctuation
+from ._base_analysis import BaseAnalysis
+
+
+@dataclass(frozen=True)
+class StreamAnalysis(BaseAnalysis):
+    """The running totals of a streamed document, built by `StreamAnalyzer`
+    (and by `profile` for every window of a document).
+
+    Only aggregate counts are kept, so the size of the analysis does not
+    depend on the length of the document (apart from the sets of unique
+    difficult words, which grow with its vocabulary). The counts and metrics
+    are those of `DocumentAnalysis`, with two exceptions:
+
+    - `linsear_write_formula(strict_upper=False)` on documents of more than
+      100 words counts the sentences of the document rather than those of its
+      words joined by spaces.
+    - `osman` counts the Arabic syllables per segment of the stream, so a
+      diacritic ending a segment is never counted as a long syllable.
+
+    For languages without syllable counts (see `utils.has_pyphen`, e.g.
+    Arabic), the syllable and difficult word statistics are empty and the
+    methods that need them raise LookupError, where `DocumentAnalysis` fails
+    when the syllables are counted.
+
+    Attributes
+    ----------
+    lang : str
+        The language of the text.
+    text_length : int
+        Number of characters, whitespace included.
+    char_count : int
+        Number of characters, whitespace excluded.
+    letter_count : int
+        Number of letters.
+    word_count : int
+        Number of words, punctuation removed.
+    raw_word_count : int
+        Number of words, punctuation kept.
+    sentence_count : int
+        Number of sentences.
+    syllable_counts : Mapping[int, int]
+        The number of words with every syllable count.
+    letter_length_counts : Mapping[int, int]
+        The number of words with every length, all punctuation removed.
+    difficult_syllable_counts : Mapping[int, int]
+        The number of words not in the easy word list with every syllable count.
+    difficult_words : Mapping[str, int]
+        The syllable count of every unique word not in the easy word list.
+    spache_difficult_count : int
+        Number of words not in the Spache easy word list.
+    spache_difficult_words : AbstractSet[str]
+        The unique words not in the Spache easy word list.
+    head_raw_words : tuple[str, ...]
+        The first words (punctuation kept), enough to hold 100 words without
+        punctuation.
+    head_syllables : tuple[int, ...]
+        The syllable counts of the first 101 words.
+    arabic_counts : tuple[int, ...]
+        The number of complex Arabic words, long Arabic words and faseeh,
+        followed by the parts of the Arabic syllable count (see
+        `counts.arabic_syllable_parts`).
+    syllables_counted : bool, optional
+        Whether the syllables of the words were counted. The default is True.
+    """
+
+    lang: str
+    text_length: int
+    char_count: int
+    letter_count: int
+    word_count: int
+    raw_word_count: int
+    sentence_count: int
+    syllable_counts: Mapping[int, int]
+    letter_length_counts: Mapping[int, int]
+    difficult_syllable_counts: Mapping[int, int]
+    difficult_words: Mapping[str, int]
+    spache_difficult_count: int
+    spache_difficult_words: AbstractSet[str]
+    head_raw_words: tuple[str, ...]
+    head_syllables: tuple[int, ...]
+    arabic_counts: tuple[int, ...]
+    syllables_counted: bool = True
+
+    # Counts
+
+    def count_words(self, rm_punctuation: bool = True) -> int:
+        """Count the number of words, see `counts.count_words`."""
+        if rm_punctuation:
+            return self.word_count
+        return self.raw_word_count
+
+    def count_sentences(self) -> int:
+        """Count the number of sentences, see `counts.count_sentences`."""
+        return self.sentence_count
+
+    def count_syllables(self) -> int:
+        """Count the number of syllables, see `counts.count_syllables`."""
+        self._check_syllables()
+        return sum(n_syll * n for n_syll, n in self.syllable_counts.items())
+
+    def count_chars(self, ignore_spaces: bool = True) -> int:
+        """Count the number of characters, see `counts.count_chars`."""
+        if ignore_spaces:
+            return self.char_count
+        return self.text_length
+
+    def count_letters(self) -> int:
+        """Count the number of letters, see `counts.count_letters`."""
+        return self.letter_count
+
+    def count_long_words(self, threshold: int = 6) -> int:
+        """Count words with more than `threshold` letters, see
+        `counts.count_long_words`."""
+        return sum(
+            n for length, n in self.letter_length_counts.items() if length > threshold
+        )
+
+    def count_miniwords(self, max_size: int = 3) -> int:
+        """Count words with `max_size` letters or less, see
+        `counts.count_miniwords`."""
+        return sum(
+            n for length, n in self.letter_length_counts.items() if length <= max_size
+        )
+
+    def count_polysyllable_words(self) -> int:
+        """Count words with three or more syllables, see
+        `counts.count_polysyllable_words`."""
+        self._check_syllables()
+        return sum(n for n_syll, n in self.syllable_counts.items() if n_syll >= 3)
+
+    def count_monosyllable_words(self) -> int:
+        """Count words with exactly one syllable, see
+        `counts.count_monosyllable_words`."""
+        self._check_syllables()
+        return self.syllable_counts.get(1, 0)
+
+    def count_difficult_words(
+        self, syllable_threshold: int = 2, unique: bool = False
+    ) -> int:
+        """Count the difficult words, see `counts.count_difficult_words`."""
+        self._check_syllables()
+        if unique:
+            return sum(
+                1
+                for n_syll in self.difficult_words.values()
+                if n_syll >= syllable_threshold
+            )
+        return sum(
+            n
+            for n_syll, n in self.difficult_syllable_counts.items()
+            if n_syll >= syllable_threshold
+        )
+
+    def count_spache_difficult_words(self, unique: bool = False) -> int:
+        """Count the Spache difficult words, see
+        `counts.count_spache_difficult_words`."""
+        if unique:
+            return len(self.spache_difficult_words)
+        return self.spache_difficult_count
+
+    def _linsear_write_counts(self, strict_upper: bool) -> tuple[int, int, int, int]:
+        self._check_syllables()
+        if strict_upper and self.raw_word_count > 100:
+            n_words = 0
+            i_text = 0
+            while (i_text < len(self.head_raw_words)) and (n_words < 100):
+                word = remove_punctuation(
+                    self.head_raw_words[i_text], rm_apostrophe=False
+                )
+                i_text += 1
+                if len(word) > 0:
+                    n_words += 1
+            syllables = self.head_syllables[:n_words]
+            n_sentences = count_sentences(" ".join(self.head_raw_words[:i_text]))
+        elif self.raw_word_count <= len(self.head_raw_words):
+            # The whole document is in the head
+            n_words = self.word_count
+            syllables = self.head_syllables[:n_words]
+            n_sentences = count_sentences(" ".join(self.head_raw_words))
+        else:
+            easy_word = sum(
+                n for n_syll, n in self.syllable_counts.items() if 0 < n_syll < 3
+            )
+            difficult_word = self.count_polysyllable_words()
+            return self.word_count, easy_word, difficult_word, self.sentence_count
+
+        easy_word = 0
+        difficult_word = 0
+        for n_syll in syllables:
+            if n_syll >= 3:
+                difficult_word += 1
+            elif n_syll > 0:
+                easy_word += 1
+        return n_words, easy_word, difficult_word, n_sentences
+
+    def _arabic_counts(self) -> tuple[int, int, int, int]:
+        complex_words, long_words, faseeh, *syllable_parts = self.arabic_counts
+        n_syllables = sum_arabic_syllables(tuple(syllable_parts))
+        return complex_words, long_words, n_syllables, faseeh
+
+    def _check_syllables(self) -> None:
+        if not self.syllables_counted:
+            raise LookupError(
+                f"Pyphen has no dictionary for {self.lang!r}, the syllables of "
+                "its words are not counted"
+            )
@@ -0,0 +1,75 @@
+from __future__ import annotations
+
+from collections import Counter
+from typing import Iterable
+
+from ._document_analysis import DocumentAnalysis
+
+
+class WordCounters:
+    """The word histograms and unique difficult words of a changing set of
+    analysed texts, e.g. the sentences of a sliding window.
+
+    Texts are added with `add(unit, 1)` and removed with `add(unit, -1)`.
+    The counters are passed as they are to `StreamAnalysis`.
+
+    Parameters
+    ----------
+    syllables : bool, optional
+        Whether to count the syllables and difficult words, which needs a
+        Pyphen dictionary for the language. The default is True.
+    """
+
+    def __init__(self, syllables: bool = True) -> None:
+        self.syllables = syllables
+        self.syllable_counts: Counter[int] = Counter()
+        self.letter_length_counts: Counter[int] = Counter()
+        self.difficult_syllable_counts: Counter[int] = Counter()
+        # The syllable count of every difficult word, and how often it occurs
+        self.difficult_words: dict[str, int] = {}
+        self._difficult_word_counts: Counter[str] = Counter()
+        self.spache_difficult_words: Counter[str] = Counter()
+
+    def add(self, unit: DocumentAnalysis, sign: int) -> None:
+        """Add (`sign=1`) or remove (`sign=-1`) the words of `unit`."""
+        for length in unit.letter_lengths:
+            self.letter_length_counts[length] += sign
+
+        if self.syllables:
+            for n_syll in unit.syllables:
+                self.syllable_counts[n_syll] += sign
+            difficult_word_counts = self._difficult_word_counts
+            for word, n_syll, easy in zip(
+                unit.words, unit.syllables, unit.easy_flags
+            ):
+                if not easy:
+                    self.difficult_syllable_counts[n_syll] += sign
+                    difficult_word_counts[word] += sign
+                    if difficult_word_counts[word]:
+                        self.difficult_words[word] = n_syll
+                    else:
+                        del difficult_word_counts[word], self.difficult_words[word]
+
+        spache_difficult_words = self.spache_difficult_words
+        for word, easy in zip(unit.words, unit.spache_easy_flags):
+            if not easy:
+                spache_difficult_words[word] += sign
+                if not spache_difficult_words[word]:
+                    del spache_difficult_words[word]
+
+
+def head_words(
+    units: Iterable[DocumentAnalysis], syllables: bool = True
+) -> tuple[list[str], list[int]]:
+    """Get the first words (punctuation kept) of consecutive texts and the
+    syllable counts of their first 101 words (none if not `syllables`), as
+    Linsear-Write needs them."""
+    raw_words: list[str] = []
+    head_syllables: list[int] = []
+    for unit in units:
+        if len(raw_words) > 100 and (len(head_syllables) > 100 or not syllables):
+            break
+        raw_words.extend(unit.raw_words)
+        if syllables:
+            head_syllables.extend(unit.syllables)
+    return raw_words, head_syllables[:101]
@@ -1,6 +1,10 @@
 from ._count_chars import count_chars
 from ._count_arabic_long_words import count_arabic_long_words
-from ._count_arabic_syllables import count_arabic_syllables
+from ._count_arabic_syllables import (
+    arabic_syllable_parts,
+    count_arabic_syllables,
+    sum_arabic_syllables,
+)
 from ._count_complex_arabic_words import count_complex_arabic_words
 from ._count_faseeh import count_faseeh
 from ._count_difficult_words import count_difficult_words
@@ -12,12 +16,15 @@ from ._count_monosyllable_words import count_monosyllable_words
 from ._count_polysyllable_words import count_polysyllable_words
 from ._count_sentences import count_sentences
 from ._count_syllables import count_syllables
+from ._count_word_syllables import count_word_syllables, syllabify_many
 from ._count_spache_difficult_words import count_spache_difficult_words
 
 __all__ = [
     "count_chars",
     "count_arabic_long_words",
+    "arabic_syllable_parts",
     "count_arabic_syllables",
+    "sum_arabic_syllables",
     "count_complex_arabic_words",
     "count_faseeh",
     "count_difficult_words",
@@ -29,5 +36,7 @@ __all__ = [
     "count_polysyllable_words",
     "count_sentences",
     "count_syllables",
+    "count_word_syllables",
     "count_spache_difficult_words",
+    "syllabify_many",
 ]
@@ -5,6 +5,10 @@ import re
 from ..utils._typed_cache import typed_cache
 from ..selections._list_words import list_words
 
+# tashkeel: fatha | damma | kasra
+RE_TASHKEEL = re.compile(r"[\u064E\u064F\u0650]")
+RE_LONG_TASHKEEL = re.compile(r"[\u064E\u064F\u0650](?=[\u0627\u0648\u064a])")
+
 
 @typed_cache
 def count_arabic_syllables(text: str, rm_apostrophe: bool = True) -> int:
@@ -25,37 +29,56 @@ def count_arabic_syllables(text: str, rm_apostrophe: bool = True) -> int:
         Number of arabic syllables.
 
     """
-    short_count = 0
-    long_count = 0
-
-    # tashkeel: fatha | damma | kasra
-    tashkeel = [r"\u064E", r"\u064F", r"\u0650"]
-    char_list = [c for w in list_words(text, rm_apostrophe=rm_apostrophe) for c in w]
-
-    for t in tashkeel:
-        for i, c in enumerate(char_list):
-            if c != t:
-                continue
-
-            # only if a character is a tashkeel, has a successor
-            # and is followed by an alef, waw or yaaA ...
-            if i + 1 < len(char_list) and char_list[i + 1] in [
-                "\u0627",
-                "\u0648",
-                "\u064a",
-            ]:
-                # ... increment long syllable count
-                long_count += 1
-            else:
-                short_count += 1
+    return sum_arabic_syllables(arabic_syllable_parts(text, rm_apostrophe))
+
+
+def arabic_syllable_parts(
+    text: str, rm_apostrophe: bool = True
+) -> tuple[int, int, int, int]:
+    """Count the parts of the Arabic syllable count of a text.
+
+    The parts of consecutive pieces of a text add up to those of the text (but
+    for a diacritic ending a piece, whose successor is in the next one), so
+    that `sum_arabic_syllables` of their sums counts the syllables of the
+    whole text.
+
+    Parameters
+    ----------
+    text : str
+        A text string.
+    rm_apostrophe : bool, optional
+        Remove apostrophes with other punctuation. The default is True.
+
+    Returns
+    -------
+    tuple[int, int, int, int]
+        The number of short, long and stressed syllables, and of characters
+        other than alef, alef maksura, whitespace and sentence punctuation.
+
+    """
+    # A tashkeel is long if followed by an alef, waw or yaaA, also in the
+    # next word
+    long_count = short_count = 0
+    if RE_TASHKEEL.search(text):
+        chars = "".join(list_words(text, rm_apostrophe=rm_apostrophe))
+        long_count = len(RE_LONG_TASHKEEL.findall(chars))
+        short_count = len(RE_TASHKEEL.findall(chars)) - long_count
 
     # stress syllables: tanween fatih | tanween damm | tanween kasr
     # | shadda
     stress_pattern = re.compile(r"[\u064B\u064C\u064D\u0651]")
     stress_count = len(stress_pattern.findall(text))
 
+    n_chars = len(re.sub(r"[\u0627\u0649\?\.\!\,\s*]", "", text))
+
+    return short_count, long_count, stress_count, n_chars
+
+
+def sum_arabic_syllables(parts: tuple[int, ...]) -> int:
+    """Count the Arabic syllables of a text from the parts given by
+    `arabic_syllable_parts`."""
+    short_count, long_count, stress_count, n_chars = parts
     if short_count == 0:
-        text = re.sub(r"[\u0627\u0649\?\.\!\,\s*]", "", text)
-        short_count = len(text) - 2
+        short_count = n_chars - 2
 
     return short_count + 2 * (long_count + stress_count)
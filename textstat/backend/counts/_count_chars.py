@@ -4,6 +4,8 @@ import re
 
 from ..utils._typed_cache import typed_cache
 
+RE_WHITESPACE = re.compile(r"\s")
+
 
 @typed_cache
 def count_chars(text: str, ignore_spaces: bool) -> int:
@@ -23,5 +25,5 @@ def count_chars(text: str, ignore_spaces: bool) -> int:
 
     """
     if ignore_spaces:
-        text = re.sub(r"\s", "", text)
+        text = RE_WHITESPACE.sub("", text)
     return len(text)
@@ -2,8 +2,7 @@ from __future__ import annotations
 
 
 from ..utils._typed_cache import typed_cache
-from ..selections._set_difficult_words import set_difficult_words
-from ..selections._list_difficult_words import list_difficult_words
+from ..selections._token_table import count_above, get_token_table
 
 
 @typed_cache
@@ -31,6 +30,9 @@ def count_difficult_words(
         Number of difficult words.
 
     """
+    table = get_token_table(text)
     if unique:
-        return len(set_difficult_words(text, syllable_threshold, lang))
-    return len(list_difficult_words(text, syllable_threshold, lang))
+        counts = table.unique_difficult_syllable_counts(lang)
+    else:
+        counts = table.difficult_syllable_counts(lang)
+    return count_above(counts, syllable_threshold - 1)
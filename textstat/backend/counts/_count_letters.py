@@ -3,7 +3,9 @@ from __future__ import annotations
 import re
 
 from ..utils._typed_cache import typed_cache
-from ..transformations._remove_punctuation import remove_punctuation
+
+# Whitespace and punctuation
+RE_NON_LETTER = re.compile(r"\W")
 
 
 @typed_cache
@@ -21,6 +23,4 @@ def count_letters(text: str) -> int:
         The number of letters in text.
 
     """
-    # Ignore spaces
-    text = re.sub(r"\s", "", text)
-    return len(remove_punctuation(text, rm_apostrophe=True))
+    return len(RE_NON_LETTER.sub("", text))
@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 from ..utils._typed_cache import typed_cache
-from ..selections._list_words import list_words
+from ..selections._token_table import count_above, get_token_table
 
 
 @typed_cache
@@ -20,4 +20,4 @@ def count_long_words(text: str, threshold: int = 6) -> int:
     int
         Number of words with more than `threshold` letters.
     """
-    return len([w for w in list_words(text, rm_apostrophe=True) if len(w) > threshold])
+    return count_above(get_token_table(text).letter_length_counts, threshold)
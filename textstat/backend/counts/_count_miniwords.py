@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 from ..utils._typed_cache import typed_cache
-from ..selections._list_words import list_words
+from ..selections._token_table import count_at_most, get_token_table
 
 
 @typed_cache
@@ -20,7 +20,4 @@ def count_miniwords(text: str, max_size: int = 3) -> int:
     count : int
 
     """
-    count = len(
-        [word for word in list_words(text, rm_apostrophe=True) if len(word) <= max_size]
-    )
-    return count
+    return count_at_most(get_token_table(text).letter_length_counts, max_size)
@@ -1,8 +1,7 @@
 from __future__ import annotations
 
 from ..utils._typed_cache import typed_cache
-from ._count_syllables import count_syllables
-from ..selections._list_words import list_words
+from ..selections._token_table import count_above, get_token_table
 
 
 @typed_cache
@@ -23,4 +22,4 @@ def count_polysyllable_words(text: str, lang: str) -> int:
         Number of words with three or more syllables.
 
     """
-    return len([w for w in list_words(text) if count_syllables(w, lang) >= 3])
+    return count_above(get_token_table(text).syllable_counts(lang), 2)
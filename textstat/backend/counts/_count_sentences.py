@@ -1,11 +1,12 @@
 from __future__ import annotations
 
 from ..utils._typed_cache import typed_cache
+from ..selections._list_sentences import list_sentences
 
 
 @typed_cache
 def count_sentences(text: str) -> int:
-    """Count sentences using NLTK Punkt only.
+    """Count sentences with the engine set by `set_sentence_engine`.
 
     Parameters
     ----------
@@ -17,18 +18,14 @@ def count_sentences(text: str) -> int:
     int
         Number of sentences in the text. Will be 0 for empty string, otherwise >= 1.
 
-    Requires:
+    The default engine, "punkt", uses NLTK's Punkt model and requires:
       pip install nltk
       python -c "import nltk; nltk.download('punkt')"
 
-    This function will raise a LookupError from NLTK if punkt is not installed.
+    It will raise a LookupError from NLTK if punkt is not installed. The
+    "fast" engine uses the rule-based `split_sentences` and needs no NLTK data.
     """
     if not text or not text.strip():
         return 0
 
-    from nltk.tokenize import sent_tokenize  # will raise LookupError if punkt missing
-
-    sents = sent_tokenize(text)
-    # filter out empty/whitespace-only segments
-    count = len([s for s in sents if s and s.strip()])
-    return max(1, count)
+    return max(1, len(list_sentences(text)))
@@ -0,0 +1,100 @@
+from __future__ import annotations
+
+from typing import Iterable
+
+from ..utils._get_cmu_syllables import get_cmu_syllables
+from ..utils._get_cmudict import get_cmudict
+from ..utils._get_pyphen import get_pyphen
+from ..utils._get_syllable_table import get_syllable_table, store_syllables
+from ..utils._instrument import instrumented
+
+
+def count_word_syllables(word: str, lang: str) -> int:
+    """Estimate the number of syllables in a single word.
+
+    The word is lowercased and looked up as given, like every word of a text
+    in `count_syllables`, so it should be a word of `list_words`. The counts
+    are kept in the syllable table of the language (see `get_syllable_table`),
+    so every distinct word is looked up in the CMU dictionary or hyphenated by
+    Pyphen only once.
+
+    Parameters
+    ----------
+    word : str
+        A word.
+    lang : str
+        The language of the word.
+
+    Returns
+    -------
+    int
+        Number of syllables in the word.
+    """
+    key = word.lower()
+    table = get_syllable_table(lang)
+    count = table.get(key)
+    if count is None:
+        count = _lookup_syllables(key, lang)
+        store_syllables(table, {key: count})
+    return count
+
+
+def syllabify_many(words: Iterable[str], lang: str) -> list[int]:
+    """Estimate the number of syllables of many words.
+
+    Each distinct word of the batch is looked up in the syllable table of the
+    language once, and the words missing from it are looked up in the CMU
+    dictionary or hyphenated by Pyphen once and added to the table together.
+    The results are the same as `count_word_syllables` for every word.
+
+    Parameters
+    ----------
+    words : Iterable[str]
+        The words.
+    lang : str
+        The language of the words.
+
+    Returns
+    -------
+    list[int]
+        Number of syllables of every word, in input order.
+    """
+    keys = [word.lower() for word in words]
+    table = get_syllable_table(lang)
+    counts = {key: table.get(key) for key in keys}
+    missing = {
+        key: _lookup_syllables(key, lang)
+        for key, count in counts.items()
+        if count is None
+    }
+    if missing:
+        store_syllables(table, missing)
+        counts.update(missing)
+    return [counts[key] for key in keys]  # type: ignore[misc]
+
+
+def _lookup_syllables(word: str, lang: str) -> int:
+    """Count the syllables of a lowercase word without punctuation."""
+    count = _cmu_syllables(word, lang)
+    if count is None:
+        count = _pyphen_syllables(word, lang)
+    return count
+
+
+@instrumented("syllables.cmu")
+def _cmu_syllables(word: str, lang: str) -> int | None:
+    cmu_syllables = get_cmu_syllables(lang)
+    if cmu_syllables is not None:
+        return cmu_syllables.get(word)
+    # Fall back to NLTK's copy of CMUdict if the table is not installed
+    cmu_dict = get_cmudict(lang)
+    try:
+        cmu_phones = cmu_dict[word][0]  # type: ignore[index]
+        return sum(1 for p in cmu_phones if p[-1].isdigit())
+    except (TypeError, IndexError, KeyError):
+        return None
+
+
+@instrumented("syllables.pyphen")
+def _pyphen_syllables(word: str, lang: str) -> int:
+    return len(get_pyphen(lang).positions(word)) + 1
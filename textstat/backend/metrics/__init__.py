@@ -24,7 +24,7 @@ from ._smog_index import smog_index
 from ._spache_readability import spache_readability
 from ._syllables_per_word import syllables_per_word
 from ._szigriszt_pazos import szigriszt_pazos
-from ._text_standard import text_standard
+from ._text_standard import consensus_grade, consensus_grades, text_standard
 from ._wiener_sachtextformel import wiener_sachtextformel
 from ._words_per_sentence import words_per_sentence
 
@@ -33,6 +33,8 @@ __all__ = [
     "automated_readability_index",
     "chars_per_word",
     "coleman_liau_index",
+    "consensus_grade",
+    "consensus_grades",
     "crawford",
     "dale_chall_readability_score",
     "dale_chall_readability_score_v2",
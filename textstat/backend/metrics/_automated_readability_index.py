@@ -4,6 +4,7 @@ from ._words_per_sentence import words_per_sentence
 from ._chars_per_word import chars_per_word
 
 from ..utils._typed_cache import typed_cache
+from . import _formulas
 
 
 @typed_cache
@@ -29,10 +30,6 @@ def automated_readability_index(text: str) -> float:
         (4.71*n\ characters/n\ words)+(0.5*n\ words/n\ sentences)-21.43
 
     """
-    a = chars_per_word(text)
-    b = words_per_sentence(text)
-
-    if a == 0 or b == 0:
-        return 0.0
-
-    return (4.71 * a) + (0.5 * b) - 21.43
+    return _formulas.automated_readability_index(
+        chars_per_word(text), words_per_sentence(text)
+    )
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 from ..utils._typed_cache import typed_cache
+from . import _formulas
 from ._letters_per_word import letters_per_word
 from ._sentences_per_word import sentences_per_word
 
@@ -28,10 +29,6 @@ def coleman_liau_index(text: str) -> float:
         (0.058*n\ letters/n\ words)-(0.296*n\ sentences/n\ words)-15.8
 
     """
-    letters = letters_per_word(text) * 100
-    sentences = sentences_per_word(text) * 100
-
-    if letters == 0 or sentences == 0:
-        return 0.0
-
-    return (0.058 * letters) - (0.296 * sentences) - 15.8
+    return _formulas.coleman_liau_index(
+        letters_per_word(text), sentences_per_word(text)
+    )
@@ -2,6 +2,7 @@ from __future__ import annotations
 
 
 from ..utils._typed_cache import typed_cache
+from . import _formulas
 from ._sentences_per_word import sentences_per_word
 from ._syllables_per_word import syllables_per_word
 
@@ -33,11 +34,4 @@ def crawford(text: str, lang: str) -> float:
         (-0.205*n\ sentences/n\ words)+(0.049*n\ syllables/n\ words)-3.407
 
     """
-    # Calculating __ per 100 words
-    sentences_per_words = 100 * sentences_per_word(text)
-    syllables_per_words = 100 * syllables_per_word(text, lang)
-
-    if sentences_per_words == 0 or syllables_per_words == 0:
-        return 0.0
-
-    return -0.205 * sentences_per_words + 0.049 * syllables_per_words - 3.407
+    return _formulas.crawford(sentences_per_word(text), syllables_per_word(text, lang))
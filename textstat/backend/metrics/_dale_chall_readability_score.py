@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 from ..utils._typed_cache import typed_cache
+from . import _formulas
 from ..counts._count_words import count_words
 from ..counts._count_difficult_words import count_difficult_words
 from ._words_per_sentence import words_per_sentence
@@ -11,10 +12,10 @@ def dale_chall_readability_score(text: str, lang: str) -> float:
     r"""Estimate the Dale-Chall readability score.
 
     Deviations from the original Dale-Chall readability score:
-    - For now, regular inflections of words in the Dale-Chall list of easy
-        words are counted as difficult words
-        (see documentation for `is_difficult_word`). This may change in the
-        future.
+    - Regular inflections of words in the Dale-Chall list of easy words are
+        counted as difficult words, unless the matching is set to
+        "inflections" with `set_easy_word_matching` (see documentation for
+        `is_difficult_word`).
     - Proper names are also counted as difficult words. This is unlikely to
         change.
 
@@ -45,16 +46,8 @@ def dale_chall_readability_score(text: str, lang: str) -> float:
     accurate readability assessment, as repeated difficult words should
     not disproportionately affect the score.
     """
-    word_count = count_words(text)
-    hard_count = count_difficult_words(text, lang, syllable_threshold=2, unique=True)
-
-    try:
-        per_difficult_words = 100 * hard_count / word_count
-    except ZeroDivisionError:
-        return 0.0
-
-    score = (0.1579 * per_difficult_words) + (0.0496 * words_per_sentence(text))
-
-    if per_difficult_words > 5:
-        score += 3.6365
-    return score
+    return _formulas.dale_chall_readability_score(
+        count_words(text),
+        count_difficult_words(text, lang, syllable_threshold=2, unique=True),
+        words_per_sentence(text),
+    )
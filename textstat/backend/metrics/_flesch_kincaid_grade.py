@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 from ..utils._typed_cache import typed_cache
+from . import _formulas
 from ._words_per_sentence import words_per_sentence
 from ._syllables_per_word import syllables_per_word
 
@@ -30,10 +31,6 @@ def flesch_kincaid_grade(text: str, lang: str) -> float:
         (.39*avg\ sentence\ length)+(11.8*avg\ syllables\ per\ word)-15.59
 
     """
-    sentence_length = words_per_sentence(text)
-    syllables = syllables_per_word(text, lang)
-
-    if sentence_length == 0 or syllables == 0:
-        return 0.0
-
-    return (0.39 * sentence_length) + (11.8 * syllables) - 15.59
+    return _formulas.flesch_kincaid_grade(
+        words_per_sentence(text), syllables_per_word(text, lang)
+    )
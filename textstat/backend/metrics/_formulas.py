@@ -0,0 +1,305 @@
+from __future__ import annotations
+
+from ..utils._get_lang_cfg import get_lang_cfg
+from ..utils._get_lang_root import get_lang_root
+
+# The formulas of the metrics, computed from the counts and averages of a text.
+# They are shared by the metric functions, which count the text with the
+# functions of `backend.counts`, and by `analysis.BaseAnalysis`, which counts
+# it once for all metrics.
+
+
+def automated_readability_index(
+    chars_per_word: float, words_per_sentence: float
+) -> float:
+    """See `metrics.automated_readability_index`."""
+    if chars_per_word == 0 or words_per_sentence == 0:
+        return 0.0
+
+    return (4.71 * chars_per_word) + (0.5 * words_per_sentence) - 21.43
+
+
+def coleman_liau_index(letters_per_word: float, sentences_per_word: float) -> float:
+    """See `metrics.coleman_liau_index`."""
+    letters = letters_per_word * 100
+    sentences = sentences_per_word * 100
+
+    if letters == 0 or sentences == 0:
+        return 0.0
+
+    return (0.058 * letters) - (0.296 * sentences) - 15.8
+
+
+def crawford(sentences_per_word: float, syllables_per_word: float) -> float:
+    """See `metrics.crawford`."""
+    # Calculating __ per 100 words
+    sentences_per_words = 100 * sentences_per_word
+    syllables_per_words = 100 * syllables_per_word
+
+    if sentences_per_words == 0 or syllables_per_words == 0:
+        return 0.0
+
+    return -0.205 * sentences_per_words + 0.049 * syllables_per_words - 3.407
+
+
+def dale_chall_readability_score(
+    n_words: int, n_difficult_words: int, words_per_sentence: float
+) -> float:
+    """See `metrics.dale_chall_readability_score`."""
+    try:
+        per_difficult_words = 100 * n_difficult_words / n_words
+    except ZeroDivisionError:
+        return 0.0
+
+    score = (0.1579 * per_difficult_words) + (0.0496 * words_per_sentence)
+
+    if per_difficult_words > 5:
+        score += 3.6365
+    return score
+
+
+def dale_chall_readability_score_v2(
+    n_words: int, n_difficult_words: int, words_per_sentence: float
+) -> float:
+    """See `metrics.dale_chall_readability_score_v2`."""
+    try:
+        pdw = 100 * n_difficult_words / n_words
+    except ZeroDivisionError:
+        return 0.0
+    raw_score = 0.1579 * (pdw) + 0.0496 * words_per_sentence
+    adjusted_score = raw_score
+    if raw_score > 0.05:
+        adjusted_score = raw_score + 3.6365
+    return adjusted_score
+
+
+def new_dale_chall_readability_score(
+    n_words: int, n_difficult_words: int, n_sentences: int
+) -> float:
+    """See `metrics.new_dale_chall_readability_score`."""
+    try:
+        pdw = 100 * n_difficult_words / n_words
+        asl = n_words / n_sentences
+    except ZeroDivisionError:
+        return 0.0
+
+    return 64 - (0.95 * pdw) - (0.69 * asl)
+
+
+def fernandez_huerta(words_per_sentence: float, syllables_per_word: float) -> float:
+    """See `metrics.fernandez_huerta`."""
+    if words_per_sentence == 0 or syllables_per_word == 0:
+        return 0.0
+
+    return 206.84 - (60 * syllables_per_word) - (1.02 * words_per_sentence)
+
+
+def flesch_kincaid_grade(
+    words_per_sentence: float, syllables_per_word: float
+) -> float:
+    """See `metrics.flesch_kincaid_grade`."""
+    if words_per_sentence == 0 or syllables_per_word == 0:
+        return 0.0
+
+    return (0.39 * words_per_sentence) + (11.8 * syllables_per_word) - 15.59
+
+
+def flesch_reading_ease(
+    words_per_sentence: float, syllables_per_word: float, lang: str
+) -> float:
+    """See `metrics.flesch_reading_ease`."""
+    lang_root = get_lang_root(lang)
+
+    if words_per_sentence == 0 or syllables_per_word == 0:
+        return 0.0
+
+    return (
+        get_lang_cfg(lang_root, "fre_base")
+        - get_lang_cfg(lang_root, "fre_sentence_length") * words_per_sentence
+        - get_lang_cfg(lang_root, "fre_syll_per_word") * syllables_per_word
+    )
+
+
+def gulpease_index(sentences_per_word: float, chars_per_word: float) -> float:
+    """See `metrics.gulpease_index`."""
+    if sentences_per_word == 0 or chars_per_word == 0:
+        return 0.0
+
+    return (300 * sentences_per_word) - (10 * chars_per_word) + 89
+
+
+def gunning_fog(
+    n_words: int, n_difficult_words: int, words_per_sentence: float
+) -> float:
+    """See `metrics.gunning_fog`."""
+    try:
+        per_diff_words = 100 * n_difficult_words / n_words
+    except ZeroDivisionError:
+        return 0.0
+
+    return 0.4 * (words_per_sentence + per_diff_words)
+
+
+def gutierrez_polini(letters_per_word: float, words_per_sentence: float) -> float:
+    """See `metrics.gutierrez_polini`."""
+    if letters_per_word == 0 or words_per_sentence == 0:
+        return 0.0
+
+    return 95.2 - 9.7 * letters_per_word - 0.35 * words_per_sentence
+
+
+def linsear_write_formula(
+    n_words: int,
+    n_easy_words: int,
+    n_difficult_words: int,
+    n_sentences: int,
+    strict_lower: bool,
+) -> float:
+    """See `metrics.linsear_write_formula`."""
+    if strict_lower and n_words < 100:
+        return 0.0
+
+    try:
+        number = float((n_easy_words * 1 + n_difficult_words * 3) / n_sentences)
+    except ZeroDivisionError:
+        return 0.0
+
+    if number <= 20:
+        number -= 2
+
+    return number / 2
+
+
+def lix(n_words: int, n_long_words: int, words_per_sentence: float) -> float:
+    """See `metrics.lix`."""
+    try:
+        per_long_words = 100 * n_long_words / n_words
+    except ZeroDivisionError:
+        return 0.0
+    return words_per_sentence + per_long_words
+
+
+def mcalpine_eflaw(n_words: int, n_miniwords: int, n_sentences: int) -> float:
+    """See `metrics.mcalpine_eflaw`."""
+    try:
+        return (n_words + n_miniwords) / n_sentences
+    except ZeroDivisionError:
+        return 0.0
+
+
+def osman(
+    n_words: int,
+    n_complex_words: int,
+    n_long_words: int,
+    n_syllables: int,
+    n_faseeh: int,
+    words_per_sentence: float,
+) -> float:
+    """See `metrics.osman`."""
+    try:
+        complex_word_rate = n_complex_words / n_words
+        long_word_rate = n_long_words / n_words
+        syllables_per_word = n_syllables / n_words
+        faseeh_per_word = n_faseeh / n_words
+    except ZeroDivisionError:
+        return 0.0
+
+    return (
+        200.791
+        - (1.015 * words_per_sentence)
+        - (
+            24.181
+            * (
+                complex_word_rate
+                + syllables_per_word
+                + faseeh_per_word
+                + long_word_rate
+            )
+        )
+    )
+
+
+def powers_sumner_kearl(n_words: int, n_syllables: int, n_sentences: int) -> float:
+    """See `metrics.powers_sumner_kearl`."""
+    # count_sentences only gives 0 for texts without words
+    if n_words == 0 or n_sentences == 0:
+        return 0.0
+
+    asl = n_words / n_sentences
+    syllables_per_word = n_syllables / n_words
+    return (0.0778 * asl) + (4.55 * syllables_per_word) - 2.2029
+
+
+def reading_time(n_chars: int, ms_per_char: float) -> float:
+    """See `metrics.reading_time`."""
+    return ms_per_char * n_chars / 1000
+
+
+def rix(n_long_words: int, n_sentences: int) -> float:
+    """See `metrics.rix`."""
+    try:
+        return n_long_words / n_sentences
+    except ZeroDivisionError:
+        return 0.0
+
+
+def smog_index(n_polysyllable_words: int, n_sentences: int) -> float:
+    """See `metrics.smog_index`."""
+    try:
+        return (1.043 * (30 * (n_polysyllable_words / n_sentences)) ** 0.5) + 3.1291
+    except ZeroDivisionError:
+        return 0.0
+
+
+def spache_readability(
+    n_words: int, n_difficult_words: int, words_per_sentence: float
+) -> float:
+    """See `metrics.spache_readability`."""
+    try:
+        pdw = 100 * n_difficult_words / n_words
+    except ZeroDivisionError:
+        return 0.0
+    return (0.121 * words_per_sentence) + (0.082 * pdw) + 0.659
+
+
+def szigriszt_pazos(
+    n_words: int, n_syllables: int, n_sentences: int, lang: str
+) -> float:
+    """See `metrics.szigriszt_pazos`."""
+    try:
+        return (
+            get_lang_cfg(lang, "fre_base")
+            - 62.3 * (n_syllables / n_words)
+            - (n_words / n_sentences)
+        )
+    except ZeroDivisionError:
+        return 0.0
+
+
+def wiener_sachtextformel(
+    n_words: int,
+    n_polysyllable_words: int,
+    n_long_words: int,
+    n_monosyllable_words: int,
+    words_per_sentence: float,
+    variant: int,
+) -> float:
+    """See `metrics.wiener_sachtextformel`."""
+    try:
+        ms = 100 * n_polysyllable_words / n_words
+        sl = words_per_sentence
+        iw = 100 * n_long_words / n_words
+        es = 100 * n_monosyllable_words / n_words
+    except ZeroDivisionError:
+        return 0.0
+
+    if variant == 1:
+        return (0.1935 * ms) + (0.1672 * sl) + (0.1297 * iw) - (0.0327 * es) - 0.875
+    elif variant == 2:
+        return (0.2007 * ms) + (0.1682 * sl) + (0.1373 * iw) - 2.779
+    elif variant == 3:
+        return (0.2963 * ms) + (0.1905 * sl) - 1.1144
+    elif variant == 4:
+        return (0.2744 * ms) + (0.2656 * sl) - 1.693
+    else:
+        raise ValueError("variant can only be an integer between 1 and 4")
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 from ..utils._typed_cache import typed_cache
+from . import _formulas
 from ._sentences_per_word import sentences_per_word
 from ._chars_per_word import chars_per_word
 
@@ -20,10 +21,4 @@ def gulpease_index(text: str) -> float:
     float
         The Gulpease Index for `text`
     """
-    spw = sentences_per_word(text)
-    cpw = chars_per_word(text)
-
-    if spw == 0 or cpw == 0:
-        return 0.0
-
-    return (300 * spw) - (10 * cpw) + 89
+    return _formulas.gulpease_index(sentences_per_word(text), chars_per_word(text))
@@ -2,6 +2,7 @@ from __future__ import annotations
 
 
 from ..utils._typed_cache import typed_cache
+from . import _formulas
 from ..utils._get_lang_cfg import get_lang_cfg
 from ..counts._count_words import count_words
 from ..counts._count_difficult_words import count_difficult_words
@@ -25,12 +26,8 @@ def gunning_fog(text: str, lang: str) -> float:
         The Gunning Fog Index for `text`.
     """
     syllable_threshold = int(get_lang_cfg(lang, "syllable_threshold"))
-    diff_words = count_difficult_words(text, lang, syllable_threshold, unique=True)
-    tot_words = count_words(text)
-
-    try:
-        per_diff_words = 100 * diff_words / tot_words
-    except ZeroDivisionError:
-        return 0.0
-
-    return 0.4 * (words_per_sentence(text) + per_diff_words)
+    return _formulas.gunning_fog(
+        count_words(text),
+        count_difficult_words(text, lang, syllable_threshold, unique=True),
+        words_per_sentence(text),
+    )
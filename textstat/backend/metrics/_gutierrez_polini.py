@@ -2,6 +2,7 @@ from __future__ import annotations
 
 
 from ..utils._typed_cache import typed_cache
+from . import _formulas
 from ._letters_per_word import letters_per_word
 from ._words_per_sentence import words_per_sentence
 
@@ -21,10 +22,4 @@ def gutierrez_polini(text: str) -> float:
     float
         The Gutierrez de Polini index for `text`
     """
-    lpw = letters_per_word(text)
-    wps = words_per_sentence(text)
-
-    if lpw == 0 or wps == 0:
-        return 0.0
-
-    return 95.2 - 9.7 * lpw - 0.35 * wps
+    return _formulas.gutierrez_polini(letters_per_word(text), words_per_sentence(text))
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 from ..utils._typed_cache import typed_cache
+from . import _formulas
 from ..counts._count_long_words import count_long_words
 from ..counts._count_words import count_words
 from ._words_per_sentence import words_per_sentence
@@ -33,11 +34,6 @@ def lix(text: str) -> float:
     C= Number of long words (More than 6 letters)
 
     """
-    words_len = count_words(text)
-    long_words = count_long_words(text)
-    try:
-        per_long_words = 100 * long_words / words_len
-    except ZeroDivisionError:
-        return 0.0
-    asl = words_per_sentence(text)
-    return asl + per_long_words
+    return _formulas.lix(
+        count_words(text), count_long_words(text), words_per_sentence(text)
+    )
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 from ..utils._typed_cache import typed_cache
+from . import _formulas
 from ..counts._count_words import count_words
 from ..counts._count_sentences import count_sentences
 from ..counts._count_miniwords import count_miniwords
@@ -23,10 +24,6 @@ def mcalpine_eflaw(text: str) -> float:
     float
         The McAlpine EFLAW readability score for `text`
     """
-    n_words = count_words(text)
-    n_sentences = count_sentences(text)
-    n_miniwords = count_miniwords(text, max_size=3)
-    try:
-        return (n_words + n_miniwords) / n_sentences
-    except ZeroDivisionError:
-        return 0.0
+    return _formulas.mcalpine_eflaw(
+        count_words(text), count_miniwords(text, max_size=3), count_sentences(text)
+    )
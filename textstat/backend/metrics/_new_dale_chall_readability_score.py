@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 from ..utils._typed_cache import typed_cache
+from . import _formulas
 from ..counts._count_words import count_words
 from ..counts._count_difficult_words import count_difficult_words
 from ..counts._count_sentences import count_sentences
@@ -42,15 +43,8 @@ def new_dale_chall_readability_score(text: str, lang: str) -> float:
     Reference:
     https://readabilityformulas.com/learn-about-the-new-dale-chall-readability-formula/
     """
-    word_count = count_words(text)
-    hard_count = count_difficult_words(text, lang, syllable_threshold=2, unique=True)
-    sent_count = count_sentences(text)
-
-    try:
-        pdw = 100 * hard_count / word_count
-        asl = word_count / sent_count
-    except ZeroDivisionError:
-        return 0.0
-
-    score = 64 - (0.95 * pdw) - (0.69 * asl)
-    return score
+    return _formulas.new_dale_chall_readability_score(
+        count_words(text),
+        count_difficult_words(text, lang, syllable_threshold=2, unique=True),
+        count_sentences(text),
+    )
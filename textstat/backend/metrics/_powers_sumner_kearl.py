@@ -4,6 +4,7 @@ from ..counts._count_words import count_words
 from ..counts._count_syllables import count_syllables
 from ..counts._count_sentences import count_sentences
 from ..utils._typed_cache import typed_cache
+from . import _formulas
 
 
 @typed_cache
@@ -36,31 +37,6 @@ def powers_sumner_kearl(text: str, lang: str) -> float:
 
     Returns 0.0 for empty input.
     """
-    # Handle empty or whitespace-only text
-    if not text or not text.strip():
-        return 0.0
-
-    # Get the counts
-    word_count = count_words(text)
-    syllable_count = count_syllables(text, lang)
-    sentence_count_value = count_sentences(text)
-
-    # Handle edge cases
-    if word_count == 0:
-        return 0.0
-
-    # Ensure sentence_count is at least 1 to avoid division by zero
-    # Note: count_sentences already returns max(1, count) for non-empty text
-    if sentence_count_value == 0:
-        sentence_count_value = 1
-
-    # Calculate Average Sentence Length (ASL)
-    asl = word_count / sentence_count_value
-
-    # Calculate syllables per word
-    syllables_per_word = syllable_count / word_count
-
-    # Calculate PSK score
-    psk = (0.0778 * asl) + (4.55 * syllables_per_word) - 2.2029
-
-    return psk
+    return _formulas.powers_sumner_kearl(
+        count_words(text), count_syllables(text, lang), count_sentences(text)
+    )
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 from ..utils._typed_cache import typed_cache
+from . import _formulas
 from ..counts._count_chars import count_chars
 
 
@@ -20,4 +21,4 @@ def reading_time(text: str, ms_per_char: float) -> float:
     float
         The reading time for `text`.
     """
-    return ms_per_char * count_chars(text, ignore_spaces=True) / 1000
+    return _formulas.reading_time(count_chars(text, ignore_spaces=True), ms_per_char)
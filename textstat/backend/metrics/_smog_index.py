@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 from ..utils._typed_cache import typed_cache
+from . import _formulas
 from ..counts._count_sentences import count_sentences
 from ..counts._count_polysyllable_words import count_polysyllable_words
 
@@ -31,10 +32,6 @@ def smog_index(text: str, lang: str) -> float:
 
     Polysyllabic words are defined as words with more than 3 syllables.
     """
-    sentences = count_sentences(text)
-
-    poly_syllab = count_polysyllable_words(text, lang)
-    try:
-        return (1.043 * (30 * (poly_syllab / sentences)) ** 0.5) + 3.1291
-    except ZeroDivisionError:
-        return 0.0
+    return _formulas.smog_index(
+        count_polysyllable_words(text, lang), count_sentences(text)
+    )
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 from ..utils._typed_cache import typed_cache
+from . import _formulas
 from ..counts._count_words import count_words
 from ..counts._count_spache_difficult_words import count_spache_difficult_words
 from ._words_per_sentence import words_per_sentence
@@ -47,10 +48,8 @@ def spache_readability(text: str, lang: str) -> float:
     Spache, G. (1953). A new readability formula for primary-grade
     reading materials. The Elementary School Journal, 53(7), 410-413.
     """
-    total_no_of_words = count_words(text)
-    asl = words_per_sentence(text)
-    try:
-        pdw = 100 * count_spache_difficult_words(text, lang, unique=True) / total_no_of_words
-    except ZeroDivisionError:
-        return 0.0
-    return (0.121 * asl) + (0.082 * pdw) + 0.659
+    return _formulas.spache_readability(
+        count_words(text),
+        count_spache_difficult_words(text, lang, unique=True),
+        words_per_sentence(text),
+    )
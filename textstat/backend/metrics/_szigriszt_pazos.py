@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 from ..utils._typed_cache import typed_cache
-from ..utils._get_lang_cfg import get_lang_cfg
+from . import _formulas
 from ..counts._count_syllables import count_syllables
 from ..counts._count_words import count_words
 from ..counts._count_sentences import count_sentences
@@ -24,14 +24,6 @@ def szigriszt_pazos(text: str, lang: str) -> float:
     float
         The Szigriszt Pazos readability score for `text`
     """
-    syllables = count_syllables(text, lang)
-    total_words = count_words(text)
-    total_sentences = count_sentences(text)
-    try:
-        return (
-            get_lang_cfg(lang, "fre_base")
-            - 62.3 * (syllables / total_words)
-            - (total_words / total_sentences)
-        )
-    except ZeroDivisionError:
-        return 0.0
+    return _formulas.szigriszt_pazos(
+        count_words(text), count_syllables(text, lang), count_sentences(text), lang
+    )
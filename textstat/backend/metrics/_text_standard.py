@@ -2,16 +2,9 @@ from __future__ import annotations
 
 import math
 from collections import Counter
+from typing import Any, Sequence
 
 from ..utils._typed_cache import typed_cache
-from ._flesch_kincaid_grade import flesch_kincaid_grade
-from ._flesch_reading_ease import flesch_reading_ease
-from ._smog_index import smog_index
-from ._coleman_liau_index import coleman_liau_index
-from ._automated_readability_index import automated_readability_index
-from ._dale_chall_readability_score import dale_chall_readability_score
-from ._linsear_write_formula import linsear_write_formula
-from ._gunning_fog import gunning_fog
 
 
 @typed_cache
@@ -31,17 +24,63 @@ def text_standard(text: str, lang: str) -> float:
     float
         The Text Standard for `text`.
     """
+    # All eight scores are computed from one tokenization of the text
+    from ..analysis import analyze
+
+    return analyze(text, lang).text_standard()
+
+
+def consensus_grade(
+    flesch_kincaid_grade: float,
+    flesch_reading_ease: float,
+    smog_index: float,
+    coleman_liau_index: float,
+    automated_readability_index: float,
+    dale_chall_readability_score: float,
+    linsear_write_formula: float,
+    gunning_fog: float,
+) -> float:
+    """Find the readability consensus of the scores that make up the Text Standard.
+
+    Each grade-level score votes for its floor, ceiling and nearest integer, the
+    Flesch Reading Ease votes for the grade(s) of its band, and the most common
+    vote wins.
+
+    Parameters
+    ----------
+    flesch_kincaid_grade : float
+        The Flesch-Kincaid Grade.
+    flesch_reading_ease : float
+        The Flesch Reading Ease.
+    smog_index : float
+        The SMOG index.
+    coleman_liau_index : float
+        The Coleman-Liau index.
+    automated_readability_index : float
+        The Automated Readability Index.
+    dale_chall_readability_score : float
+        The Dale-Chall readability score.
+    linsear_write_formula : float
+        The Linsear-Write metric (computed with `strict_upper=True`).
+    gunning_fog : float
+        The Gunning Fog index.
+
+    Returns
+    -------
+    float
+        The Text Standard.
+    """
     grade: list[int] = []
 
     # Appending Flesch Kincaid Grade
-    score = flesch_kincaid_grade(text, lang)
+    score = flesch_kincaid_grade
     lower = math.floor(score)
     upper = math.ceil(score)
     near = round(score)
     grade.extend([lower, upper, near])
 
     # Appending Flesch Reading Ease
-    score = flesch_reading_ease(text, lang)
+    score = flesch_reading_ease
     if score < 100 and score >= 90:
         grade.append(5)
     elif score < 90 and score >= 80:
@@ -61,42 +100,42 @@ def text_standard(text: str, lang: str) -> float:
         grade.append(13)
 
     # Appending SMOG Index
-    score = smog_index(text, lang)
+    score = smog_index
     lower = math.floor(score)
     upper = math.ceil(score)
     near = round(score)
     grade.extend([lower, upper, near])
 
     # Appending Coleman_Liau_Index
-    score = coleman_liau_index(text)
+    score = coleman_liau_index
     lower = math.floor(score)
     upper = math.ceil(score)
     near = round(score)
     grade.extend([lower, upper, near])
 
     # Appending Automated_Readability_Index
-    score = automated_readability_index(text)
+    score = automated_readability_index
     lower = math.floor(score)
     upper = math.ceil(score)
     near = round(score)
     grade.extend([lower, upper, near])
 
     # Appending Dale_Chall_Readability_Score
-    score = dale_chall_readability_score(text, lang)
+    score = dale_chall_readability_score
     lower = math.floor(score)
     upper = math.ceil(score)
     near = round(score)
     grade.extend([lower, upper, near])
 
     # Appending Linsear_Write_Formula
-    score = linsear_write_formula(text, lang, strict_lower=False, strict_upper=True)
+    score = linsear_write_formula
     lower = math.floor(score)
     upper = math.ceil(score)
     near = round(score)
     grade.extend([lower, upper, near])
 
     # Appending Gunning Fog Index
-    score = gunning_fog(text, lang)
+    score = gunning_fog
     lower = math.floor(score)
     upper = math.ceil(score)
     near = round(score)
@@ -106,3 +145,114 @@ def text_standard(text: str, lang: str) -> float:
     d = Counter(grade)
     final_grade = d.most_common(1)
     return float(final_grade[0][0])
+
+
+# The grades the Flesch Reading Ease votes for, by the lower bound of its band;
+# scores outside all bands vote for 13
+FRE_GRADE_BANDS = [
+    (90, (5,)),
+    (80, (6,)),
+    (70, (7,)),
+    (60, (8, 9)),
+    (50, (10,)),
+    (40, (11,)),
+    (30, (12,)),
+]
+
+
+def consensus_grades(
+    flesch_kincaid_grade: Sequence[float],
+    flesch_reading_ease: Sequence[float],
+    smog_index: Sequence[float],
+    coleman_liau_index: Sequence[float],
+    automated_readability_index: Sequence[float],
+    dale_chall_readability_score: Sequence[float],
+    linsear_write_formula: Sequence[float],
+    gunning_fog: Sequence[float],
+) -> list[float]:
+    """Find the readability consensus of many texts at once.
+
+    Each argument holds one score per text; the result is the same as calling
+    `consensus_grade` for every text. The votes of all texts are counted
+    together with NumPy if it is installed.
+
+    Parameters
+    ----------
+    flesch_kincaid_grade : Sequence[float]
+        The Flesch-Kincaid Grades.
+    flesch_reading_ease : Sequence[float]
+        The Flesch Reading Eases.
+    smog_index : Sequence[float]
+        The SMOG indices.
+    coleman_liau_index : Sequence[float]
+        The Coleman-Liau indices.
+    automated_readability_index : Sequence[float]
+        The Automated Readability Indices.
+    dale_chall_readability_score : Sequence[float]
+        The Dale-Chall readability scores.
+    linsear_write_formula : Sequence[float]
+        The Linsear-Write metrics (computed with `strict_upper=True`).
+    gunning_fog : Sequence[float]
+        The Gunning Fog indices.
+
+    Returns
+    -------
+    list[float]
+        The Text Standard of every text.
+    """
+    grade_scores = [
+        flesch_kincaid_grade,
+        smog_index,
+        coleman_liau_index,
+        automated_readability_index,
+        dale_chall_readability_score,
+        linsear_write_formula,
+        gunning_fog,
+    ]
+    try:
+        import numpy as np
+    except ImportError:
+        np = None
+    if np is None or not all(
+        math.isfinite(score) for scores in grade_scores for score in scores
+    ):
+        # math.floor raises on infinite scores, leave that to consensus_grade
+        return [
+            consensus_grade(*scores)
+            for scores in zip(
+                flesch_kincaid_grade,
+                flesch_reading_ease,
+                smog_index,
+                coleman_liau_index,
+                automated_readability_index,
+                dale_chall_readability_score,
+                linsear_write_formula,
+                gunning_fog,
+            )
+        ]
+
+    def votes(scores: Sequence[float]) -> list[Any]:
+        array = np.asarray(scores, dtype=float)
+        return [np.floor(array), np.ceil(array), np.round(array)]
+
+    # The votes of a text in the order consensus_grade casts them, one row per
+    # text; the Flesch Reading Ease casts one or two votes
+    fre = np.asarray(flesch_reading_ease, dtype=float)
+    fre_votes = np.full(len(fre), 13.0)
+    fre_second = np.full(len(fre), np.nan)
+    for lower, band_votes in FRE_GRADE_BANDS:
+        in_band = (fre >= lower) & (fre < lower + 10)
+        fre_votes[in_band] = band_votes[0]
+        if len(band_votes) > 1:
+            fre_second[in_band] = band_votes[1]
+    columns = [*votes(flesch_kincaid_grade), fre_votes, fre_second]
+    for scores in grade_scores[1:]:
+        columns.extend(votes(scores))
+    grid = np.stack(columns, axis=1)
+
+    # Count how often every vote of a text is cast (NaN matches nothing), then
+    # take the first vote with the highest count, as Counter.most_common does
+    counts = (grid[:, :, None] == grid[:, None, :]).sum(axis=2)
+    winners = counts.argmax(axis=1)
+    # np.ceil and np.round give -0.0 where consensus_grade gives 0.0
+    return (grid[np.arange(len(grid)), winners] + 0.0).tolist()
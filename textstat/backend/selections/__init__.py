@@ -1,13 +1,28 @@
 from ._list_difficult_words import list_difficult_words
 from ._set_difficult_words import set_difficult_words
 from ._list_words import list_words
+from ._list_sentences import (
+    SENTENCE_ENGINES,
+    get_sentence_engine,
+    list_sentences,
+    set_sentence_engine,
+)
 from ._list_spache_difficult_words import list_spache_difficult_words
 from ._set_spache_difficult_words import set_spache_difficult_words
+from ._split_sentences import split_sentences
+from ._token_table import TokenTable, get_token_table
 
 __all__ = [
     "list_difficult_words",
     "set_difficult_words",
     "list_words",
+    "list_sentences",
+    "SENTENCE_ENGINES",
+    "get_sentence_engine",
+    "set_sentence_engine",
     "list_spache_difficult_words",
     "set_spache_difficult_words",
+    "split_sentences",
+    "TokenTable",
+    "get_token_table",
 ]
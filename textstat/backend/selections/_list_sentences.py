@@ -0,0 +1,74 @@
+from __future__ import annotations
+
+from ..utils._typed_cache import cache_clear, typed_cache
+from ._split_sentences import split_sentences
+
+SENTENCE_ENGINES = ("punkt", "fast")
+_sentence_engine = "punkt"
+
+
+def set_sentence_engine(engine: str) -> None:
+    """Set how `list_sentences` splits texts into sentences.
+
+    Changing the engine clears the cached results, which may depend on it.
+
+    Parameters
+    ----------
+    engine : str
+        "punkt" (default) for NLTK's Punkt model, or "fast" for the rule-based
+        `split_sentences`, which is several times faster and needs no NLTK data.
+
+    Returns
+    -------
+    None
+
+    """
+    global _sentence_engine
+    if engine not in SENTENCE_ENGINES:
+        raise ValueError(f"engine must be one of {SENTENCE_ENGINES}, got {engine!r}")
+    if engine != _sentence_engine:
+        _sentence_engine = engine
+        cache_clear()
+
+
+def get_sentence_engine() -> str:
+    """Get the sentence engine set with `set_sentence_engine`.
+
+    Returns
+    -------
+    str
+        "punkt" or "fast".
+
+    """
+    return _sentence_engine
+
+
+@typed_cache
+def list_sentences(text: str) -> list[str]:
+    """Get a list of the sentences in the text using NLTK Punkt, or the fast
+    rule-based splitter if selected with `set_sentence_engine`.
+
+    Empty and whitespace-only segments are dropped.
+
+    Parameters
+    ----------
+    text : str
+        A text string.
+
+    Returns
+    -------
+    List[str]
+        A list of the sentences.
+
+    This function will raise a LookupError from NLTK if punkt is not installed
+    and the "punkt" engine is used.
+    """
+    if not text or not text.strip():
+        return []
+
+    if _sentence_engine == "fast":
+        return split_sentences(text)
+
+    from nltk.tokenize import sent_tokenize  # will raise LookupError if punkt missing
+
+    return [s for s in sent_tokenize(text) if s and s.strip()]
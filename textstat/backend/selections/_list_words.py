@@ -2,10 +2,12 @@ from __future__ import annotations
 import re
 
 
-from ..transformations._remove_punctuation import remove_punctuation
+from ..transformations._remove_punctuation import strip_punctuation
 from ..utils._typed_cache import typed_cache
 from ..utils.constants import RE_CONTRACTION_APOSTROPHE
 
+RE_CONTRACTION = re.compile(RE_CONTRACTION_APOSTROPHE)
+
 
 @typed_cache
 def list_words(
@@ -50,15 +52,16 @@ def list_words(
         A list of the words.
 
     """
-    if split_em_dashes:
+    # Every step is a single pass over the text, skipped if it has nothing to do
+    if split_em_dashes and "—" in text:
         # Replace em dashes (—) with spaces to split words
-        text = re.sub(r"—", " ", text)
-    if split_hyphens:
-        text = re.sub(r"-", " ", text)
+        text = text.replace("—", " ")
+    if split_hyphens and "-" in text:
+        text = text.replace("-", " ")
     if rm_punctuation:
-        text = remove_punctuation(text, rm_apostrophe=rm_apostrophe)
+        text = strip_punctuation(text, rm_apostrophe=rm_apostrophe)
     if lowercase:
         text = text.lower()
-    if split_contractions:
-        text = re.sub(RE_CONTRACTION_APOSTROPHE, " ", text)
+    if split_contractions and "'" in text:
+        text = RE_CONTRACTION.sub(" ", text)
     return text.split()
@@ -0,0 +1,67 @@
+from __future__ import annotations
+
+import re
+
+from ..utils.constants import SENTENCE_ABBREVIATIONS, SENTENCE_FINAL_ABBREVIATIONS
+
+# Terminal punctuation, optional closing quotes or brackets, whitespace, and the
+# first character of the next sentence
+RE_SENTENCE_END = re.compile(r"([.!?…]+)[\"'”’»)\]]*\s+(?=(\S))")
+# The end of the word before a period, long enough for any abbreviation
+RE_ABBREVIATION = re.compile(r"[\w.'’-]{1,8}$")
+ABBREVIATIONS = frozenset().union(*SENTENCE_ABBREVIATIONS.values())
+
+
+def split_sentences(text: str) -> list[str]:
+    """Split the text into sentences with fast rules instead of a trained model.
+
+    A sentence ends at ".", "!", "?" or "…" (optionally followed by closing
+    quotes or brackets) and whitespace, except after a period that follows an
+    initial or an abbreviation (see `constants.SENTENCE_ABBREVIATIONS`), and
+    except after an ellipsis or a number followed by a lowercase letter. The
+    abbreviations that often end a sentence, such as "etc", end it when the
+    next word is capitalized. These rules follow the decisions of NLTK Punkt,
+    but without its trained model the two engines can still differ.
+
+    Parameters
+    ----------
+    text : str
+        A text string.
+
+    Returns
+    -------
+    list[str]
+        A list of the sentences, stripped of surrounding whitespace.
+
+    """
+    sentences = []
+    start = 0
+    for match in RE_SENTENCE_END.finditer(text):
+        terminator = match.group(1)
+        next_char = match.group(2)
+        end = match.start()
+        if terminator == ".":
+            word = RE_ABBREVIATION.search(text, max(0, end - 8), end)
+            if word is not None and (
+                word.start() == 0 or not text[word.start() - 1].isalnum()
+            ):
+                word_lower = word.group().lower()
+                if word_lower in ABBREVIATIONS:
+                    if not (
+                        word_lower in SENTENCE_FINAL_ABBREVIATIONS
+                        and next_char.isupper()
+                    ):
+                        continue
+                elif len(word_lower) == 1 and word_lower.isalpha():
+                    continue
+        # Any other word followed by a period ends the sentence, as in Punkt
+        if (
+            terminator[-1] in ".…"
+            and next_char.islower()
+            and (terminator != "." or text[end - 1].isdigit())
+        ):
+            continue
+        sentences.append(text[start:match.end()])
+        start = match.end()
+    sentences.append(text[start:])
+    return [s.strip() for s in sentences if s and not s.isspace()]
@@ -0,0 +1,225 @@
+from __future__ import annotations
+
+import sys
+from array import array
+from collections import Counter
+from itertools import accumulate
+from operator import methodcaller, sub
+from typing import Iterable
+
+from ..counts._count_word_syllables import syllabify_many
+from ..utils._get_word_table import get_easy_word_index
+from ..utils._typed_cache import typed_cache
+from ._list_words import list_words
+
+
+class TokenTable:
+    """The words of a text in flat arrays instead of lists of strings.
+
+    The words (`list_words(text)`) are kept in one string, `buffer`, separated
+    by single spaces, with their lengths in `lengths` (and their offsets in
+    `offsets`). The per-word values are kept in parallel arrays, computed once
+    per language, and in histograms indexed by value, so that counting the
+    words with more or fewer letters or syllables than a threshold sums a few
+    bins instead of iterating over the words.
+
+    Parameters
+    ----------
+    text : str
+        A text string.
+
+    Attributes
+    ----------
+    buffer : str
+        The words, separated by single spaces.
+    lengths : array
+        The length of every word.
+    letter_lengths : array
+        The number of letters of every word, apostrophes excluded.
+    letter_length_counts : array
+        The number of words with every number of letters (words without
+        letters excluded).
+    """
+
+    def __init__(self, text: str) -> None:
+        words = list_words(text)
+        self.buffer = " ".join(words)
+        self.lengths = array("I", map(len, words))
+        if "'" in self.buffer:
+            self.letter_lengths = array(
+                "I",
+                map(sub, self.lengths, map(methodcaller("count", "'"), words)),
+            )
+        else:
+            self.letter_lengths = self.lengths
+        self.letter_length_counts = _histogram(self.letter_lengths, skip_zero=True)
+        self._offsets: array | None = None
+        self._syllables: dict[str, array] = {}
+        self._easy_flags: dict[str, bytearray] = {}
+        self._syllable_counts: dict[str, array] = {}
+        self._difficult_words: dict[str, dict[str, int]] = {}
+        self._difficult_syllable_counts: dict[str, array] = {}
+        self._unique_difficult_syllable_counts: dict[str, array] = {}
+
+    def __len__(self) -> int:
+        return len(self.lengths)
+
+    def __sizeof__(self) -> int:
+        # The table is measured when it is cached, before the offsets and the
+        # per-language arrays are filled, so count those not filled yet at the
+        # size they will have (for one language).
+        n_words = len(self.lengths)
+        size = (
+            object.__sizeof__(self)
+            + sys.getsizeof(self.buffer)
+            + sum(
+                sys.getsizeof(values)
+                for values in (
+                    self.lengths,
+                    self.letter_lengths,
+                    self.letter_length_counts,
+                    *self._syllables.values(),
+                    *self._easy_flags.values(),
+                    *self._syllable_counts.values(),
+                    *self._difficult_syllable_counts.values(),
+                    *self._unique_difficult_syllable_counts.values(),
+                )
+            )
+            + sum(
+                sys.getsizeof(words) + sum(map(sys.getsizeof, words))
+                for words in self._difficult_words.values()
+            )
+        )
+        word_array_size = sys.getsizeof(array("I")) + n_words * self.lengths.itemsize
+        if self._offsets is None:
+            size += word_array_size
+        else:
+            size += sys.getsizeof(self._offsets)
+        if not self._syllables:
+            size += word_array_size
+        if not self._easy_flags:
+            size += sys.getsizeof(bytearray(n_words))
+        return size
+
+    @property
+    def offsets(self) -> array:
+        """The offset of every word in `buffer`, computed on first use."""
+        if self._offsets is None:
+            positions = list(accumulate((n + 1 for n in self.lengths), initial=0))
+            self._offsets = array("I", positions[:-1])
+        return self._offsets
+
+    def word(self, index: int) -> str:
+        """Get the word at `index`."""
+        offset = self.offsets[index]
+        return self.buffer[offset:offset + self.lengths[index]]
+
+    def words(self) -> list[str]:
+        """Get the words as a list of strings."""
+        return self.buffer.split()
+
+    def syllables(self, lang: str) -> array:
+        """The number of syllables of every word in a language."""
+        syllables = self._syllables.get(lang)
+        if syllables is None:
+            syllables = self._syllables[lang] = array(
+                "I", syllabify_many(self.words(), lang)
+            )
+        return syllables
+
+    def easy_flags(self, lang: str) -> bytearray:
+        """Whether every word is in the easy word list of a language (1) or not
+        (0)."""
+        flags = self._easy_flags.get(lang)
+        if flags is None:
+            easy_word_set = get_easy_word_index(lang)
+            flags = self._easy_flags[lang] = bytearray(
+                word.lower() in easy_word_set for word in self.words()
+            )
+        return flags
+
+    def syllable_counts(self, lang: str) -> array:
+        """The number of words with every number of syllables in a language."""
+        counts = self._syllable_counts.get(lang)
+        if counts is None:
+            counts = self._syllable_counts[lang] = _histogram(self.syllables(lang))
+        return counts
+
+    def difficult_words(self, lang: str) -> dict[str, int]:
+        """The number of syllables of every distinct word not in the easy word
+        list of a language."""
+        words = self._difficult_words.get(lang)
+        if words is None:
+            distinct = list(
+                dict.fromkeys(
+                    word
+                    for word, easy in zip(self.words(), self.easy_flags(lang))
+                    if not easy
+                )
+            )
+            # Like `is_difficult_word`, count the syllables of the lowercase word
+            words = self._difficult_words[lang] = dict(
+                zip(distinct, syllabify_many([w.lower() for w in distinct], lang))
+            )
+        return words
+
+    def difficult_syllable_counts(self, lang: str) -> array:
+        """The number of words not in the easy word list of a language with
+        every number of syllables."""
+        counts = self._difficult_syllable_counts.get(lang)
+        if counts is None:
+            difficult_words = self.difficult_words(lang)
+            counts = self._difficult_syllable_counts[lang] = _histogram(
+                difficult_words[word]
+                for word, easy in zip(self.words(), self.easy_flags(lang))
+                if not easy
+            )
+        return counts
+
+    def unique_difficult_syllable_counts(self, lang: str) -> array:
+        """The number of distinct words not in the easy word list of a language
+        with every number of syllables."""
+        counts = self._unique_difficult_syllable_counts.get(lang)
+        if counts is None:
+            counts = self._unique_difficult_syllable_counts[lang] = _histogram(
+                self.difficult_words(lang).values()
+            )
+        return counts
+
+
+def _histogram(values: Iterable[int], skip_zero: bool = False) -> array:
+    counts = Counter(values)
+    if skip_zero:
+        counts.pop(0, None)
+    histogram = array("I", [0]) * (max(counts) + 1 if counts else 0)
+    for value, n in counts.items():
+        histogram[value] = n
+    return histogram
+
+
+def count_above(histogram: array, threshold: int) -> int:
+    """Count the values of a histogram greater than `threshold`."""
+    return sum(histogram[max(threshold + 1, 0):])
+
+
+def count_at_most(histogram: array, threshold: int) -> int:
+    """Count the values of a histogram lower than or equal to `threshold`."""
+    return sum(histogram[:max(threshold + 1, 0)])
+
+
+@typed_cache
+def get_token_table(text: str) -> TokenTable:
+    """Get the token table of a text.
+
+    Parameters
+    ----------
+    text : str
+        A text string.
+
+    Returns
+    -------
+    TokenTable
+        The words of `text` and their letter and syllable counts in arrays.
+
+    """
+    return TokenTable(text)
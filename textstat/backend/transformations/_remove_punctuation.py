@@ -5,6 +5,13 @@ import re
 from ..utils._typed_cache import typed_cache
 from ..utils.constants import RE_NONCONTRACTION_APOSTROPHE
 
+RE_PUNCTUATION = re.compile(r"[^\w\s]")
+# Non-apostrophe single quotation marks and all punctuation but apostrophes, in
+# one pass
+RE_PUNCTUATION_BUT_APOSTROPHES = re.compile(
+    RE_NONCONTRACTION_APOSTROPHE + r"|[^\w\s\']"
+)
+
 
 @typed_cache
 def remove_punctuation(
@@ -30,14 +37,12 @@ def remove_punctuation(
         A copy of the input text with punctuation removed.
 
     """
+    return strip_punctuation(text, rm_apostrophe)
+
+
+def strip_punctuation(text: str, rm_apostrophe: bool) -> str:
+    """Uncached `remove_punctuation`, for texts that are only transformed on the
+    way to other results."""
     if rm_apostrophe:
-        # remove all punctuation
-        punctuation_regex = r"[^\w\s]"
-    else:
-        # remove non-apostrophe single quotation marks
-        text = re.sub(RE_NONCONTRACTION_APOSTROPHE, "", text)
-        # remove all punctuation except apostrophes
-        punctuation_regex = r"[^\w\s\']"
-
-    text = re.sub(punctuation_regex, "", text)
-    return text
+        return RE_PUNCTUATION.sub("", text)
+    return RE_PUNCTUATION_BUT_APOSTROPHES.sub("", text)
@@ -1,21 +1,96 @@
+from ._get_cmu_syllables import (
+    CmuSyllables,
+    build_cmu_syllables,
+    get_cmu_syllables,
+)
 from ._get_cmudict import get_cmudict
+from ._disk_cache import (
+    DiskCache,
+    DiskCacheInfo,
+    configure_disk_cache,
+    disk_cache_clear,
+    disk_cache_info,
+)
 from ._get_grade_suffix import get_grade_suffix
 from ._get_lang_cfg import get_lang_cfg
 from ._get_lang_easy_words import get_lang_easy_words
 from ._get_lang_root import get_lang_root
-from ._get_pyphen import get_pyphen
+from ._get_pyphen import get_pyphen, has_pyphen
 from ._get_spache_easy_words import get_spache_easy_words
-from ._typed_cache import typed_cache
+from ._get_word_table import (
+    EASY_WORD_MATCHING,
+    WordTable,
+    build_word_table,
+    build_word_tables,
+    get_easy_word_index,
+    get_easy_word_matching,
+    get_easy_word_table,
+    get_inflected_word_table,
+    get_spache_word_table,
+    inflect_words,
+    set_easy_word_matching,
+)
+from ._get_syllable_table import (
+    get_syllable_table,
+    load_syllable_table,
+    save_syllable_table,
+)
+from ._instrument import Instrumentation, instrument, instrumented
+from ._typed_cache import (
+    CacheInfo,
+    cache_clear,
+    cache_families,
+    cache_info,
+    cached_functions,
+    configure_cache,
+    resource_cache,
+    typed_cache,
+    word_cache,
+)
 from . import constants
 
 __all__ = [
+    "CmuSyllables",
+    "build_cmu_syllables",
+    "get_cmu_syllables",
     "get_cmudict",
+    "DiskCache",
+    "DiskCacheInfo",
+    "configure_disk_cache",
+    "disk_cache_clear",
+    "disk_cache_info",
     "get_grade_suffix",
     "get_lang_cfg",
     "get_lang_easy_words",
     "get_lang_root",
     "get_pyphen",
+    "has_pyphen",
     "get_spache_easy_words",
+    "EASY_WORD_MATCHING",
+    "WordTable",
+    "build_word_table",
+    "build_word_tables",
+    "get_easy_word_index",
+    "get_easy_word_matching",
+    "get_easy_word_table",
+    "get_inflected_word_table",
+    "get_spache_word_table",
+    "inflect_words",
+    "set_easy_word_matching",
+    "get_syllable_table",
+    "load_syllable_table",
+    "save_syllable_table",
+    "Instrumentation",
+    "instrument",
+    "instrumented",
+    "CacheInfo",
+    "cache_clear",
+    "cache_families",
+    "cache_info",
+    "cached_functions",
+    "configure_cache",
+    "resource_cache",
     "typed_cache",
+    "word_cache",
     "constants",
 ]
@@ -0,0 +1,310 @@
+from __future__ import annotations
+
+import os
+import threading
+import time
+from functools import update_wrapper
+from typing import Any, Callable, NamedTuple, TYPE_CHECKING
+
+from .constants import DISK_CACHE_MAX_ENTRIES
+
+if TYPE_CHECKING:
+    import sqlite3
+
+    from .constants import T, P
+
+# Results of other types are computed but not stored
+_STORED_TYPES = (int, float, str)
+# Record that an entry was read at most this often, in seconds, so that hits
+# are not all writes
+_ACCESS_RESOLUTION = 3600.0
+# Check the number of entries every this many stores of a process
+_EVICT_EVERY = 256
+
+
+class DiskCacheInfo(NamedTuple):
+    """Statistics of the persistent cache."""
+
+    path: str
+    hits: int
+    misses: int
+    max_entries: int | None
+    entries: int
+    nbytes: int
+
+
+class DiskCache:
+    """An SQLite file holding the results of the metric functions.
+
+    The results are keyed by a digest of the name of the function, its
+    arguments (the texts by their own digest), the sentence engine, the easy
+    word matching and the textstat version, so a new version never reads the
+    results of an older one. Any number of threads and processes may share the
+    file: every thread has its own connection and the database is in
+    write-ahead-log mode. When there are more than `max_entries` results, the
+    least recently read tenth is evicted.
+
+    Parameters
+    ----------
+    path : str or PathLike
+        The database file, created if it does not exist.
+    max_entries : int or None, optional
+        The number of results kept. None for no limit. The default is
+        1,000,000.
+    timeout : float, optional
+        How long to wait for another process writing the file, in seconds. The
+        default is 30.
+
+    """
+
+    def __init__(
+        self,
+        path: str | os.PathLike[str],
+        max_entries: int | None = DISK_CACHE_MAX_ENTRIES,
+        timeout: float = 30.0,
+    ) -> None:
+        if max_entries is not None and max_entries < 1:
+            raise ValueError("max_entries must be at least 1")
+        self.path = os.fspath(path)
+        self.max_entries = max_entries
+        self.timeout = timeout
+        self.hits = 0
+        self.misses = 0
+        self._stores = 0
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._connections: list[sqlite3.Connection] = []
+        # Create the table now, so that configuration errors surface here
+        self._connection()
+
+    def _connection(self) -> sqlite3.Connection:
+        local = self._local
+        # Forked processes must not share the connections of their parent
+        if getattr(local, "pid", None) != os.getpid():
+            import sqlite3
+
+            connection = sqlite3.connect(
+                self.path,
+                timeout=self.timeout,
+                isolation_level=None,
+                check_same_thread=False,
+            )
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute("PRAGMA synchronous=NORMAL")
+            connection.execute(
+                "CREATE TABLE IF NOT EXISTS results ("
+                "key BLOB PRIMARY KEY, value, accessed REAL NOT NULL"
+                ") WITHOUT ROWID"
+            )
+            connection.execute(
+                "CREATE INDEX IF NOT EXISTS results_accessed ON results (accessed)"
+            )
+            local.connection = connection
+            local.pid = os.getpid()
+            with self._lock:
+                self._connections.append(connection)
+        return local.connection
+
+    def get(self, key: bytes) -> tuple[bool, Any]:
+        """Get the result stored under `key`, and whether there was one."""
+        import sqlite3
+
+        try:
+            connection = self._connection()
+            row = connection.execute(
+                "SELECT value, accessed FROM results WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                self.misses += 1
+                return False, None
+            now = time.time()
+            if now - row[1] > _ACCESS_RESOLUTION:
+                connection.execute(
+                    "UPDATE results SET accessed = ? WHERE key = ?", (now, key)
+                )
+        except sqlite3.Error:
+            # The cache is best effort, e.g. when the file is locked for longer
+            # than `timeout`
+            self.misses += 1
+            return False, None
+        self.hits += 1
+        return True, row[0]
+
+    def put(self, key: bytes, value: Any) -> None:
+        """Store `value` under `key`, if it is a number or a string."""
+        import sqlite3
+
+        if type(value) not in _STORED_TYPES:
+            return
+        try:
+            connection = self._connection()
+            connection.execute(
+                "INSERT OR REPLACE INTO results VALUES (?, ?, ?)",
+                (key, value, time.time()),
+            )
+            self._stores += 1
+            if self.max_entries is not None and self._stores % _EVICT_EVERY == 0:
+                self._evict(connection)
+        except sqlite3.Error:
+            pass
+
+    def _evict(self, connection: sqlite3.Connection) -> None:
+        assert self.max_entries is not None
+        (entries,) = connection.execute("SELECT count(*) FROM results").fetchone()
+        if entries > self.max_entries:
+            excess = entries - self.max_entries + self.max_entries // 10
+            connection.execute(
+                "DELETE FROM results WHERE key IN ("
+                "SELECT key FROM results ORDER BY accessed LIMIT ?)",
+                (excess,),
+            )
+
+    def clear(self) -> None:
+        """Delete all stored results."""
+        self._connection().execute("DELETE FROM results")
+        self.hits = 0
+        self.misses = 0
+
+    def info(self) -> DiskCacheInfo:
+        """Get the statistics of the cache."""
+        (entries,) = (
+            self._connection().execute("SELECT count(*) FROM results").fetchone()
+        )
+        nbytes = sum(
+            os.path.getsize(path)
+            for path in (self.path, self.path + "-wal")
+            if os.path.exists(path)
+        )
+        return DiskCacheInfo(
+            self.path, self.hits, self.misses, self.max_entries, entries, nbytes
+        )
+
+    def close(self) -> None:
+        """Close the connections of all threads."""
+        with self._lock:
+            connections, self._connections = self._connections, []
+        for connection in connections:
+            connection.close()
+        self._local = threading.local()
+
+
+_disk_cache: DiskCache | None = None
+_local = threading.local()
+
+
+def configure_disk_cache(
+    path: str | os.PathLike[str] | None,
+    max_entries: int | None = DISK_CACHE_MAX_ENTRIES,
+    timeout: float = 30.0,
+) -> None:
+    """Keep the results of the metric functions in a file, across processes
+    and runs.
+
+    The persistent cache is read after the in-memory caches, and only for the
+    metrics called directly, not for the metrics they are built from.
+
+    Parameters
+    ----------
+    path : str, PathLike or None
+        The SQLite database file, created if it does not exist. None to stop
+        using the persistent cache (the file is kept).
+    max_entries : int or None, optional
+        The number of results kept, see `DiskCache`. The default is 1,000,000.
+    timeout : float, optional
+        How long to wait for another process writing the file, in seconds. The
+        default is 30.
+
+    Returns
+    -------
+    None
+
+    """
+    global _disk_cache
+    disk_cache = (
+        None if path is None else DiskCache(path, max_entries, timeout)
+    )
+    previous, _disk_cache = _disk_cache, disk_cache
+    if previous is not None:
+        previous.close()
+
+
+def disk_cache_info() -> DiskCacheInfo | None:
+    """Get the statistics of the persistent cache, or None if it is not
+    configured."""
+    disk_cache = _disk_cache
+    return None if disk_cache is None else disk_cache.info()
+
+
+def disk_cache_clear() -> None:
+    """Delete the results stored in the persistent cache, if it is
+    configured."""
+    disk_cache = _disk_cache
+    if disk_cache is not None:
+        disk_cache.clear()
+
+
+def persistent(name: str, func: Callable[P, T]) -> Callable[P, T]:
+    """Wrap `func` to read and store its results in the persistent cache set
+    with `configure_disk_cache`.
+
+    Parameters
+    ----------
+    name : str
+        The registry name of the function, e.g. "metrics.smog_index".
+    func : Callable
+        The function.
+
+    Returns
+    -------
+    Callable
+        The wrapped function.
+
+    """
+
+    def wrapper(*args: Any, **kwargs: Any) -> Any:
+        disk_cache = _disk_cache
+        if disk_cache is None or getattr(_local, "depth", 0):
+            return func(*args, **kwargs)
+        key = _make_key(name, args, kwargs)
+        if key is None:
+            return func(*args, **kwargs)
+        found, value = disk_cache.get(key)
+        if found:
+            return value
+        # The metrics this one is built from are not stored
+        _local.depth = 1
+        try:
+            value = func(*args, **kwargs)
+        finally:
+            _local.depth = 0
+        disk_cache.put(key, value)
+        return value
+
+    return update_wrapper(wrapper, func)  # type: ignore[return-value]
+
+
+def _make_key(name: str, args: tuple[Any, ...], kwargs: dict[str, Any]) -> bytes | None:
+    """Digest the call, or None if an argument is not a plain value."""
+    import hashlib
+
+    from ... import __version__
+    from ..selections._list_sentences import get_sentence_engine
+    from ._get_word_table import get_easy_word_matching
+
+    digest = hashlib.blake2b(digest_size=20)
+    settings = (__version__, get_sentence_engine(), get_easy_word_matching(), name)
+    digest.update(repr(settings).encode())
+    items = [(None, arg) for arg in args] + sorted(kwargs.items())
+    for keyword, value in items:
+        if keyword is not None:
+            digest.update(f"\0{keyword}=".encode())
+        if isinstance(value, str):
+            text = value.encode("utf-8", "surrogatepass")
+            # Length-prefix the texts so that no two argument lists collide
+            digest.update(b"\1%d:" % len(text))
+            digest.update(text)
+        elif value is None or isinstance(value, (bool, int, float)):
+            digest.update(b"\2" + repr(value).encode())
+        else:
+            return None
+    return digest.digest()
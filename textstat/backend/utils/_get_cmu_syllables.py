@@ -0,0 +1,133 @@
+from __future__ import annotations
+
+import mmap
+import os
+import sys
+
+from ._typed_cache import resource_cache
+from ._get_lang_root import get_lang_root
+
+CMU_SYLLABLES_RESOURCE = "resources/en/cmu_syllables.txt"
+
+# The resource modules are imported when first used, to keep `import textstat` fast
+if sys.version_info < (3, 9):
+
+    def _read_table() -> mmap.mmap | bytes:
+        import pkg_resources
+
+        return _map_file(
+            pkg_resources.resource_filename("textstat", CMU_SYLLABLES_RESOURCE)
+        )
+else:
+
+    def _read_table() -> mmap.mmap | bytes:
+        import importlib.resources as importlib_resources
+        import pathlib
+
+        ref = importlib_resources.files("textstat").joinpath(CMU_SYLLABLES_RESOURCE)
+        if isinstance(ref, pathlib.Path):
+            return _map_file(ref)
+        # Installed as a zip archive, the table cannot be memory-mapped
+        return ref.read_bytes()
+
+
+def _map_file(path: str | os.PathLike[str]) -> mmap.mmap:
+    with open(path, "rb") as f:
+        return mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+
+class CmuSyllables:
+    """Syllable counts of the words of the CMU Pronouncing Dictionary.
+
+    The table is a text file of "word count" lines sorted by the UTF-8 bytes
+    of the words, where count is the number of stressed phonemes of the first
+    pronunciation of the word. Words are found by binary search over the
+    memory-mapped file, so nothing is parsed up front.
+
+    Parameters
+    ----------
+    data : mmap.mmap or bytes
+        The contents of the table file.
+    """
+
+    def __init__(self, data: mmap.mmap | bytes) -> None:
+        self._data = data
+
+    def get(self, word: str) -> int | None:
+        """Get the syllable count of a lowercase word.
+
+        Parameters
+        ----------
+        word : str
+            A lowercase word.
+
+        Returns
+        -------
+        int or None
+            The syllable count, or None if the word is not in the dictionary.
+        """
+        key = word.encode("utf-8")
+        data = self._data
+        lo, hi = 0, len(data)
+        while lo < hi:
+            start = data.rfind(b"\n", 0, (lo + hi) // 2) + 1
+            end = data.find(b"\n", start)
+            sep = data.find(b" ", start, end)
+            line_word = data[start:sep]
+            if line_word == key:
+                return int(data[sep + 1:end])
+            if line_word < key:
+                lo = end + 1
+            else:
+                hi = start
+        return None
+
+
+@resource_cache
+def get_cmu_syllables(lang: str) -> CmuSyllables | None:
+    """Get the precompiled CMU syllable table for the given language. Currently
+    only English is supported.
+
+    Parameters
+    ----------
+    lang : str
+        The language of the text.
+
+    Returns
+    -------
+    CmuSyllables | None
+        The syllable table (or None if the language is not supported or the
+        table is not installed).
+    """
+    if get_lang_root(lang) != "en":
+        return None
+    try:
+        return CmuSyllables(_read_table())
+    except (FileNotFoundError, ValueError):
+        return None
+
+
+def build_cmu_syllables(path: str | os.PathLike[str]) -> None:
+    """Write the syllable table read by `get_cmu_syllables` from NLTK's copy of
+    the CMU Pronouncing Dictionary.
+
+    Parameters
+    ----------
+    path : str or PathLike
+        The file to write, normally textstat/resources/en/cmu_syllables.txt.
+
+    Returns
+    -------
+    None
+    """
+    import nltk
+
+    lines = [
+        (word.encode("utf-8"), sum(1 for p in phones[0] if p[-1].isdigit()))
+        for word, phones in nltk.corpus.cmudict.dict().items()
+        if phones
+    ]
+    lines.sort()
+    with open(path, "wb") as f:
+        for word, count in lines:
+            f.write(b"%s %d\n" % (word, count))
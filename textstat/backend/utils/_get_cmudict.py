@@ -1,13 +1,15 @@
 from __future__ import annotations
 
-import nltk
-from ._typed_cache import typed_cache
+from ._typed_cache import resource_cache
 from ._get_lang_root import get_lang_root
 
 
-@typed_cache
+@resource_cache
 def get_cmudict(lang: str) -> dict[str, list[list[str]]] | None:
     """Get a cmudict object for the given language. Currently only English is supported.
+
+    The dictionary is never downloaded here, see `textstat.resources.ensure`.
+
     Parameters
     ----------
     lang : str
@@ -19,10 +21,15 @@ def get_cmudict(lang: str) -> dict[str, list[list[str]]] | None:
         supported).
     """
     if get_lang_root(lang) == "en":
+        import nltk
+
         try:
             nltk.data.find("corpora/cmudict")
-        except LookupError:
-            nltk.download('cmudict', quiet=True)
+        except LookupError as e:
+            raise LookupError(
+                "NLTK's cmudict is not installed. Install it with "
+                "textstat.resources.ensure(['cmudict'], download=True)."
+            ) from e
         return nltk.corpus.cmudict.dict()
     else:
         return None
@@ -2,14 +2,16 @@ from __future__ import annotations
 
 import warnings
 
-from ._typed_cache import typed_cache
+from ._typed_cache import resource_cache
 from ._get_lang_root import get_lang_root
 import sys
 
+# The resource modules are imported when first used, to keep `import textstat` fast
 if sys.version_info < (3, 9):
-    import pkg_resources
 
     def _set_words(lang_root: str) -> set[str]:
+        import pkg_resources
+
         return {
             ln.decode("utf-8").strip()
             for ln in pkg_resources.resource_stream(
@@ -18,9 +20,10 @@ if sys.version_info < (3, 9):
             )
         }
 else:
-    import importlib.resources as importlib_resources
 
     def _set_words(lang_root: str) -> set[str]:
+        import importlib.resources as importlib_resources
+
         ref = importlib_resources.files("textstat").joinpath(
             f"resources/{lang_root}/easy_words.txt"
         )
@@ -28,7 +31,7 @@ else:
             return {ln.strip() for ln in f}
 
 
-@typed_cache
+@resource_cache
 def get_lang_easy_words(lang: str) -> set[str]:
     """Get the easy words for a given language. If the language is not supported,
     the easy words for english are returned.
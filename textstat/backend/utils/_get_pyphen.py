@@ -1,11 +1,14 @@
 from __future__ import annotations
 
-from pyphen import Pyphen  # type: ignore
+from typing import TYPE_CHECKING
 
-from ._typed_cache import typed_cache
+from ._typed_cache import resource_cache
 
+if TYPE_CHECKING:
+    from pyphen import Pyphen  # type: ignore
 
-@typed_cache
+
+@resource_cache
 def get_pyphen(lang: str) -> Pyphen:
     """Get a pyphen object for the given language.
 
@@ -19,4 +22,25 @@ def get_pyphen(lang: str) -> Pyphen:
     Pyphen
         A Pyphen object for the given language.
     """
+    from pyphen import Pyphen  # type: ignore
+
     return Pyphen(lang=lang)
+
+
+def has_pyphen(lang: str) -> bool:
+    """Check whether Pyphen has a hyphenation dictionary for the given
+    language, i.e. whether the syllables of its words can be counted.
+
+    Parameters
+    ----------
+    lang : str
+        The language of the text.
+
+    Returns
+    -------
+    bool
+        True if `get_pyphen(lang)` finds a dictionary.
+    """
+    from pyphen import language_fallback  # type: ignore
+
+    return language_fallback(lang) is not None
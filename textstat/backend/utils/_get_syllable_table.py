@@ -0,0 +1,99 @@
+from __future__ import annotations
+
+import json
+import os
+import threading
+from itertools import islice
+from typing import Mapping
+
+from ._typed_cache import resource_cache
+from .constants import SYLLABLE_TABLE_SIZE
+
+# Serializes inserts, as evicting iterates over the table
+_table_lock = threading.Lock()
+
+
+@resource_cache
+def get_syllable_table(lang: str) -> dict[str, int]:
+    """Get the word to syllable count table of a language.
+
+    The table is filled by `count_word_syllables` and `syllabify_many` as
+    words are counted and is shared by every word-level caller, separately
+    from the document caches.
+
+    Parameters
+    ----------
+    lang : str
+        The language of the text.
+
+    Returns
+    -------
+    dict[str, int]
+        The syllable counts of the words seen so far.
+    """
+    return {}
+
+
+def store_syllables(table: dict[str, int], counts: Mapping[str, int]) -> None:
+    """Add counts to a syllable table, evicting its oldest entries so that it
+    holds at most `SYLLABLE_TABLE_SIZE` words.
+
+    Parameters
+    ----------
+    table : dict[str, int]
+        A table of `get_syllable_table`.
+    counts : Mapping[str, int]
+        The syllable counts of some words.
+
+    Returns
+    -------
+    None
+    """
+    if len(counts) > SYLLABLE_TABLE_SIZE:
+        # Only the last counts fit
+        counts = dict(islice(counts.items(), len(counts) - SYLLABLE_TABLE_SIZE, None))
+    with _table_lock:
+        overflow = len(table) + len(counts) - SYLLABLE_TABLE_SIZE
+        # Dicts keep insertion order
+        for key in list(islice(table, max(overflow, 0))):
+            del table[key]
+        table.update(counts)
+
+
+def save_syllable_table(lang: str, path: str | os.PathLike[str]) -> None:
+    """Write the syllable table of a language to a JSON file.
+
+    Parameters
+    ----------
+    lang : str
+        The language of the table.
+    path : str or PathLike
+        The file to write.
+
+    Returns
+    -------
+    None
+    """
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(get_syllable_table(lang), f, ensure_ascii=False)
+
+
+def load_syllable_table(lang: str, path: str | os.PathLike[str]) -> None:
+    """Add the syllable counts of a JSON file written by `save_syllable_table`
+    to the syllable table of a language. The table is kept within its size, see
+    `store_syllables`.
+
+    Parameters
+    ----------
+    lang : str
+        The language of the table.
+    path : str or PathLike
+        The file to read.
+
+    Returns
+    -------
+    None
+    """
+    with open(path, encoding="utf-8") as f:
+        counts = json.load(f)
+    store_syllables(get_syllable_table(lang), counts)
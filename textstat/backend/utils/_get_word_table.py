@@ -0,0 +1,417 @@
+from __future__ import annotations
+
+import mmap
+import os
+import struct
+import sys
+import warnings
+from array import array
+from typing import Iterable, Iterator
+from zlib import crc32
+
+from ._typed_cache import cache_clear, resource_cache
+from ._get_lang_root import get_lang_root
+from ._get_lang_easy_words import get_lang_easy_words
+from ._get_spache_easy_words import get_spache_easy_words
+
+WORD_TABLE_MAGIC = b"TSWT"
+# Magic, number of slots, number of words
+_HEADER = struct.Struct("<4sII")
+_SLOT = struct.Struct("<I")
+
+EASY_WORD_MATCHING = ("exact", "inflections")
+_easy_word_matching = "exact"
+_VOWELS = "aeiou"
+# Lookups probing the table before its words are copied into a set
+_PROBE_LIMIT = 1024
+
+# The resource modules are imported when first used, to keep `import textstat` fast
+if sys.version_info < (3, 9):
+
+    def _read_resource(resource: str) -> mmap.mmap | bytes:
+        import pkg_resources
+
+        return _map_file(pkg_resources.resource_filename("textstat", resource))
+
+    def _has_resource(resource: str) -> bool:
+        import pkg_resources
+
+        return pkg_resources.resource_exists("textstat", resource)
+else:
+
+    def _read_resource(resource: str) -> mmap.mmap | bytes:
+        import importlib.resources as importlib_resources
+        import pathlib
+
+        ref = importlib_resources.files("textstat").joinpath(resource)
+        if isinstance(ref, pathlib.Path):
+            return _map_file(ref)
+        # Installed as a zip archive, the table cannot be memory-mapped
+        return ref.read_bytes()
+
+    def _has_resource(resource: str) -> bool:
+        import importlib.resources as importlib_resources
+
+        return importlib_resources.files("textstat").joinpath(resource).is_file()
+
+
+def _map_file(path: str | os.PathLike[str]) -> mmap.mmap:
+    with open(path, "rb") as f:
+        return mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+
+class WordTable:
+    """A frozen set of words stored as an open-addressing hash table.
+
+    The table is a header, a power-of-two number of 4-byte slots and the UTF-8
+    words, each followed by a newline. A word is looked up at the slot given by
+    the CRC-32 of its bytes, then the following slots, until an empty slot.
+    Every slot holds the offset of a word after the slots, plus one, or 0 if
+    the slot is empty. The first lookups read the memory-mapped file directly,
+    so loading a table is cheap and its pages are shared by all the processes
+    using it; a process that keeps looking words up copies them into a set
+    after `_PROBE_LIMIT` lookups, as probing in Python is slower than hashing.
+
+    Parameters
+    ----------
+    data : mmap.mmap or bytes
+        The contents of a table file, see `build_word_table`.
+    """
+
+    def __init__(self, data: mmap.mmap | bytes) -> None:
+        magic, slots, words = _HEADER.unpack_from(data, 0)
+        if magic != WORD_TABLE_MAGIC:
+            raise ValueError("Not a word table")
+        self._data = data
+        self._mask = slots - 1
+        self._len = words
+        self._words_start = _HEADER.size + _SLOT.size * slots
+        self._probes = 0
+        self._words: frozenset[str] | None = None
+
+    @classmethod
+    def from_words(cls, words: Iterable[str]) -> WordTable:
+        """Build a table in memory from some words."""
+        return cls(_compile(words))
+
+    def __contains__(self, word: object) -> bool:
+        words = self._words
+        if words is not None:
+            try:
+                return word in words
+            except TypeError:
+                return False
+        if not isinstance(word, str):
+            return False
+        self._probes += 1
+        if self._probes > _PROBE_LIMIT:
+            self._words = frozenset(self)
+            return word in self._words
+        key = word.encode("utf-8", "surrogatepass") + b"\n"
+        data = self._data
+        mask = self._mask
+        words_start = self._words_start - 1
+        slot = crc32(key) & mask
+        while True:
+            (offset,) = _SLOT.unpack_from(data, _HEADER.size + _SLOT.size * slot)
+            if not offset:
+                return False
+            start = words_start + offset
+            if data[start:start + len(key)] == key:
+                return True
+            slot = (slot + 1) & mask
+
+    def __len__(self) -> int:
+        return self._len
+
+    def __iter__(self) -> Iterator[str]:
+        words = self._data[self._words_start:].decode("utf-8", "surrogatepass")
+        # Not `splitlines`, which also splits at other line boundaries
+        return iter(words.split("\n")[:-1])
+
+
+def _compile(words: Iterable[str]) -> bytes:
+    """Serialize the non-empty `words` as a word table."""
+    keys = sorted(
+        {word.encode("utf-8", "surrogatepass") for word in words if word}
+    )
+    slots = 2
+    # Keep the table at most half full, so that probes stay short
+    while slots < 2 * len(keys):
+        slots *= 2
+    table = array("I", bytes(4 * slots))
+    offset = 1
+    for key in keys:
+        slot = crc32(key + b"\n") & (slots - 1)
+        while table[slot]:
+            slot = (slot + 1) & (slots - 1)
+        table[slot] = offset
+        offset += len(key) + 1
+    if sys.byteorder == "big":
+        table.byteswap()
+    return b"".join(
+        (
+            _HEADER.pack(WORD_TABLE_MAGIC, slots, len(keys)),
+            table.tobytes(),
+            *(key + b"\n" for key in keys),
+        )
+    )
+
+
+def _get_word_table(lang: str, name: str, vocabulary: str) -> WordTable:
+    lang_root = get_lang_root(lang)
+    if lang_root != "en" and not _has_resource(f"resources/{lang_root}/{name}.txt"):
+        warnings.warn(
+            f"There is no {vocabulary} vocabulary for {lang_root}, using english.",
+            Warning,
+        )
+        lang_root = "en"
+    try:
+        return WordTable(_read_resource(f"resources/{lang_root}/{name}.bin"))
+    except (FileNotFoundError, ValueError):
+        # No precompiled table, build one from the word list
+        if name == "easy_words":
+            return WordTable.from_words(get_lang_easy_words(lang_root))
+        return WordTable.from_words(get_spache_easy_words(lang_root))
+
+
+@resource_cache
+def get_easy_word_table(lang: str) -> WordTable:
+    """Get the easy words for a given language as a memory-mapped word table.
+    If the language is not supported, the easy words for english are returned.
+
+    Parameters
+    ----------
+    lang : str
+        The language of the text.
+
+    Returns
+    -------
+    WordTable
+        The easy words, see `get_lang_easy_words`.
+    """
+    return _get_word_table(lang, "easy_words", "easy words")
+
+
+@resource_cache
+def get_spache_word_table(lang: str) -> WordTable:
+    """Get the Spache easy words for a given language as a memory-mapped word
+    table. If the language is not supported, the easy words for english are
+    returned.
+
+    Parameters
+    ----------
+    lang : str
+        The language of the text.
+
+    Returns
+    -------
+    WordTable
+        The Spache easy words, see `get_spache_easy_words`.
+    """
+    return _get_word_table(lang, "spache_words", "Spache easy words")
+
+
+@resource_cache
+def get_inflected_word_table(lang: str) -> WordTable:
+    """Get the easy words for a given language and their regular inflections
+    as a memory-mapped word table. The inflections (-s, -es, -ed, -ing, -er,
+    -est and -ly) are only added for English; for other languages this is the
+    table of `get_easy_word_table`.
+
+    Parameters
+    ----------
+    lang : str
+        The language of the text.
+
+    Returns
+    -------
+    WordTable
+        The easy words and their inflections.
+    """
+    if get_lang_root(lang) != "en":
+        return get_easy_word_table(lang)
+    try:
+        return WordTable(_read_resource("resources/en/easy_words_inflected.bin"))
+    except (FileNotFoundError, ValueError):
+        return WordTable.from_words(inflect_words(get_lang_easy_words("en")))
+
+
+def set_easy_word_matching(matching: str) -> None:
+    """Set how words are matched against the Dale-Chall easy word lists.
+
+    Changing the matching clears the cached results, which may depend on it.
+
+    Parameters
+    ----------
+    matching : str
+        "exact" (default) to count only the listed words as easy, or
+        "inflections" to also count their regular inflections (-s, -es, -ed,
+        -ing, -er, -est and -ly) as easy. Inflections are only added for
+        English.
+
+    Returns
+    -------
+    None
+
+    """
+    global _easy_word_matching
+    if matching not in EASY_WORD_MATCHING:
+        raise ValueError(
+            f"matching must be one of {EASY_WORD_MATCHING}, got {matching!r}"
+        )
+    if matching != _easy_word_matching:
+        _easy_word_matching = matching
+        cache_clear()
+
+
+def get_easy_word_matching() -> str:
+    """Get the matching set with `set_easy_word_matching`.
+
+    Returns
+    -------
+    str
+        "exact" or "inflections".
+
+    """
+    return _easy_word_matching
+
+
+def get_easy_word_index(lang: str) -> WordTable:
+    """Get the table the words of a text are looked up in to tell whether they
+    are easy, following `set_easy_word_matching`.
+
+    Parameters
+    ----------
+    lang : str
+        The language of the text.
+
+    Returns
+    -------
+    WordTable
+        The table of `get_easy_word_table` or `get_inflected_word_table`.
+    """
+    if _easy_word_matching == "inflections":
+        return get_inflected_word_table(lang)
+    return get_easy_word_table(lang)
+
+
+def inflect_words(words: Iterable[str]) -> set[str]:
+    """Get some words and their regular English inflections.
+
+    The inflections follow the spelling rules for -s, -es, -ed, -ing, -er,
+    -est and -ly (e.g. "carry": "carries", "carried", "carrying", "carrier",
+    "carriest" and "carrily"), so some of them are not English words. Words
+    with characters other than letters are not inflected.
+
+    Parameters
+    ----------
+    words : Iterable[str]
+        Lowercase words.
+
+    Returns
+    -------
+    set[str]
+        The words and their inflections.
+    """
+    forms: set[str] = set()
+    for word in words:
+        forms.add(word)
+        if word.isalpha() and len(word) > 1:
+            forms.update(_inflections(word))
+    return forms
+
+
+def _inflections(word: str) -> list[str]:
+    consonant_y = word[-1] == "y" and word[-2] not in _VOWELS
+    # "carry" is inflected as "carri-"
+    stem = word[:-1] + "i" if consonant_y else word
+    forms = []
+
+    if word.endswith(("s", "x", "z", "ch", "sh", "o")) or consonant_y:
+        forms.append(stem + "es")
+    if not word.endswith(("s", "x", "z", "ch", "sh")) and not consonant_y:
+        forms.append(word + "s")
+
+    if word[-1] == "e":
+        forms += [word + "d", word + "r", word + "st"]
+    else:
+        forms += [stem + "ed", stem + "er", stem + "est"]
+    # "stop": "stopped", "big": "bigger"
+    if (
+        len(word) > 2
+        and word[-1] not in _VOWELS + "wxy"
+        and word[-2] in _VOWELS
+        and word[-3] not in _VOWELS
+    ):
+        doubled = word + word[-1]
+        forms += [doubled + "ed", doubled + "er", doubled + "est", doubled + "ing"]
+
+    if word.endswith("ie"):
+        forms.append(word[:-2] + "ying")
+    elif word[-1] == "e" and not word.endswith(("ee", "ye", "oe")):
+        forms.append(word[:-1] + "ing")
+    else:
+        forms.append(word + "ing")
+
+    if word.endswith("le") and len(word) > 2 and word[-3] not in _VOWELS:
+        forms.append(word[:-1] + "y")
+    elif word.endswith("ic"):
+        forms.append(word + "ally")
+    elif word.endswith("ll"):
+        forms.append(word + "y")
+    else:
+        forms.append(stem + "ly")
+    return forms
+
+
+def build_word_table(
+    source: str | os.PathLike[str], path: str | os.PathLike[str]
+) -> None:
+    """Write the word table of a word list with one word per line.
+
+    Parameters
+    ----------
+    source : str or PathLike
+        The word list, e.g. textstat/resources/en/easy_words.txt.
+    path : str or PathLike
+        The file to write, e.g. textstat/resources/en/easy_words.bin.
+
+    Returns
+    -------
+    None
+    """
+    with open(source, encoding="utf-8") as f:
+        data = _compile(line.strip() for line in f)
+    with open(path, "wb") as f:
+        f.write(data)
+
+
+def build_word_tables(resources: str | os.PathLike[str]) -> None:
+    """Write the word table of every easy_words.txt and spache_words.txt under
+    a resources directory, next to it, and the table of the English easy words
+    and their inflections, en/easy_words_inflected.bin.
+
+    Parameters
+    ----------
+    resources : str or PathLike
+        The directory of the language directories, normally
+        textstat/resources.
+
+    Returns
+    -------
+    None
+    """
+    for lang_dir in sorted(os.scandir(resources), key=lambda entry: entry.name):
+        if not lang_dir.is_dir():
+            continue
+        for name in ("easy_words", "spache_words"):
+            source = os.path.join(lang_dir.path, f"{name}.txt")
+            if os.path.isfile(source):
+                build_word_table(source, os.path.join(lang_dir.path, f"{name}.bin"))
+    # The inflections are English
+    source = os.path.join(resources, "en", "easy_words.txt")
+    with open(source, encoding="utf-8") as f:
+        data = _compile(inflect_words(line.strip() for line in f))
+    with open(os.path.join(resources, "en", "easy_words_inflected.bin"), "wb") as f:
+        f.write(data)
@@ -0,0 +1,228 @@
+from __future__ import annotations
+
+import threading
+import time
+from contextlib import contextmanager
+from functools import update_wrapper
+from typing import Any, Callable, Iterator, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .constants import T, P
+
+
+class Instrumentation:
+    """The calls, time and cache hits of the backend functions recorded by
+    `instrument`.
+
+    Every backend function cached with `typed_cache` is recorded under
+    "<family>.<name>" (e.g. "counts.count_syllables"), and the uncached stages
+    decorated with `instrumented` under their own name (e.g.
+    "syllables.pyphen"). The per-word functions and resource loaders are not
+    recorded.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        # calls, seconds, self seconds, cache hits, cache misses
+        self._stats: dict[str, list[Any]] = {}
+
+    def _record(
+        self, name: str, seconds: float, self_seconds: float, hit: bool | None
+    ) -> None:
+        with self._lock:
+            stats = self._stats.get(name)
+            if stats is None:
+                stats = self._stats[name] = [0, 0.0, 0.0, None, None]
+            stats[0] += 1
+            stats[1] += seconds
+            stats[2] += self_seconds
+            if hit is not None:
+                if stats[3] is None:
+                    stats[3] = stats[4] = 0
+                stats[3 if hit else 4] += 1
+
+    def as_dict(self) -> dict[str, dict[str, Any]]:
+        """Get the statistics of every recorded function.
+
+        Returns
+        -------
+        dict[str, dict[str, Any]]
+            For every function, sorted by name:
+
+            - "calls": the number of calls.
+            - "seconds": the time spent in the function, including the
+              functions it called.
+            - "self_seconds": the time spent in the function, excluding the
+              recorded functions it called.
+            - "hits", "misses" and "hit_ratio": the cache hits, misses and the
+              share of hits, None for uncached functions.
+        """
+        with self._lock:
+            stats = {name: list(values) for name, values in self._stats.items()}
+        result = {}
+        for name in sorted(stats):
+            calls, seconds, self_seconds, hits, misses = stats[name]
+            hit_ratio = None
+            if hits is not None and hits + misses > 0:
+                hit_ratio = hits / (hits + misses)
+            result[name] = {
+                "calls": calls,
+                "seconds": seconds,
+                "self_seconds": self_seconds,
+                "hits": hits,
+                "misses": misses,
+                "hit_ratio": hit_ratio,
+            }
+        return result
+
+    def to_prometheus(self, prefix: str = "textstat") -> str:
+        """Format the statistics in the Prometheus text exposition format.
+
+        Parameters
+        ----------
+        prefix : str, optional
+            The prefix of the metric names. The default is "textstat".
+
+        Returns
+        -------
+        str
+            The counters `<prefix>_calls_total`, `<prefix>_seconds_total`,
+            `<prefix>_self_seconds_total`, `<prefix>_cache_hits_total` and
+            `<prefix>_cache_misses_total`, labelled by function.
+        """
+        stats = self.as_dict()
+        counters = [
+            ("calls", "calls_total", "Calls of the function."),
+            ("seconds", "seconds_total", "Time spent in the function."),
+            (
+                "self_seconds",
+                "self_seconds_total",
+                "Time spent in the function, excluding the functions it called.",
+            ),
+            ("hits", "cache_hits_total", "Results of the function found in cache."),
+            ("misses", "cache_misses_total", "Results of the function computed."),
+        ]
+        lines = []
+        for key, suffix, help_text in counters:
+            name = f"{prefix}_{suffix}"
+            lines.append(f"# HELP {name} {help_text}")
+            lines.append(f"# TYPE {name} counter")
+            for function, values in stats.items():
+                if values[key] is not None:
+                    lines.append(f'{name}{{function="{function}"}} {values[key]}')
+        return "\n".join(lines) + "\n"
+
+    def reset(self) -> None:
+        """Forget the statistics recorded so far."""
+        with self._lock:
+            self._stats.clear()
+
+
+class _InstrumentState:
+    """The active instrumentations and the running calls of every thread."""
+
+    def __init__(self) -> None:
+        self.lock = threading.Lock()
+        self.active: tuple[Instrumentation, ...] = ()
+        self.local = threading.local()
+
+
+_state = _InstrumentState()
+
+
+@contextmanager
+def instrument() -> Iterator[Instrumentation]:
+    """Record the calls, time and cache hits of the backend functions.
+
+    Instrumentation is process-wide: the calls of all threads are recorded
+    while the context is open (not those of worker processes). Contexts can be
+    nested, each records the calls made while it is open. The functions are
+    not timed outside of a context.
+
+    Yields
+    ------
+    Instrumentation
+        The statistics, see `Instrumentation.as_dict` and
+        `Instrumentation.to_prometheus`.
+
+    Examples
+    --------
+    >>> with instrument() as stats:
+    ...     flesch_reading_ease(text, "en_US")
+    >>> stats.as_dict()["counts.count_syllables"]["calls"]
+    1
+    """
+    instrumentation = Instrumentation()
+    with _state.lock:
+        _state.active += (instrumentation,)
+    try:
+        yield instrumentation
+    finally:
+        with _state.lock:
+            _state.active = tuple(
+                active for active in _state.active if active is not instrumentation
+            )
+
+
+def call_instrumented(
+    name: str,
+    func: Callable[..., Any],
+    args: tuple[Any, ...],
+    kwargs: dict[str, Any],
+    cached: bool = False,
+) -> Any:
+    """Call `func` and record it in the open `instrument` contexts.
+
+    The time of the calls it makes to other recorded functions is subtracted
+    from its self time. If `cached`, `func` returns its result and whether it
+    was found in cache.
+    """
+    local = _state.local
+    stack = getattr(local, "stack", None)
+    if stack is None:
+        stack = local.stack = []
+    # The time spent in the recorded functions called by this one
+    stack.append(0.0)
+    hit = None
+    start = time.perf_counter()
+    try:
+        if cached:
+            value, hit = func(*args, **kwargs)
+            return value
+        return func(*args, **kwargs)
+    finally:
+        seconds = time.perf_counter() - start
+        children = stack.pop()
+        if stack:
+            stack[-1] += seconds
+        for instrumentation in _state.active:
+            instrumentation._record(name, seconds, seconds - children, hit)
+
+
+def instrumented(name: str) -> Callable[[Callable[P, T]], Callable[P, T]]:
+    """Decorator to record an uncached function in the `instrument` contexts.
+
+    Outside of a context the only overhead is a check of whether one is open.
+
+    Parameters
+    ----------
+    name : str
+        The name to record the calls under.
+
+    Returns
+    -------
+    Callable
+        The decorator.
+    """
+
+    def decorator(func: Callable[P, T]) -> Callable[P, T]:
+        state = _state
+
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            if not state.active:
+                return func(*args, **kwargs)
+            return call_instrumented(name, func, args, kwargs)
+
+        return update_wrapper(wrapper, func)  # type: ignore[return-value]
+
+    return decorator
@@ -1,17 +1,133 @@
 from __future__ import annotations
 
-from functools import lru_cache
-from typing import Callable, TYPE_CHECKING
+import sys
+import threading
+from collections import OrderedDict
+from functools import lru_cache, update_wrapper
+from typing import Any, Callable, Hashable, Iterable, NamedTuple, TYPE_CHECKING
 
-from .constants import CACHE_SIZE
+from . import _disk_cache, _instrument
+from .constants import CACHE_MAX_BYTES, CACHE_SIZE, WORD_CACHE_SIZE
 
 if TYPE_CHECKING:
     from .constants import T, P
 
+KEY_MODES = ("text", "digest")
+
+
+class CacheInfo(NamedTuple):
+    """Statistics of a cached function."""
+
+    hits: int
+    misses: int
+    maxsize: int | None
+    currsize: int
+    nbytes: int
+
+
+class _FunctionCache:
+    """The entries and statistics of one cached function."""
+
+    def __init__(self, family: str, lru: bool) -> None:
+        self.family = family
+        # Cached with `functools.lru_cache` rather than in the shared budget
+        self.lru = lru
+        self.function: Callable[..., Any] | None = None
+        # The result, its approximate bytes and whether it was read since it
+        # was last considered for eviction, by key
+        self.entries: OrderedDict[Hashable, list[Any]] = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.nbytes = 0
+        # Whether the results are cached and keyed on the positional arguments
+        # themselves
+        self.direct = True
+
+
+class _CacheState:
+    """The configuration and shared byte budget of all cached functions.
+
+    The caches of `typed_cache` hold the results of text processing functions
+    and share the byte budget. Entries are evicted in the order they were
+    stored, but an entry read since it was last considered gets a second
+    chance, which approximates evicting the least recently used entry without
+    reordering the entries on every hit.
+    """
+
+    def __init__(self) -> None:
+        self.lock = threading.Lock()
+        # The registry of cached functions, by "<family>.<name>"
+        self.caches: dict[str, _FunctionCache] = {}
+        self.recency: OrderedDict[tuple[_FunctionCache, Hashable], None] = (
+            OrderedDict()
+        )
+        self.nbytes = 0
+        self.generation = 0
+        self.max_bytes: int | None = CACHE_MAX_BYTES
+        self.maxsize: int | None = CACHE_SIZE
+        self.key = "text"
+        self.disabled: frozenset[str] = frozenset()
+
+    def store(self, cache: _FunctionCache, key: Hashable, value: Any) -> None:
+        if key in cache.entries:
+            return
+        nbytes = _sizeof(key) + _sizeof(value)
+        if self.max_bytes is not None and nbytes > self.max_bytes:
+            return
+        cache.entries[key] = [value, nbytes, False]
+        cache.nbytes += nbytes
+        self.nbytes += nbytes
+        self.recency[(cache, key)] = None
+        if self.maxsize is not None and len(cache.entries) > self.maxsize:
+            self.evict_oldest(cache)
+        self.shrink()
+
+    def evict(self, cache: _FunctionCache, key: Hashable) -> None:
+        _, nbytes, _ = cache.entries.pop(key)
+        cache.nbytes -= nbytes
+        self.nbytes -= nbytes
+        del self.recency[(cache, key)]
+
+    def evict_oldest(self, cache: _FunctionCache) -> None:
+        entries = cache.entries
+        while True:
+            key, entry = next(iter(entries.items()))
+            if not entry[2]:
+                break
+            entry[2] = False
+            entries.move_to_end(key)
+        self.evict(cache, key)
+
+    def shrink(self) -> None:
+        recency = self.recency
+        while self.max_bytes is not None and self.nbytes > self.max_bytes:
+            item = next(iter(recency))
+            entry = item[0].entries[item[1]]
+            if entry[2]:
+                entry[2] = False
+                recency.move_to_end(item)
+            else:
+                self.evict(*item)
+
+    def clear(self, cache: _FunctionCache) -> None:
+        if cache.lru:
+            cache.function.cache_clear()  # type: ignore[union-attr]
+            return
+        for key in list(cache.entries):
+            self.evict(cache, key)
+        cache.hits = 0
+        cache.misses = 0
+
+
+_state = _CacheState()
+
 
 def typed_cache(func: Callable[P, T]) -> Callable[P, T]:
     """Decorator to cache function results without losing type info.
 
+    The results share the byte budget set with `configure_cache` and can be
+    disabled per family, the backend subpackage of `func` (e.g. "counts").
+
     Parameters
     ----------
     func : Callable
@@ -23,4 +139,338 @@ def typed_cache(func: Callable[P, T]) -> Callable[P, T]:
         The cache-wrapped function.
 
     """
-    return lru_cache(maxsize=CACHE_SIZE)(func)  # type: ignore
+    return _cached(func, family=func.__module__.split(".")[-2])
+
+
+def word_cache(func: Callable[P, T]) -> Callable[P, T]:
+    """Decorator to cache per-word results without losing type info.
+
+    Functions called for every word of a text are cached with
+    `functools.lru_cache`, whose hits cost far less than those of
+    `typed_cache`. The results do not count towards the byte budget, are kept
+    for the `WORD_CACHE_SIZE` most recently used words and cannot be disabled.
+
+    Parameters
+    ----------
+    func : Callable
+        The function of a word to cache.
+
+    Returns
+    -------
+    Callable
+        The cache-wrapped function.
+
+    """
+    family = func.__module__.split(".")[-2]
+    return _lru_cached(func, family, WORD_CACHE_SIZE)
+
+
+def resource_cache(func: Callable[P, T]) -> Callable[P, T]:
+    """Decorator to cache per-language resources without losing type info.
+
+    The results are kept for the life of the process with
+    `functools.lru_cache`, do not count towards the byte budget, and belong to
+    the "resources" family.
+
+    Parameters
+    ----------
+    func : Callable
+        The function loading a resource.
+
+    Returns
+    -------
+    Callable
+        The cache-wrapped function.
+
+    """
+    return _lru_cached(func, "resources", None)
+
+
+def configure_cache(
+    max_bytes: int | None = CACHE_MAX_BYTES,
+    maxsize: int | None = CACHE_SIZE,
+    key: str = "text",
+    disable: Iterable[str] = (),
+) -> None:
+    """Configure the caches of the backend functions.
+
+    Calling this function without arguments restores the defaults. The per-word
+    "validations" and the "resources" families are cached with
+    `functools.lru_cache` and are not affected.
+
+    Parameters
+    ----------
+    max_bytes : int or None, optional
+        The approximate number of bytes all cached results may take up together;
+        the least recently used results are evicted first. None for no limit.
+        The default is 64 MiB.
+    maxsize : int or None, optional
+        The number of results kept per function. None for no limit. The default
+        is 128.
+    key : str, optional
+        "text" (default) to key the results on the arguments themselves, or
+        "digest" to key them on a 16-byte BLAKE2 digest of every string
+        argument, so that the caches do not keep the texts alive.
+    disable : Iterable[str], optional
+        The function families not to cache, e.g. "metrics" or "counts". See
+        `cache_families`; "validations" and "resources" are always cached. The
+        default is to cache all families.
+
+    Returns
+    -------
+    None
+
+    """
+    if key not in KEY_MODES:
+        raise ValueError(f"key must be one of {KEY_MODES}, got {key!r}")
+    for limit in (max_bytes, maxsize):
+        if limit is not None and limit < 0:
+            raise ValueError("Cache limits must not be negative")
+    disabled = frozenset(disable)
+    unknown = disabled - set(cache_families())
+    if unknown:
+        raise ValueError(f"Unknown cache families {sorted(unknown)}")
+    always_cached = {cache.family for cache in _state.caches.values() if cache.lru}
+    if disabled & always_cached:
+        raise ValueError(
+            f"Cache families {sorted(disabled & always_cached)} cannot be disabled"
+        )
+
+    with _state.lock:
+        _state.generation += 1
+        for cache in _state.caches.values():
+            if not cache.lru and (cache.family in disabled or key != _state.key):
+                _state.clear(cache)
+        _state.max_bytes = max_bytes
+        _state.maxsize = maxsize
+        _state.key = key
+        _state.disabled = disabled
+        for cache in _state.caches.values():
+            cache.direct = key == "text" and cache.family not in disabled
+        if maxsize is not None:
+            for cache in _state.caches.values():
+                while len(cache.entries) > maxsize:
+                    _state.evict_oldest(cache)
+        _state.shrink()
+
+
+def cache_clear(family: str | None = None) -> None:
+    """Clear the cached results of all functions, or of one family.
+
+    Parameters
+    ----------
+    family : str or None, optional
+        The family to clear, see `cache_families`. The default is None (all
+        families but "resources", whose loaded resources are kept).
+
+    Returns
+    -------
+    None
+
+    """
+    if family is not None and family not in cache_families():
+        raise ValueError(f"Unknown cache family {family}")
+    with _state.lock:
+        _state.generation += 1
+        for cache in _state.caches.values():
+            if cache.family == family or (
+                family is None and cache.family != "resources"
+            ):
+                _state.clear(cache)
+
+
+def cache_info(family: str | None = None) -> dict[str, CacheInfo]:
+    """Get the statistics of the caches of all functions, or of one family.
+
+    Parameters
+    ----------
+    family : str or None, optional
+        The family to describe, see `cache_families`. The default is None (all
+        families).
+
+    Returns
+    -------
+    dict[str, CacheInfo]
+        The hits, misses, maximum and current number of results and approximate
+        bytes held of every cached function, by "<family>.<name>" (e.g.
+        "counts.count_words"), sorted by name. The bytes of the "resources"
+        family are not counted.
+
+    """
+    if family is not None and family not in cache_families():
+        raise ValueError(f"Unknown cache family {family}")
+    with _state.lock:
+        return {
+            name: _info(cache)
+            for name, cache in sorted(_state.caches.items())
+            if family is None or cache.family == family
+        }
+
+
+def cached_functions(family: str | None = None) -> dict[str, Callable[..., Any]]:
+    """Get the registry of cached functions.
+
+    Parameters
+    ----------
+    family : str or None, optional
+        The family of the functions, see `cache_families`. The default is None
+        (all families).
+
+    Returns
+    -------
+    dict[str, Callable]
+        The cached functions, by "<family>.<name>", sorted by name. Each has
+        `cache_info()` and `cache_clear()` methods.
+
+    """
+    if family is not None and family not in cache_families():
+        raise ValueError(f"Unknown cache family {family}")
+    return {
+        name: cache.function
+        for name, cache in sorted(_state.caches.items())
+        if cache.function is not None and (family is None or cache.family == family)
+    }
+
+
+def cache_families() -> list[str]:
+    """Get the names of the function families that are cached.
+
+    Returns
+    -------
+    list[str]
+        The sorted family names.
+
+    """
+    return sorted({cache.family for cache in _state.caches.values()})
+
+
+def _cached(func: Callable[P, T], family: str) -> Callable[P, T]:
+    cache = _FunctionCache(family, lru=False)
+    cache.direct = _state.key == "text" and family not in _state.disabled
+    name = f"{family}.{func.__name__}"
+    _state.caches[name] = cache
+    state = _state
+    entries = cache.entries
+    instruments = _instrument._state
+    # The results of the metrics may also be kept on disk
+    compute = _disk_cache.persistent(name, func) if family == "metrics" else func
+
+    def call(args: tuple[Any, ...], kwargs: dict[str, Any]) -> tuple[Any, bool | None]:
+        # The result, and whether it was found in cache (None if not cached)
+        if family in state.disabled:
+            return compute(*args, **kwargs), None
+
+        generation = state.generation
+        if kwargs or state.key == "digest":
+            key = _make_key(args, kwargs, digest=state.key == "digest")
+        else:
+            key = args
+        # Hits take no lock: reading the dict is atomic, and the statistics
+        # and the second chance flag may be off by a concurrent update
+        entry = entries.get(key)
+        if entry is not None:
+            cache.hits += 1
+            entry[2] = True
+            return entry[0], True
+        cache.misses += 1
+
+        value = compute(*args, **kwargs)
+        with state.lock:
+            # Drop results keyed under a configuration that has since changed
+            if generation == state.generation:
+                state.store(cache, key, value)
+        return value, False
+
+    def wrapper(*args: Any, **kwargs: Any) -> Any:
+        if instruments.active:
+            return _instrument.call_instrumented(
+                name, call, (args, kwargs), {}, cached=True
+            )
+        # Look up the common case, positional arguments keyed as they are,
+        # before building a key
+        if not kwargs and cache.direct:
+            entry = entries.get(args)
+            if entry is not None:
+                cache.hits += 1
+                entry[2] = True
+                return entry[0]
+        return call(args, kwargs)[0]
+
+    def cache_info() -> CacheInfo:
+        with _state.lock:
+            return _info(cache)
+
+    def cache_clear() -> None:
+        with _state.lock:
+            _state.clear(cache)
+
+    wrapper.cache_info = cache_info  # type: ignore[attr-defined]
+    wrapper.cache_clear = cache_clear  # type: ignore[attr-defined]
+    cache.function = update_wrapper(wrapper, func)
+    return cache.function  # type: ignore[return-value]
+
+
+def _lru_cached(
+    func: Callable[P, T], family: str, maxsize: int | None
+) -> Callable[P, T]:
+    cache = _FunctionCache(family, lru=True)
+    _state.caches[f"{family}.{func.__name__}"] = cache
+    wrapper = lru_cache(maxsize=maxsize)(func)
+    lru_info = wrapper.cache_info
+
+    def cache_info() -> CacheInfo:
+        return CacheInfo(*lru_info(), 0)
+
+    # Report the same statistics as the other cached functions
+    wrapper.cache_info = cache_info  # type: ignore[method-assign]
+    cache.function = wrapper
+    return wrapper  # type: ignore[return-value]
+
+
+def _info(cache: _FunctionCache) -> CacheInfo:
+    if cache.lru:
+        return cache.function.cache_info()  # type: ignore[union-attr]
+    return CacheInfo(
+        cache.hits,
+        cache.misses,
+        _state.maxsize,
+        len(cache.entries),
+        cache.nbytes,
+    )
+
+
+_KWARGS_MARK = object()
+
+
+def _make_key(args: tuple[Any, ...], kwargs: dict[str, Any], digest: bool) -> Hashable:
+    key = args
+    if kwargs:
+        key += (_KWARGS_MARK,)
+        for item in sorted(kwargs.items()):
+            key += item
+    if digest:
+        key = tuple(_digest(arg) if isinstance(arg, str) else arg for arg in key)
+    return key
+
+
+def _digest(text: str) -> bytes:
+    import hashlib
+
+    return hashlib.blake2b(
+        text.encode("utf-8", "surrogatepass"), digest_size=16
+    ).digest()
+
+
+def _sizeof(obj: Any) -> int:
+    """Approximate the memory held by `obj` and the items it contains.
+
+    The items of a container are estimated from the first one, so that the
+    estimate does not walk long lists of words.
+    """
+    size = sys.getsizeof(obj)
+    if isinstance(obj, (list, tuple, set, frozenset)) and obj:
+        size += len(obj) * sys.getsizeof(next(iter(obj)))
+    elif isinstance(obj, dict) and obj:
+        key, value = next(iter(obj.items()))
+        size += len(obj) * (sys.getsizeof(key) + sys.getsizeof(value))
+    return size
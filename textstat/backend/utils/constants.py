@@ -69,3 +69,34 @@ RE_CONTRACTION_APOSTROPHE = r"\'(?=" + RE_CONTRACTION_ENDINGS + ")"
 RE_NONCONTRACTION_APOSTROPHE = r"\'(?!" + RE_CONTRACTION_ENDINGS + ")"
 
 CACHE_SIZE = 128
+WORD_CACHE_SIZE = 4096
+CACHE_MAX_BYTES = 64 * 1024 * 1024
+DISK_CACHE_MAX_ENTRIES = 1_000_000
+SYLLABLE_TABLE_SIZE = 2**18
+# Streamed text is analysed in segments of whole sentences of at least
+# STREAM_SEGMENT_CHARS characters; a sentence longer than STREAM_MAX_SEGMENT_CHARS
+# is cut at a space
+STREAM_SEGMENT_CHARS = 2**14
+STREAM_MAX_SEGMENT_CHARS = 2**20
+
+# Abbreviations followed by a period that do not end a sentence, used by the
+# "fast" sentence engine (lowercase, without the final period)
+SENTENCE_ABBREVIATIONS: dict[str, frozenset[str]] = {
+    "en": frozenset(
+        "mr mrs ms dr prof sr jr st vs etc e.g i.e inc ltd co corp vol fig jan feb "
+        "apr jun jul aug sep sept oct nov dec mt u.s a.m p.m approx dept gov rev "
+        "sgt capt lt".split()
+    ),
+    "de": frozenset(
+        "z.b bzw usw ca vgl ggf evtl nr str hr fr inkl d.h u.a".split()
+    ),
+    "es": frozenset("sra srta ud uds pág p.ej núm".split()),
+    "fr": frozenset("mme mlle cf p.ex".split()),
+    "it": frozenset("sig sigg dott ecc pag".split()),
+    "nl": frozenset("dhr mevr bijv enz o.a m.a.w".split()),
+}
+# The abbreviations above that often end a sentence: a period after them ends
+# the sentence when the next word is capitalized, as in "etc. I"
+SENTENCE_FINAL_ABBREVIATIONS = frozenset(
+    "etc inc ltd corp jr sr a.m p.m usw ecc enz".split()
+)
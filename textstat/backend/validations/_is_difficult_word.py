@@ -1,17 +1,17 @@
 from __future__ import annotations
 
-from ..utils._typed_cache import typed_cache
-from ..utils._get_lang_easy_words import get_lang_easy_words
-from ..counts._count_syllables import count_syllables
+from ..utils._typed_cache import word_cache
+from ..utils._get_word_table import get_easy_word_index
+from ..counts._count_word_syllables import count_word_syllables
 
 
-@typed_cache
+@word_cache
 def is_difficult_word(word: str, syllable_threshold: int, lang: str) -> bool:
     """Return True if `word` is a difficult word.
 
     The function checks if if the word is in the Dale-Chall list of
-    easy words. However, it currently doesn't check if the word is a
-    regular inflection of a word in the Dale-Chall list!
+    easy words. Regular inflections of the words in the list are only
+    counted as easy with `set_easy_word_matching("inflections")`.
 
     If the word is not a word, is not in the easy words list, or is shorter
     than `syllable_threshold`, the function returns False. Else, True.
@@ -35,7 +35,7 @@ def is_difficult_word(word: str, syllable_threshold: int, lang: str) -> bool:
     if len(word.split()) != 1:
         return False
 
-    easy_word_set = get_lang_easy_words(lang)
+    easy_word_set = get_easy_word_index(lang)
 
     # easy set is all lowercase
     word = word.lower()
@@ -45,7 +45,7 @@ def is_difficult_word(word: str, syllable_threshold: int, lang: str) -> bool:
         return False
 
     # Too short
-    if count_syllables(word, lang) < syllable_threshold:
+    if count_word_syllables(word, lang) < syllable_threshold:
         return False
 
     return True
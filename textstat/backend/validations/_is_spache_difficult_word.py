@@ -1,10 +1,10 @@
 from __future__ import annotations
 
-from ..utils._typed_cache import typed_cache
-from ..utils._get_spache_easy_words import get_spache_easy_words
+from ..utils._typed_cache import word_cache
+from ..utils._get_word_table import get_spache_word_table
 
 
-@typed_cache
+@word_cache
 def is_spache_difficult_word(word: str, lang: str) -> bool:
     """Return True if `word` is a difficult word according to Spache criteria.
 
@@ -33,7 +33,7 @@ def is_spache_difficult_word(word: str, lang: str) -> bool:
     if len(word.split()) != 1:
         return False
 
-    spache_easy_word_set = get_spache_easy_words(lang)
+    spache_easy_word_set = get_spache_word_table(lang)
 
     # Spache easy set is all lowercase
     word = word.lower()
@@ -0,0 +1,424 @@
+"""The `textstat` command: score files of texts from the command line.
+
+Documents are read one batch at a time and the scores of every batch are
+written before the next one is read, so inputs of any size can be scored. Run
+`textstat --help` for the options.
+"""
+
+from __future__ import annotations
+
+import abc
+import argparse
+import csv
+import json
+import os
+import sys
+from collections import deque
+from contextlib import contextmanager
+from itertools import islice
+from typing import IO, Any, Iterable, Iterator, Sequence
+
+from . import parallel, stream
+from .backend import analysis, selections, utils
+
+INPUT_FORMATS = ("jsonl", "csv", "text")
+OUTPUT_FORMATS = ("jsonl", "csv", "json", "parquet")
+DEFAULT_METRICS = (
+    "flesch_reading_ease",
+    "flesch_kincaid_grade",
+    "smog_index",
+    "text_standard",
+)
+INPUT_EXTENSIONS = {".jsonl": "jsonl", ".ndjson": "jsonl", ".csv": "csv"}
+OUTPUT_EXTENSIONS = {**INPUT_EXTENSIONS, ".json": "json", ".parquet": "parquet"}
+
+
+class InputError(Exception):
+    """An input file cannot be read as the requested format."""
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    """Run the `textstat` command.
+
+    Parameters
+    ----------
+    argv : Sequence[str] or None, optional
+        The command-line arguments. The default is None (`sys.argv[1:]`).
+
+    Returns
+    -------
+    int
+        The exit status.
+    """
+    parser = _parser()
+    args = parser.parse_args(argv)
+
+    metrics = args.metrics.split(",") if args.metrics else list(DEFAULT_METRICS)
+    try:
+        for metric in metrics:
+            analysis.get_scorer(metric)
+    except ValueError as e:
+        parser.error(str(e))
+    if args.workers < 0 or args.batch_size < 1:
+        parser.error("--workers must be at least 0 and --batch-size at least 1")
+    if args.document == "file" and args.input_format not in (None, "text"):
+        parser.error("--document file only reads text files")
+    output_format = args.output_format or OUTPUT_EXTENSIONS.get(
+        os.path.splitext(args.output)[1], "jsonl"
+    )
+    if output_format == "parquet":
+        if args.output == "-":
+            parser.error("parquet output needs a file, use --output")
+        try:
+            import pyarrow  # noqa: F401
+        except ImportError:
+            parser.error("parquet output requires pyarrow to be installed")
+    if args.sentence_engine:
+        selections.set_sentence_engine(args.sentence_engine)
+    if args.easy_word_matching:
+        utils.set_easy_word_matching(args.easy_word_matching)
+
+    fields = [args.id_field] if args.id_field else []
+    if args.document == "file":
+        fields = ["file"]
+    try:
+        # An output file that cannot be opened is reported like an input error
+        writer = _writer(output_format, args.output, fields, metrics)
+        try:
+            if args.document == "file":
+                batches = _score_files(args.inputs, metrics, args)
+            else:
+                batches = _score_records(_read_inputs(args), metrics, args)
+            for keys, columns in batches:
+                writer.write(keys, columns)
+        finally:
+            writer.close()
+    except (InputError, OSError) as e:
+        print(f"{parser.prog}: error: {e}", file=sys.stderr)
+        return 1
+    return 0
+
+
+def _parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog="textstat",
+        description=(
+            "Score the readability of the documents in JSONL, CSV or text files "
+            "(or standard input)."
+        ),
+    )
+    parser.add_argument(
+        "inputs",
+        nargs="*",
+        default=["-"],
+        help="input files, '-' for standard input (the default)",
+    )
+    parser.add_argument(
+        "-m",
+        "--metrics",
+        help=(
+            "comma-separated metrics, e.g. flesch_reading_ease,count_words "
+            f"(default: {','.join(DEFAULT_METRICS)})"
+        ),
+    )
+    parser.add_argument(
+        "-l", "--lang", default="en_US", help="language of the texts (en_US)"
+    )
+    parser.add_argument(
+        "-i",
+        "--input-format",
+        choices=INPUT_FORMATS,
+        help="format of the inputs (default: from the file extension, else text)",
+    )
+    parser.add_argument(
+        "--text-field",
+        default="text",
+        help="JSONL key or CSV column holding the text (text)",
+    )
+    parser.add_argument(
+        "--id-field", help="JSONL key or CSV column to copy to the output"
+    )
+    parser.add_argument(
+        "--document",
+        choices=("line", "file"),
+        default="line",
+        help=(
+            "for text inputs, score every line (default) or every file as one "
+            "document, read chunk by chunk"
+        ),
+    )
+    parser.add_argument(
+        "-o", "--output", default="-", help="output file, '-' for standard output"
+    )
+    parser.add_argument(
+        "-t",
+        "--output-format",
+        choices=OUTPUT_FORMATS,
+        help=(
+            "jsonl rows, csv rows, json columns or parquet columns (needs "
+            "pyarrow); default: from the output extension, else jsonl"
+        ),
+    )
+    parser.add_argument(
+        "-w",
+        "--workers",
+        type=int,
+        default=0,
+        help="number of worker processes (default: 0, score in this process)",
+    )
+    parser.add_argument(
+        "--batch-size",
+        type=int,
+        default=256,
+        help="number of documents scored and written at a time (256)",
+    )
+    parser.add_argument(
+        "-r", "--round-points", type=int, help="round the scores to N decimals"
+    )
+    parser.add_argument(
+        "--sentence-engine",
+        choices=selections.SENTENCE_ENGINES,
+        help="how to split sentences (default: punkt)",
+    )
+    parser.add_argument(
+        "--easy-word-matching",
+        choices=utils.EASY_WORD_MATCHING,
+        help="whether inflections of Dale-Chall easy words are easy (default: exact)",
+    )
+    return parser
+
+
+def _read_inputs(args: argparse.Namespace) -> Iterator[tuple[dict[str, Any], str]]:
+    for path in args.inputs:
+        input_format = args.input_format or INPUT_EXTENSIONS.get(
+            os.path.splitext(path)[1], "text"
+        )
+        with _open(path, "r") as f:
+            if input_format == "jsonl":
+                yield from _read_jsonl(f, path, args.text_field, args.id_field)
+            elif input_format == "csv":
+                yield from _read_csv(f, path, args.text_field, args.id_field)
+            else:
+                for line in f:
+                    yield {}, line.rstrip("\r\n")
+
+
+def _read_jsonl(
+    f: IO[str], path: str, text_field: str, id_field: str | None
+) -> Iterator[tuple[dict[str, Any], str]]:
+    for number, line in enumerate(f, 1):
+        if not line.strip():
+            continue
+        try:
+            record = json.loads(line)
+        except json.JSONDecodeError as e:
+            raise InputError(f"{path}:{number}: invalid JSON ({e})") from e
+        if not isinstance(record, dict) or not isinstance(
+            record.get(text_field), str
+        ):
+            raise InputError(f"{path}:{number}: no text in {text_field!r}")
+        yield _keys(record, id_field), record[text_field]
+
+
+def _read_csv(
+    f: IO[str], path: str, text_field: str, id_field: str | None
+) -> Iterator[tuple[dict[str, Any], str]]:
+    reader = csv.DictReader(f)
+    if reader.fieldnames is None or text_field not in reader.fieldnames:
+        raise InputError(f"{path}: no column {text_field!r}")
+    for row in reader:
+        yield _keys(row, id_field), row[text_field] or ""
+
+
+def _keys(record: dict[str, Any], id_field: str | None) -> dict[str, Any]:
+    if id_field is None:
+        return {}
+    return {id_field: record.get(id_field)}
+
+
+def _score_records(
+    records: Iterable[tuple[dict[str, Any], str]],
+    metrics: list[str],
+    args: argparse.Namespace,
+) -> Iterator[tuple[list[dict[str, Any]], dict[str, list[float]]]]:
+    if args.workers == 0:
+        iterator = iter(records)
+        while True:
+            batch = list(islice(iterator, args.batch_size))
+            if not batch:
+                return
+            columns = analysis.score_many(
+                (text for _, text in batch),
+                metrics,
+                args.lang,
+                round_points=args.round_points,
+            )
+            yield [keys for keys, _ in batch], columns
+
+    # The workers read the texts ahead, keep their keys until they are scored
+    pending_keys: deque[dict[str, Any]] = deque()
+
+    def texts() -> Iterator[str]:
+        for keys, text in records:
+            pending_keys.append(keys)
+            yield text
+
+    for columns in parallel.iter_score(
+        texts(),
+        metrics,
+        args.lang,
+        workers=args.workers,
+        chunksize=args.batch_size,
+        round_points=args.round_points,
+    ):
+        n_scores = len(columns[metrics[0]])
+        yield [pending_keys.popleft() for _ in range(n_scores)], columns
+
+
+def _score_files(
+    paths: list[str], metrics: list[str], args: argparse.Namespace
+) -> Iterator[tuple[list[dict[str, Any]], dict[str, list[float]]]]:
+    for path in paths:
+        with _open(path, "r") as f:
+            scores = stream.score(f, metrics, args.lang, args.round_points)
+        yield [{"file": path}], {metric: [score] for metric, score in scores.items()}
+
+
+@contextmanager
+def _open(path: str, mode: str) -> Iterator[IO[str]]:
+    if path == "-":
+        yield sys.stdin if mode == "r" else sys.stdout
+    else:
+        with open(path, mode, encoding="utf-8", newline="") as f:
+            yield f
+
+
+class _Writer(abc.ABC):
+    """Write the scores of every batch of documents."""
+
+    def __init__(self, path: str, keys: list[str], metrics: list[str]) -> None:
+        self.path = path
+        self.keys = keys
+        self.metrics = metrics
+        self.fields = keys + metrics
+
+    @abc.abstractmethod
+    def write(
+        self, keys: list[dict[str, Any]], columns: dict[str, list[float]]
+    ) -> None:
+        """Write the scores of a batch of documents."""
+
+    @abc.abstractmethod
+    def close(self) -> None:
+        """Finish writing the output."""
+
+    @staticmethod
+    def rows(
+        keys: list[dict[str, Any]], columns: dict[str, list[float]]
+    ) -> Iterator[dict[str, Any]]:
+        for i, row_keys in enumerate(keys):
+            row = dict(row_keys)
+            for metric, scores in columns.items():
+                row[metric] = scores[i]
+            yield row
+
+
+class _JsonlWriter(_Writer):
+    def __init__(self, path: str, keys: list[str], metrics: list[str]) -> None:
+        super().__init__(path, keys, metrics)
+        self.file = (
+            sys.stdout
+            if path == "-"
+            else open(path, "w", encoding="utf-8", newline="")
+        )
+
+    def write(
+        self, keys: list[dict[str, Any]], columns: dict[str, list[float]]
+    ) -> None:
+        for row in self.rows(keys, columns):
+            self.file.write(json.dumps(row) + "\n")
+        self.file.flush()
+
+    def close(self) -> None:
+        if self.file is not sys.stdout:
+            self.file.close()
+
+
+class _CsvWriter(_JsonlWriter):
+    def __init__(self, path: str, keys: list[str], metrics: list[str]) -> None:
+        super().__init__(path, keys, metrics)
+        self.writer = csv.DictWriter(self.file, fieldnames=self.fields)
+        self.writer.writeheader()
+
+    def write(
+        self, keys: list[dict[str, Any]], columns: dict[str, list[float]]
+    ) -> None:
+        self.writer.writerows(self.rows(keys, columns))
+        self.file.flush()
+
+
+class _JsonColumnsWriter(_Writer):
+    # A JSON object of columns can only be written once all rows are scored
+    def __init__(self, path: str, keys: list[str], metrics: list[str]) -> None:
+        super().__init__(path, keys, metrics)
+        self.columns: dict[str, list[Any]] = {field: [] for field in self.fields}
+
+    def write(
+        self, keys: list[dict[str, Any]], columns: dict[str, list[float]]
+    ) -> None:
+        for row in self.rows(keys, columns):
+            for field, value in row.items():
+                self.columns[field].append(value)
+
+    def close(self) -> None:
+        with _open(self.path, "w") as f:
+            json.dump(self.columns, f)
+            f.write("\n")
+
+
+class _ParquetWriter(_Writer):
+    # Every batch is written as a row group. The schema is set upfront, as a
+    # batch may hold only missing ids: ids are written as strings and scores
+    # as floats. The file is written even if there are no documents.
+    def __init__(self, path: str, keys: list[str], metrics: list[str]) -> None:
+        super().__init__(path, keys, metrics)
+        import pyarrow
+        import pyarrow.parquet
+
+        self.pyarrow = pyarrow
+        self.schema = pyarrow.schema(
+            [(key, pyarrow.string()) for key in keys]
+            + [(metric, pyarrow.float64()) for metric in metrics]
+        )
+        self.writer = pyarrow.parquet.ParquetWriter(path, self.schema)
+
+    def write(
+        self, keys: list[dict[str, Any]], columns: dict[str, list[float]]
+    ) -> None:
+        data: dict[str, list[Any]] = {
+            key: [None if row[key] is None else str(row[key]) for row in keys]
+            for key in self.keys
+        }
+        data.update(columns)
+        self.writer.write_table(
+            self.pyarrow.Table.from_pydict(data, schema=self.schema)
+        )
+
+    def close(self) -> None:
+        self.writer.close()
+
+
+def _writer(
+    output_format: str, path: str, keys: list[str], metrics: list[str]
+) -> _Writer:
+    writers = {
+        "jsonl": _JsonlWriter,
+        "csv": _CsvWriter,
+        "json": _JsonColumnsWriter,
+        "parquet": _ParquetWriter,
+    }
+    return writers[output_format](path, keys, metrics)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
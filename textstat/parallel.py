@@ -0,0 +1,152 @@
+from __future__ import annotations
+
+import os
+from collections import deque
+from itertools import islice
+from typing import Any, Iterable, Iterator, TYPE_CHECKING
+
+from . import resources
+from .backend import analysis, selections, utils
+
+if TYPE_CHECKING:
+    from concurrent.futures import Future
+
+
+def score(
+    texts: Iterable[str],
+    metrics: Iterable[str],
+    lang: str = "en_US",
+    workers: int | None = None,
+    chunksize: int = 64,
+    output: str = "list",
+    round_points: int | None = None,
+) -> dict[str, Any]:
+    """Score many texts with the same metrics across a pool of processes.
+
+    Texts are sent to the workers in chunks of `chunksize`; every worker loads
+    the dictionaries and models needed for `lang` once, when it starts. Only a
+    bounded number of chunks is in flight at a time, so `texts` may be a lazy
+    iterable of any length. The scores are returned in input order.
+
+    Parameters
+    ----------
+    texts : Iterable[str]
+        The text strings.
+    metrics : Iterable[str]
+        The names of the metrics to compute, see `textstat.score_many`.
+    lang : str, optional
+        The language of the texts. The default is "en_US".
+    workers : int or None, optional
+        The number of worker processes. The default is None (one per CPU).
+    chunksize : int, optional
+        The number of texts sent to a worker at once. The default is 64.
+    output : str, optional
+        The type of the columns: "list" (default), "array" or "numpy".
+    round_points : int or None, optional
+        The number of decimals to round the scores to. The default is None (no
+        rounding).
+
+    Returns
+    -------
+    dict[str, Any]
+        One column per metric, holding the scores of the texts in input order.
+
+    """
+    metrics = list(metrics)
+    if output not in analysis.OUTPUTS:
+        raise ValueError(f"output must be one of {analysis.OUTPUTS}, got {output!r}")
+
+    columns: dict[str, list[float]] = {metric: [] for metric in metrics}
+    for chunk_columns in iter_score(
+        texts, metrics, lang, workers, chunksize, round_points
+    ):
+        _extend(columns, chunk_columns)
+    return analysis.to_columns(columns, output)
+
+
+def iter_score(
+    texts: Iterable[str],
+    metrics: Iterable[str],
+    lang: str = "en_US",
+    workers: int | None = None,
+    chunksize: int = 64,
+    round_points: int | None = None,
+) -> Iterator[dict[str, list[float]]]:
+    """Score many texts across a pool of processes, yielding the scores of
+    every chunk of `chunksize` texts as soon as it is ready (in input order).
+
+    Use this instead of `score` to write the scores of a large corpus out while
+    it is being scored. The parameters are those of `score`.
+
+    Yields
+    ------
+    dict[str, list[float]]
+        One column per metric, holding the scores of the texts of a chunk.
+
+    """
+    metrics = list(metrics)
+    if chunksize < 1:
+        raise ValueError("chunksize must be at least 1")
+    # Fail early on unknown metrics rather than in every worker
+    for metric in metrics:
+        analysis.get_scorer(metric)
+
+    from concurrent.futures import ProcessPoolExecutor
+
+    workers = workers or os.cpu_count() or 1
+
+    with ProcessPoolExecutor(
+        max_workers=workers,
+        initializer=_init_worker,
+        initargs=(
+            lang,
+            selections.get_sentence_engine(),
+            utils.get_easy_word_matching(),
+        ),
+    ) as executor:
+        pending: deque[Future[dict[str, list[float]]]] = deque()
+        for chunk in _chunks(texts, chunksize):
+            pending.append(
+                executor.submit(_score_chunk, chunk, metrics, lang, round_points)
+            )
+            if len(pending) >= 2 * workers:
+                yield pending.popleft().result()
+        while pending:
+            yield pending.popleft().result()
+
+
+def _chunks(texts: Iterable[str], chunksize: int) -> Iterator[list[str]]:
+    """Split `texts` into lists of at most `chunksize` texts."""
+    iterator = iter(texts)
+    while True:
+        chunk = list(islice(iterator, chunksize))
+        if not chunk:
+            return
+        yield chunk
+
+
+def _extend(
+    columns: dict[str, list[float]], chunk_columns: dict[str, list[float]]
+) -> None:
+    """Append the scores of a chunk to `columns`."""
+    for metric, scores in chunk_columns.items():
+        columns[metric].extend(scores)
+
+
+def _score_chunk(
+    texts: list[str], metrics: list[str], lang: str, round_points: int | None
+) -> dict[str, list[float]]:
+    """Score a chunk of texts in a worker."""
+    return analysis.score_many(texts, metrics, lang, round_points=round_points)
+
+
+def _init_worker(lang: str, sentence_engine: str, easy_word_matching: str) -> None:
+    """Load the resources used to score texts in `lang` once per worker."""
+    # Spawned workers do not inherit the settings of the parent
+    selections.set_sentence_engine(sentence_engine)
+    utils.set_easy_word_matching(easy_word_matching)
+    try:
+        resources.preload(lang)
+    except LookupError:
+        # Missing NLTK data, the metrics needing it will raise when used
+        pass
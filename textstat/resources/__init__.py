@@ -0,0 +1,156 @@
+"""Provisioning of the data textstat needs to score texts.
+
+Word lists and the CMU syllable table ship with textstat. Sentence counting
+needs NLTK's Punkt model and, if the syllable table is not installed, syllable
+counting needs NLTK's copy of CMUdict. Scoring never downloads these: install
+them once with `ensure(download=True)` (e.g. when building an image), or point
+textstat at a directory of pinned data files with `add_data_path`, and call
+`preload` at startup so that missing data fails fast instead of mid-batch.
+"""
+
+from __future__ import annotations
+
+import os
+import warnings
+from typing import Iterable
+
+from ..backend import selections, utils
+
+NLTK_RESOURCES = {
+    "cmudict": "corpora/cmudict",
+    "punkt": "tokenizers/punkt",
+    "punkt_tab": "tokenizers/punkt_tab",
+}
+
+
+def required() -> list[str]:
+    """Get the names of the NLTK resources textstat needs in this installation.
+
+    Returns
+    -------
+    list[str]
+        The Punkt model used by the installed NLTK version (unless the "fast"
+        sentence engine is set), and "cmudict" if the precompiled CMU syllable
+        table is not installed.
+
+    """
+    names = []
+    if selections.get_sentence_engine() == "punkt":
+        from nltk.tokenize import punkt
+
+        names.append("punkt_tab" if hasattr(punkt, "PunktTokenizer") else "punkt")
+    if utils.get_cmu_syllables("en") is None:
+        names.append("cmudict")
+    return names
+
+
+def ensure(
+    names: Iterable[str] | None = None,
+    download: bool = False,
+    download_dir: str | os.PathLike[str] | None = None,
+) -> None:
+    """Check that NLTK resources are installed, optionally downloading them.
+
+    Parameters
+    ----------
+    names : Iterable[str] or None, optional
+        The resources: "cmudict", "punkt" or "punkt_tab". The default is None
+        (the resources returned by `required`).
+    download : bool, optional
+        Download missing resources. The default is False.
+    download_dir : str, PathLike or None, optional
+        Where to download the resources to, e.g. a directory shipped with your
+        application and later passed to `add_data_path`. The default is None
+        (NLTK's default location).
+
+    Returns
+    -------
+    None
+
+    Raises
+    ------
+    LookupError
+        If resources are missing and could not be downloaded.
+
+    """
+    import nltk
+
+    if names is None:
+        names = required()
+    missing = []
+    for name in names:
+        if name not in NLTK_RESOURCES:
+            raise ValueError(f"Unknown resource {name}")
+        try:
+            nltk.data.find(NLTK_RESOURCES[name])
+        except LookupError:
+            downloaded = download and nltk.download(
+                name,
+                download_dir=None if download_dir is None else str(download_dir),
+                quiet=True,
+            )
+            if not downloaded:
+                missing.append(name)
+    if missing:
+        raise LookupError(
+            f"NLTK resources {missing} are not installed. Install them with "
+            "textstat.resources.ensure(download=True) or add the directory "
+            "containing them with textstat.resources.add_data_path()."
+        )
+
+
+def add_data_path(path: str | os.PathLike[str]) -> None:
+    """Look for NLTK resources in `path` before NLTK's default locations.
+
+    Parameters
+    ----------
+    path : str or PathLike
+        A directory laid out like nltk_data, e.g. containing
+        tokenizers/punkt_tab and corpora/cmudict.
+
+    Returns
+    -------
+    None
+
+    """
+    import nltk
+
+    path = os.fspath(path)
+    if path in nltk.data.path:
+        nltk.data.path.remove(path)
+    nltk.data.path.insert(0, path)
+
+
+def preload(lang: str = "en_US") -> None:
+    """Load everything needed to score texts in `lang` into memory.
+
+    Call this at startup so that later scoring calls do no I/O.
+
+    Parameters
+    ----------
+    lang : str, optional
+        The language of the texts. The default is "en_US".
+
+    Returns
+    -------
+    None
+
+    Raises
+    ------
+    LookupError
+        If the NLTK resources for `lang` are not installed.
+
+    """
+    with warnings.catch_warnings():
+        # Languages without easy word lists fall back to English with a warning
+        warnings.simplefilter("ignore")
+        utils.get_easy_word_index(lang)
+        utils.get_spache_word_table(lang)
+    if utils.get_cmu_syllables(lang) is None:
+        utils.get_cmudict(lang)
+    try:
+        utils.get_pyphen(lang)
+    except KeyError:
+        # Pyphen has no dictionary for the language, e.g. Arabic
+        pass
+    selections.list_sentences("Loads the sentence model.")
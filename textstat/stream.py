@@ -0,0 +1,86 @@
+from __future__ import annotations
+
+from typing import IO, Iterable, Iterator
+
+from .backend import analysis
+
+READ_CHARS = 2**16
+
+
+def analyze(
+    source: IO[str] | Iterable[str], lang: str = "en_US"
+) -> analysis.StreamAnalysis:
+    """Analyse a document too large to hold in memory.
+
+    The document is read chunk by chunk and only running totals are kept;
+    words and sentences may span chunks.
+
+    Parameters
+    ----------
+    source : file object or Iterable[str]
+        A file opened in text mode (read in blocks of 64K characters), or any
+        iterable of consecutive chunks of text, e.g. a generator of lines.
+    lang : str, optional
+        The language of the text. The default is "en_US".
+
+    Returns
+    -------
+    StreamAnalysis
+        The analysis of the document, with the count and metric methods of
+        `textstat.analyze`.
+
+    """
+    return analysis.analyze_stream(_chunks(source), lang)
+
+
+def score(
+    source: IO[str] | Iterable[str],
+    metrics: Iterable[str],
+    lang: str = "en_US",
+    round_points: int | None = None,
+) -> dict[str, float]:
+    """Score a document too large to hold in memory, see `analyze`.
+
+    Parameters
+    ----------
+    source : file object or Iterable[str]
+        A file opened in text mode, or an iterable of chunks of text.
+    metrics : Iterable[str]
+        The names of the metrics (and counts) to compute, see
+        `textstat.score_many`.
+    lang : str, optional
+        The language of the text. The default is "en_US".
+    round_points : int or None, optional
+        The number of decimals to round the scores to. The default is None (no
+        rounding).
+
+    Returns
+    -------
+    dict[str, float]
+        The score of every metric.
+
+    """
+    metrics = list(metrics)
+    # Fail on unknown metrics before reading the document
+    for metric in metrics:
+        analysis.get_scorer(metric)
+
+    doc = analyze(source, lang)
+    scores = {metric: getattr(doc, metric)() for metric in metrics}
+    if round_points is not None:
+        scores = {
+            metric: round(score, round_points) for metric, score in scores.items()
+        }
+    return scores
+
+
+def _chunks(source: IO[str] | Iterable[str]) -> Iterator[str]:
+    read = getattr(source, "read", None)
+    if read is None:
+        yield from source
+        return
+    while True:
+        chunk = read(READ_CHARS)
+        if not chunk:
+            return
+        yield chunk
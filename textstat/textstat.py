@@ -1,8 +1,18 @@
 from __future__ import annotations
 
+import os
 import warnings
+from typing import Any, ContextManager, Iterable
 
-from .backend import transformations, validations, selections, counts, metrics, utils
+from .backend import (
+    transformations,
+    validations,
+    selections,
+    counts,
+    metrics,
+    utils,
+    analysis,
+)
 
 
 class textstatistics:
@@ -188,6 +198,279 @@ class textstatistics:
         """
         self.__lang = lang
 
+    def set_sentence_engine(self, engine: str) -> None:
+        """Set how sentences are split for counting.
+
+        The engine is shared by all callers in the process.
+
+        Parameters
+        ----------
+        engine : str
+            "punkt" (default) for NLTK's Punkt model, or "fast" for a rule-based
+            splitter that is several times faster and needs no NLTK data.
+
+        Returns
+        -------
+        None.
+
+        """
+        selections.set_sentence_engine(engine)
+
+    def set_easy_word_matching(self, matching: str) -> None:
+        """Set how words are matched against the Dale-Chall easy word lists by
+        `difficult_words`, `dale_chall_readability_score` and the other methods
+        counting difficult words.
+
+        The matching is shared by all callers in the process.
+
+        Parameters
+        ----------
+        matching : str
+            "exact" (default) to count only the listed words as easy, or
+            "inflections" to also count their regular inflections (-s, -es,
+            -ed, -ing, -er, -est and -ly) as easy, e.g. "dogs" and "played".
+            Inflections are only added for English.
+
+        Returns
+        -------
+        None.
+
+        """
+        utils.set_easy_word_matching(matching)
+
+    def configure_cache(
+        self,
+        max_bytes: int | None = utils.constants.CACHE_MAX_BYTES,
+        maxsize: int | None = utils.constants.CACHE_SIZE,
+        key: str = "text",
+        disable: Iterable[str] = (),
+    ) -> None:
+        """Configure how the results of the textstat methods are cached.
+
+        The caches are shared by all callers in the process. Calling this method
+        without arguments restores the defaults.
+
+        Parameters
+        ----------
+        max_bytes : int or None, optional
+            The approximate memory all cached results may take up together; the
+            least recently used results are evicted first. None for no limit.
+            The default is 64 MiB.
+        maxsize : int or None, optional
+            The number of results kept per function. None for no limit. The
+            default is 128.
+        key : str, optional
+            "text" (default) to key the results on the texts, or "digest" to key
+            them on a digest of the texts so that the caches do not keep the
+            texts alive.
+        disable : Iterable[str], optional
+            The families of functions not to cache: "counts", "metrics",
+            "selections" or "transformations". The per-word "validations" and
+            the "resources" are always cached. The default is to cache all
+            families.
+
+        Returns
+        -------
+        None.
+
+        """
+        utils.configure_cache(
+            max_bytes=max_bytes, maxsize=maxsize, key=key, disable=disable
+        )
+
+    def cache_info(self, family: str | None = None) -> dict[str, utils.CacheInfo]:
+        """Get the statistics of the caches of the backend functions.
+
+        Parameters
+        ----------
+        family : str or None, optional
+            The family of functions to describe: "counts", "metrics",
+            "resources", "selections", "transformations" or "validations". The
+            default is None (all families).
+
+        Returns
+        -------
+        dict[str, CacheInfo]
+            The hits, misses, maxsize, currsize and approximate nbytes of every
+            cached function, by "<family>.<name>" (e.g. "counts.count_words").
+
+        """
+        return utils.cache_info(family)
+
+    def cache_clear(self, family: str | None = None) -> None:
+        """Clear the cached results of the backend functions.
+
+        Parameters
+        ----------
+        family : str or None, optional
+            The family of functions to clear, see `cache_info`. The default is
+            None (all families but "resources", whose loaded word lists and
+            dictionaries are kept).
+
+        Returns
+        -------
+        None.
+
+        """
+        utils.cache_clear(family)
+
+    def configure_disk_cache(
+        self,
+        path: str | os.PathLike[str] | None,
+        max_entries: int | None = utils.constants.DISK_CACHE_MAX_ENTRIES,
+    ) -> None:
+        """Keep the results of the textstat metrics in a file, so that they
+        outlive the process.
+
+        The file may be shared by several processes. Results are keyed by the
+        text, language, metric, options and textstat version.
+
+        Parameters
+        ----------
+        path : str, PathLike or None
+            The SQLite database file, created if it does not exist. None to stop
+            using the persistent cache.
+        max_entries : int or None, optional
+            The number of results kept; the least recently read are evicted
+            first. None for no limit. The default is 1,000,000.
+
+        Returns
+        -------
+        None.
+
+        """
+        utils.configure_disk_cache(path, max_entries=max_entries)
+
+    def instrument(self) -> ContextManager[utils.Instrumentation]:
+        """Record the calls, time and cache hits of the backend functions.
+
+        Use as a context manager; the calls of all threads are recorded while it
+        is open, and nothing is timed outside of it.
+
+        Parameters
+        ----------
+        None
+
+        Returns
+        -------
+        ContextManager[Instrumentation]
+            A context yielding the statistics, which `as_dict()` returns per
+            function ("counts.count_syllables", "syllables.pyphen", ...) and
+            `to_prometheus()` formats as Prometheus counters.
+
+        """
+        return utils.instrument()
+
+    def analyze(self, text: str, lang: str | None = None) -> analysis.DocumentAnalysis:
+        """Tokenize `text` once into a document analysis that exposes every
+        count and metric as a cheap method.
+
+        Prefer this over calling several textstat methods on the same text: the
+        text is tokenized once instead of once per metric. The methods of the
+        analysis are not rounded.
+
+        Parameters
+        ----------
+        text : str
+            A text string.
+        lang : str or None, optional
+            The language of the text. The default is None (the language set
+            with `set_lang`).
+
+        Returns
+        -------
+        DocumentAnalysis
+            The analysis of `text`.
+
+        """
+        return analysis.analyze(text, lang if lang is not None else self.__lang)
+
+    def score_many(
+        self, texts: Iterable[str], metrics: Iterable[str], output: str = "list"
+    ) -> dict[str, Any]:
+        """Score many texts with the same metrics and return one column per
+        metric.
+
+        Every text is tokenized once, however many metrics are requested, and the
+        per-call overhead of the single-text methods is paid once per batch.
+
+        Parameters
+        ----------
+        texts : Iterable[str]
+            The text strings.
+        metrics : Iterable[str]
+            The names of the metrics to compute. Any metric or count method of
+            the analysis returned by `analyze` that takes no required arguments,
+            e.g. "flesch_reading_ease", "smog_index" or "count_words".
+        output : str, optional
+            The type of the columns: "list" (default), "array" for `array('d')`
+            or "numpy" for NumPy float arrays (requires NumPy).
+
+        Returns
+        -------
+        dict[str, Any]
+            One column per metric, holding the scores of the texts in input order.
+
+        """
+        return analysis.score_many(
+            texts,
+            metrics,
+            self.__lang,
+            output=output,
+            round_points=self.__round_points,
+        )
+
+    def profile(
+        self,
+        text: str,
+        metrics: Iterable[str],
+        window: int = 5,
+        step: int | None = None,
+        unit: str = "sentence",
+        output: str = "array",
+    ) -> dict[str, Any]:
+        """Score every window of `window` consecutive sentences (or paragraphs)
+        of a document, e.g. to find its hardest sections.
+
+        The text is tokenized once; the counts of every window come from prefix
+        sums over its sentences rather than from tokenizing the window again.
+
+        Parameters
+        ----------
+        text : str
+            A text string.
+        metrics : Iterable[str]
+            The names of the metrics to compute, see `score_many`.
+        window : int, optional
+            The number of sentences (or paragraphs) in a window. The default is
+            5.
+        step : int or None, optional
+            The number of units between the starts of consecutive windows. The
+            default is None (`window`, i.e. consecutive sections).
+        unit : str, optional
+            "sentence" (default) or "paragraph" (separated by blank lines).
+        output : str, optional
+            The type of the columns: "array" (default) for `array('d')`, "list"
+            or "numpy" for NumPy float arrays (requires NumPy).
+
+        Returns
+        -------
+        dict[str, Any]
+            One column per metric, holding the scores of the windows in order.
+            Window `i` starts at unit `i * step`.
+
+        """
+        return analysis.profile(
+            text,
+            self.__lang,
+            metrics,
+            window=window,
+            step=step,
+            unit=unit,
+            output=output,
+            round_points=self.__round_points,
+        )
+
     def char_count(self, text: str, ignore_spaces: bool = True) -> int:
         """Count the number of characters in a text.
 
@@ -1321,3 +1604,79 @@ class textstatistics:
 
 
 textstat = textstatistics()
+
+
+class Scorer(textstatistics):
+    """An immutable textstat scorer with its own language and rounding.
+
+    A scorer has every method of `textstat` but cannot be reconfigured after it
+    is created, so one scorer can be shared by many threads and scorers for
+    different languages can be used concurrently. Creating a scorer is cheap.
+
+    The sentence engine and cache configuration remain process-wide, see
+    `set_sentence_engine` and `configure_cache`.
+
+    Parameters
+    ----------
+    lang : str, optional
+        The language of the texts. The default is "en_US".
+    round_points : int or None, optional
+        The number of decimals to round outputs to. The default is None (no
+        rounding).
+    rm_apostrophe : bool, optional
+        Whether `remove_punctuation` removes apostrophes in contractions. The
+        default is True.
+
+    Examples
+    --------
+    >>> scorer = Scorer(lang="es_ES", round_points=2)
+    >>> scorer.fernandez_huerta(text)
+
+    """
+
+    def __init__(
+        self,
+        lang: str = "en_US",
+        round_points: int | None = None,
+        rm_apostrophe: bool = True,
+    ) -> None:
+        textstatistics.set_lang(self, lang)
+        textstatistics.set_rounding_points(self, round_points)
+        textstatistics.set_rm_apostrophe(self, rm_apostrophe)
+        self.__frozen = True
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        if getattr(self, "_Scorer__frozen", False):
+            raise AttributeError("Scorer is immutable, create a new Scorer instead")
+        super().__setattr__(name, value)
+
+    def __repr__(self) -> str:
+        return (
+            f"Scorer(lang={self.lang!r}, round_points={self.round_points!r}, "
+            f"rm_apostrophe={self.rm_apostrophe!r})"
+        )
+
+    @property
+    def lang(self) -> str:
+        """The language of the texts."""
+        return self._textstatistics__lang  # type: ignore[attr-defined]
+
+    @property
+    def round_points(self) -> int | None:
+        """The number of decimals outputs are rounded to, or None."""
+        return self._textstatistics__round_points  # type: ignore[attr-defined]
+
+    @property
+    def rm_apostrophe(self) -> bool:
+        """Whether `remove_punctuation` removes apostrophes in contractions."""
+        return self._textstatistics__rm_apostrophe  # type: ignore[attr-defined]
+
+    def _immutable(self, *args: Any, **kwargs: Any) -> None:
+        raise AttributeError(
+            "Scorer is immutable, create a new Scorer with the desired settings"
+        )
+
+    set_lang = _immutable  # type: ignore[assignment]
+    set_rounding_points = _immutable  # type: ignore[assignment]
+    set_rounding = _immutable  # type: ignore[assignment]
+    set_rm_apostrophe = _immutable  # type: ignore[assignment]